@@ -1,30 +1,8 @@
-from collections import deque
+import sys
+from pathlib import Path
 
-def bfs(graph, start, goal):
-    visited = set()  # Set to keep track of visited nodes
-    queue = deque([[start]])  # Queue for BFS, starting with the initial node
-
-    if start == goal:
-        return "Start and goal nodes are the same"
-
-    while queue:
-        path = queue.popleft()  # Get the first path from the queue
-        node = path[-1]  # Get the last node from the path
-
-        if node not in visited:
-            neighbors = graph[node]  # Get neighbors of the current node
-
-            for neighbor in neighbors:
-                new_path = list(path)  # Copy the current path
-                new_path.append(neighbor)  # Add the neighbor to the path
-                queue.append(new_path)  # Add the new path to the queue
-
-                if neighbor == goal:
-                    return new_path  # If neighbor is the goal, return the path
-
-            visited.add(node)  # Mark the node as explored
-
-    return "No path found between start and goal"
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # Carpeta "Punto 1"
+from busqueda import EstadisticasBusqueda, GrafoCSR, bfs, bfs_bidireccional, bfs_csr, bfs_padres
 
 # Graph represented as an adjacency list
 graph = {
@@ -62,6 +40,15 @@ graph = {
     'FF': []
 }
 
-start_node = 'S'
-end_node = 'W'
-print("BFS Path:", bfs(graph, start_node, end_node))
+if __name__ == "__main__":
+    start_node = 'S'
+    end_node = 'W'
+    print("BFS Path:", bfs(graph, start_node, end_node))
+    print("BFS Path (parent map):", bfs_padres(graph, start_node, end_node))
+    print("BFS Path (bidirectional):", bfs_bidireccional(graph, start_node, end_node))
+    print("BFS Path (CSR):", bfs_csr(GrafoCSR.desde_dict(graph, ponderado=False), start_node, end_node))
+
+    estadisticas = EstadisticasBusqueda()
+    bfs_padres(graph, start_node, end_node, estadisticas=estadisticas)
+    print("BFS stats:", estadisticas.a_json())
+
@@ -1,34 +1,8 @@
-def dfs_correcto(grafo, inicio, meta):
-    pila = [inicio]  # Usar LISTA como PILA
-    visitados = set()
-    padre = {inicio: None}  # Mejor usar None para el nodo inicial
-    
-    while pila:
-        nodo = pila.pop()  # Último en entrar, primero en salir (LIFO)
-        
-        if nodo == meta:
-            break
-            
-        if nodo not in visitados:
-            visitados.add(nodo)
-            # Explorar vecinos en orden natural (no inverso)
-            for vecino, _ in grafo[nodo]:
-                if vecino not in visitados:
-                    pila.append(vecino)
-                    if vecino not in padre:  # Evitar sobrescribir padres
-                        padre[vecino] = nodo
-    
-    # Reconstruir camino
-    camino = []
-    actual = meta
-    while actual is not None:
-        camino.append(actual)
-        actual = padre.get(actual)
-    
-    # Calcular costo total (suma de costos unitarios)
-    costo = len(camino) - 1 if camino and camino[0] == inicio else 0
-    
-    return camino[::-1], costo
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # Carpeta "Punto 1"
+from busqueda import EstadisticasBusqueda, GrafoCSR, dfs_correcto, dfs_csr, iddfs
 
 # Grafo con costos (costos unitarios)
 grafo_costo = {
@@ -66,5 +40,16 @@ grafo_costo = {
     'FF': []
 }
 
-camino, costo = dfs_correcto(grafo_costo, 'S', 'W')
-print("DFS - Camino:", camino, "Costo:", costo)
\ No newline at end of file
+if __name__ == "__main__":
+    camino, costo = dfs_correcto(grafo_costo, 'S', 'W')
+    print("DFS - Camino:", camino, "Costo:", costo)
+
+    camino, costo = dfs_csr(GrafoCSR.desde_dict(grafo_costo), 'S', 'W')
+    print("DFS (CSR) - Camino:", camino, "Costo:", costo)
+
+    camino, costo = iddfs(grafo_costo, 'S', 'W')
+    print("IDDFS - Camino:", camino, "Costo:", costo)
+
+    estadisticas = EstadisticasBusqueda()
+    dfs_correcto(grafo_costo, 'S', 'W', estadisticas=estadisticas)
+    print("DFS - Estadísticas:", estadisticas.a_json())
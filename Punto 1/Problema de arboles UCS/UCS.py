@@ -1,35 +1,9 @@
-import heapq
+import sys
+from pathlib import Path
 
-def ucs(grafo, inicio, meta):
-    cola = [(0, inicio)]  # (costo, nodo)
-    visitados = set()
-    costo_acumulado = {inicio: 0}
-    padre = {inicio: None}
-    
-    while cola:
-        costo, nodo = heapq.heappop(cola)
-        if nodo in visitados:
-            continue
-        visitados.add(nodo)
-        if nodo == meta:
-            break
-        for vecino, costo_arista in grafo[nodo]:
-            nuevo_costo = costo + costo_arista
-            if vecino not in costo_acumulado or nuevo_costo < costo_acumulado[vecino]:
-                costo_acumulado[vecino] = nuevo_costo
-                heapq.heappush(cola, (nuevo_costo, vecino))
-                padre[vecino] = nodo
-    
-    # Reconstruir el camino
-    def reconstruir_camino(padre, meta):
-        camino = []
-        actual = meta
-        while actual is not None:
-            camino.append(actual)
-            actual = padre.get(actual)
-        return camino[::-1]  # Invertir el camino
-    
-    return reconstruir_camino(padre, meta), costo_acumulado.get(meta, float('inf'))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # Carpeta "Punto 1"
+from busqueda import (EstadisticasBusqueda, GrafoCSR, HeuristicaLandmarks, astar, ucs, ucs_bidireccional,
+                      ucs_csr)
 
 # Grafo con costos realistas basados en criterios específicos
 grafo_costo = {
@@ -87,40 +61,57 @@ grafo_costo = {
     'FF': []
 }
 
-camino, costo = ucs(grafo_costo, 'S', 'W')
-print("UCS - Camino:", camino, "Costo:", costo)
-print("\n" + "="*50)
-print("EXPLICACIÓN DE COSTOS ASIGNADOS")
-print("="*50)
+if __name__ == "__main__":
+    camino, costo = ucs(grafo_costo, 'S', 'W')
+    print("UCS - Camino:", camino, "Costo:", costo)
 
-# Explicación detallada de los costos
-explicacion_costos = {
-    'S->B (3)': "Camino principal hacia el destino W - más corto y directo",
-    'S->E (5)': "Alternativa viable pero no óptima",
-    'S->D (6)': "Ruta más larga con menos conexiones útiles",
-    'S->A (8)': "Camino más costoso, lleva a rama sin conexión con W",
-    'B->H (2)': "Conexión óptima hacia Q y U",
-    'B->R (7)': "Desvío significativo, no conduce a W",
-    'H->Q (3)': "Camino directo hacia U (que lleva a W)",
-    'H->O (5)': "Desvío que no conduce al objetivo",
-    'Q->U (4)': "Conexión importante pero con cierto costo de transición",
-    'U->W (2)': "Último tramo al destino, costo mínimo",
-    'E->L (4)': "Mejor alternativa en rama E",
-    'E->K (6)': "Camino menos eficiente en rama E",
-    'U->V (6)': "Desvío costoso que no aporta al objetivo"
-}
+    camino, costo = ucs(grafo_costo, 'S', 'W', cola="buckets")
+    print("UCS (cola de buckets) - Camino:", camino, "Costo:", costo)
+
+    camino, costo = ucs_csr(GrafoCSR.desde_dict(grafo_costo), 'S', 'W')
+    print("UCS (CSR) - Camino:", camino, "Costo:", costo)
+
+    camino, costo = ucs_bidireccional(grafo_costo, 'S', 'W')
+    print("UCS bidireccional - Camino:", camino, "Costo:", costo)
+
+    camino, costo = astar(grafo_costo, 'S', 'W', HeuristicaLandmarks.elegir(grafo_costo))
+    print("A* (ALT) - Camino:", camino, "Costo:", costo)
+
+    estadisticas = EstadisticasBusqueda()
+    ucs(grafo_costo, 'S', 'W', estadisticas=estadisticas)
+    print("UCS - Estadísticas:", estadisticas.a_json())
+    print("\n" + "="*50)
+    print("EXPLICACIÓN DE COSTOS ASIGNADOS")
+    print("="*50)
+
+    # Explicación detallada de los costos
+    explicacion_costos = {
+        'S->B (3)': "Camino principal hacia el destino W - más corto y directo",
+        'S->E (5)': "Alternativa viable pero no óptima",
+        'S->D (6)': "Ruta más larga con menos conexiones útiles",
+        'S->A (8)': "Camino más costoso, lleva a rama sin conexión con W",
+        'B->H (2)': "Conexión óptima hacia Q y U",
+        'B->R (7)': "Desvío significativo, no conduce a W",
+        'H->Q (3)': "Camino directo hacia U (que lleva a W)",
+        'H->O (5)': "Desvío que no conduce al objetivo",
+        'Q->U (4)': "Conexión importante pero con cierto costo de transición",
+        'U->W (2)': "Último tramo al destino, costo mínimo",
+        'E->L (4)': "Mejor alternativa en rama E",
+        'E->K (6)': "Camino menos eficiente en rama E",
+        'U->V (6)': "Desvío costoso que no aporta al objetivo"
+    }
 
-for ruta, explicacion in explicacion_costos.items():
-    print(f"{ruta}: {explicacion}")
+    for ruta, explicacion in explicacion_costos.items():
+        print(f"{ruta}: {explicacion}")
 
-print("\n" + "="*50)
-print("ANÁLISIS DEL CAMINO ÓPTIMO ESPERADO")
-print("="*50)
-print("Camino esperado: S -> B -> H -> Q -> U -> W")
-print("Costo total esperado: 3 + 2 + 3 + 4 + 2 = 14")
-print("\nEste camino debería ser seleccionado porque:")
-print("1. S->B tiene el costo más bajo desde el inicio")
-print("2. B->H es la conexión más eficiente")
-print("3. H->Q lleva directamente hacia U")
-print("4. Q->U es la única opción hacia el destino")
-print("5. U->W tiene el costo mínimo final")
\ No newline at end of file
+    print("\n" + "="*50)
+    print("ANÁLISIS DEL CAMINO ÓPTIMO ESPERADO")
+    print("="*50)
+    print("Camino esperado: S -> B -> H -> Q -> U -> W")
+    print("Costo total esperado: 3 + 2 + 3 + 4 + 2 = 14")
+    print("\nEste camino debería ser seleccionado porque:")
+    print("1. S->B tiene el costo más bajo desde el inicio")
+    print("2. B->H es la conexión más eficiente")
+    print("3. H->Q lleva directamente hacia U")
+    print("4. Q->U es la única opción hacia el destino")
+    print("5. U->W tiene el costo mínimo final")
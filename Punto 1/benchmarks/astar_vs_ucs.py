@@ -0,0 +1,74 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+PUNTO_1 = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PUNTO_1))  # Paquete busqueda
+sys.path.insert(0, str(PUNTO_1 / "Problema de arboles UCS"))  # Grafo de ejemplo
+
+from UCS import grafo_costo
+from busqueda import HeuristicaLandmarks, astar, ucs
+from generadores import reticula, consultas_aleatorias
+from medicion import GrafoContador
+
+# =============================================================================
+# BENCHMARK: UCS VS A* (MANHATTAN Y LANDMARKS) EN EXPANSIONES Y TIEMPO
+# =============================================================================
+
+def manhattan(costo_minimo):
+    # Admisible en la cuadrícula: cada paso cuesta al menos costo_minimo
+    def h(nodo, meta):
+        return costo_minimo * (abs(nodo[0] - meta[0]) + abs(nodo[1] - meta[1]))
+    return h
+
+
+def correr(nombre, buscador, grafo, consultas, referencia=None):
+    contador = GrafoContador(grafo)
+    costos = []
+    t0 = time.perf_counter()
+    for inicio, meta in consultas:
+        costos.append(buscador(contador, inicio, meta)[1])
+    segundos = time.perf_counter() - t0
+    if referencia is not None:
+        assert costos == referencia, f"{nombre} no encontró los costos óptimos"
+    print(f"  {nombre:<18} {contador.expansiones / len(consultas):>12.0f} {segundos:>10.3f}")
+    return costos
+
+
+def comparar(grafo, consultas, heuristicas):
+    print(f"  {'algoritmo':<18} {'expansiones':>12} {'tiempo (s)':>10}")
+    referencia = correr("UCS", ucs, grafo, consultas)
+    for nombre, heuristica in heuristicas:
+        correr(nombre, lambda g, i, m, h=heuristica: astar(g, i, m, h), grafo, consultas, referencia)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Expansiones y tiempo de UCS vs A*")
+    parser.add_argument("--lados", type=int, nargs="+", default=[100, 300])
+    parser.add_argument("--consultas", type=int, default=20)
+    parser.add_argument("--landmarks", type=int, default=4)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    print("grafo_costo (S -> W)")
+    comparar(grafo_costo, [('S', 'W')], [
+        ("A* (ALT)", HeuristicaLandmarks.elegir(grafo_costo, args.landmarks, args.semilla)),
+    ])
+
+    for lado in args.lados:
+        grafo = reticula(lado, lado, costos=(1, 9), semilla=args.semilla)
+        t0 = time.perf_counter()
+        alt = HeuristicaLandmarks.elegir(grafo, args.landmarks, args.semilla)
+        precomputo = time.perf_counter() - t0
+
+        print(f"\nCuadrícula {lado}x{lado} ({len(grafo)} nodos), "
+              f"{args.consultas} consultas, landmarks en {precomputo:.2f} s")
+        comparar(grafo, consultas_aleatorias(grafo, args.consultas, args.semilla), [
+            ("A* (Manhattan)", manhattan(1)),
+            ("A* (ALT)", alt),
+        ])
+
+
+if __name__ == "__main__":
+    main()
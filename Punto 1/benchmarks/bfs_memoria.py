@@ -0,0 +1,52 @@
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+PUNTO_1 = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PUNTO_1))  # Paquete busqueda
+
+from busqueda import bfs, bfs_padres
+from generadores import arbol_sintetico, profundidad
+
+# =============================================================================
+# BENCHMARK DE MEMORIA: BFS CON COPIA DE CAMINOS VS BFS CON MAPA DE PADRES
+# =============================================================================
+
+def medir(funcion, grafo, inicio, meta):
+    """Ejecuta una búsqueda y devuelve (resultado, segundos, pico de memoria en bytes)."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    t0 = time.perf_counter()
+    resultado = funcion(grafo, inicio, meta)
+    segundos = time.perf_counter() - t0
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, segundos, pico
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pico de memoria de bfs vs bfs_padres")
+    parser.add_argument("--nodos", type=int, default=1_000_000)
+    parser.add_argument("--ramificacion", type=float, nargs="+", default=[2.0, 1.2])
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'ramif.':>7} {'prof.':>6} {'modo':>12} {'tiempo (s)':>11} {'pico (MB)':>10}")
+    for ramificacion in args.ramificacion:
+        grafo = arbol_sintetico(args.nodos, ramificacion, args.semilla)
+        meta = f"n{args.nodos - 1}"  # Última hoja: obliga a recorrer casi todo el árbol
+        altura = profundidad(grafo, "n0")
+
+        resultados = {}
+        for nombre, funcion in (("copia", bfs), ("padres", bfs_padres)):
+            camino, segundos, pico = medir(funcion, grafo, "n0", meta)
+            resultados[nombre] = camino
+            print(f"{ramificacion:>7} {altura:>6} {nombre:>12} {segundos:>11.2f} {pico / 2**20:>10.1f}")
+
+        assert resultados["copia"] == resultados["padres"], "Los caminos no coinciden"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import argparse
+import sys
+from array import array
+from pathlib import Path
+
+import numpy as np
+
+PUNTO_1 = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PUNTO_1))  # Paquete busqueda
+
+from busqueda import GrafoCSR, bfs_niveles
+from busqueda.lotes import barrido_bfs
+from medicion import cronometrar
+
+# =============================================================================
+# BENCHMARK: BFS POR NIVELES (NUMPY) VS BUCLE DE PYTHON SOBRE EL MISMO CSR
+# =============================================================================
+
+def grafo_csr_aleatorio(n_nodos, grado, semilla):
+    """GrafoCSR aleatorio armado directamente en arreglos (un diccionario de 10^7 aristas no cabe)."""
+    rng = np.random.default_rng(semilla)
+    offsets = array('q', np.arange(0, n_nodos * grado + 1, grado, dtype=np.int64).tobytes())
+    destinos = array('i', rng.integers(0, n_nodos, n_nodos * grado, dtype=np.int32).tobytes())
+    costos = array('q', bytes(8 * n_nodos * grado))
+    return GrafoCSR([f"n{i}" for i in range(n_nodos)], offsets, destinos, costos)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="bfs_niveles (NumPy) vs barrido_bfs (bucle de Python)")
+    parser.add_argument("--aristas", type=int, nargs="+", default=[10**6, 3 * 10**6, 10**7])
+    parser.add_argument("--grado", type=int, default=8)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'aristas':>10} {'nodos':>9} {'niveles':>8} {'bucle (s)':>10} {'numpy (s)':>10} "
+          f"{'bucle (Maristas/s)':>19} {'numpy (Maristas/s)':>19} {'aceleración':>12}")
+    for aristas in args.aristas:
+        grafo = grafo_csr_aleatorio(aristas // args.grado, args.grado, args.semilla)
+        padre_bucle, t_bucle = cronometrar(barrido_bfs, grafo, 0)
+        (distancia, padre), t_numpy = cronometrar(bfs_niveles, grafo, "n0")
+        assert np.array_equal(padre, np.frombuffer(padre_bucle, dtype=np.int64)), "Los padres difieren"
+        print(f"{grafo.num_aristas:>10} {len(grafo):>9} {int(distancia.max()):>8} {t_bucle:>10.2f} {t_numpy:>10.2f} "
+              f"{grafo.num_aristas / t_bucle / 1e6:>19.2f} {grafo.num_aristas / t_numpy / 1e6:>19.2f} "
+              f"{t_bucle / t_numpy:>11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
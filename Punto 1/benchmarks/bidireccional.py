@@ -0,0 +1,63 @@
+import argparse
+import sys
+from pathlib import Path
+
+PUNTO_1 = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PUNTO_1))  # Paquete busqueda
+
+from busqueda import bfs_bidireccional, bfs_padres, grafo_inverso, ucs, ucs_bidireccional
+from generadores import reticula, grafo_aleatorio, consultas_aleatorias
+from medicion import GrafoContador, cronometrar
+
+# =============================================================================
+# BENCHMARK: BÚSQUEDA UNIDIRECCIONAL VS BIDIRECCIONAL (BFS Y UCS)
+# =============================================================================
+
+def longitud(resultado):
+    # bfs devuelve un mensaje cuando no hay camino
+    return None if isinstance(resultado, str) else len(resultado)
+
+
+def comparar(nombre, grafo_costo, consultas):
+    grafo = {nodo: [vecino for vecino, _ in aristas] for nodo, aristas in grafo_costo.items()}
+    casos = (
+        ("BFS", bfs_padres, bfs_bidireccional, grafo, False, longitud),
+        ("UCS", ucs, ucs_bidireccional, grafo_costo, True, lambda r: r[1]),
+    )
+
+    print(f"\n{nombre}: {len(grafo)} nodos, {len(consultas)} consultas")
+    print(f"  {'':<4} {'expansiones':>12} {'bidir.':>9} {'tiempo (s)':>11} {'bidir.':>8} {'aceleración':>12}")
+    for algoritmo, unidireccional, bidireccional, entrada, ponderado, resumen in casos:
+        inverso = grafo_inverso(entrada, ponderado)  # Índice inverso construido una sola vez
+        uni_grafo = GrafoContador(entrada)
+        bi_adelante, bi_atras = GrafoContador(entrada), GrafoContador(inverso)
+
+        uni, t_uni = cronometrar(lambda: [unidireccional(uni_grafo, i, m) for i, m in consultas])
+        bi, t_bi = cronometrar(lambda: [bidireccional(bi_adelante, i, m, bi_atras) for i, m in consultas])
+        assert [resumen(r) for r in uni] == [resumen(r) for r in bi], f"{algoritmo}: resultados distintos"
+
+        expansiones_uni = uni_grafo.expansiones / len(consultas)
+        expansiones_bi = (bi_adelante.expansiones + bi_atras.expansiones) / len(consultas)
+        print(f"  {algoritmo:<4} {expansiones_uni:>12.0f} {expansiones_bi:>9.0f} "
+              f"{t_uni:>11.3f} {t_bi:>8.3f} {t_uni / t_bi:>11.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BFS/UCS unidireccional vs bidireccional")
+    parser.add_argument("--nodos", type=int, default=200_000)
+    parser.add_argument("--lado", type=int, default=400)
+    parser.add_argument("--consultas", type=int, default=20)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    # Ramificación 4 como la raíz de grafo_costo, con mucha más profundidad
+    aleatorio = grafo_aleatorio(args.nodos, grado=4, semilla=args.semilla)
+    comparar("Grafo aleatorio (grado 4)", aleatorio, consultas_aleatorias(aleatorio, args.consultas, args.semilla))
+
+    cuadricula = reticula(args.lado, args.lado, semilla=args.semilla)
+    comparar(f"Cuadrícula {args.lado}x{args.lado}", cuadricula,
+             consultas_aleatorias(cuadricula, args.consultas, args.semilla))
+
+
+if __name__ == "__main__":
+    main()
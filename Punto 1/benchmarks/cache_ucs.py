@@ -0,0 +1,45 @@
+import argparse
+import random
+import sys
+from pathlib import Path
+
+PUNTO_1 = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PUNTO_1))  # Paquete busqueda
+
+from busqueda import ServicioUCS, ucs
+from generadores import grafo_aleatorio
+from medicion import cronometrar
+
+# =============================================================================
+# BENCHMARK: UCS DESDE CERO VS SERVICIO CON CACHÉ DE ÁRBOLES POR INICIO
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Consultas repetidas: ucs() vs ServicioUCS")
+    parser.add_argument("--nodos", type=int, default=50_000)
+    parser.add_argument("--consultas", type=int, default=300)
+    parser.add_argument("--inicios", type=int, default=5)
+    parser.add_argument("--max-mb", type=float, default=256)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    grafo = grafo_aleatorio(args.nodos, grado=4, semilla=args.semilla)
+    rng = random.Random(args.semilla)
+    nodos = list(grafo)
+    inicios = rng.sample(nodos, args.inicios)
+    consultas = [(rng.choice(inicios), rng.choice(nodos)) for _ in range(args.consultas)]
+
+    servicio = ServicioUCS(grafo, max_bytes=args.max_mb * 2**20)
+    esperado, t_ucs = cronometrar(lambda: [ucs(grafo, i, m) for i, m in consultas])
+    obtenido, t_servicio = cronometrar(lambda: [servicio.consultar(i, m) for i, m in consultas])
+    assert esperado == obtenido, "El servicio no reproduce los resultados de ucs()"
+
+    print(f"{args.consultas} consultas desde {args.inicios} inicios sobre {args.nodos} nodos")
+    print(f"  ucs() desde cero: {t_ucs:8.2f} s")
+    print(f"  ServicioUCS:      {t_servicio:8.2f} s  ({t_ucs / t_servicio:.1f}x)")
+    print(f"  aciertos={servicio.aciertos} reanudaciones={servicio.reanudaciones} fallos={servicio.fallos}")
+    print(f"  memoria de la caché: {servicio.memoria_bytes() / 2**20:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
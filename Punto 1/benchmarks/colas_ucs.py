@@ -0,0 +1,62 @@
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+PUNTO_1 = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PUNTO_1))  # Paquete busqueda
+
+from busqueda import EstadisticasBusqueda, ucs
+from generadores import grafo_aleatorio
+
+# =============================================================================
+# BENCHMARK: heapq (borrado perezoso) vs HeapIndexado vs ColaBuckets EN UCS
+# =============================================================================
+
+def medir(grafo_costo, consultas, cola):
+    # Tiempo sin tracemalloc; el pico de memoria y la cola se miden en una segunda pasada
+    t0 = time.perf_counter()
+    resultados = [ucs(grafo_costo, inicio, meta, cola=cola) for inicio, meta in consultas]
+    segundos = time.perf_counter() - t0
+
+    expandidos = pico_cola = pico_memoria = 0
+    for inicio, meta in consultas:
+        estadisticas = EstadisticasBusqueda()
+        tracemalloc.start()
+        ucs(grafo_costo, inicio, meta, estadisticas=estadisticas, cola=cola)
+        pico_memoria = max(pico_memoria, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        expandidos += estadisticas.expandidos
+        pico_cola = max(pico_cola, estadisticas.pico_frontera)
+    return resultados, segundos, expandidos, pico_cola, pico_memoria
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backends de cola de prioridad para ucs()")
+    parser.add_argument("--consultas", type=int, default=5)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    escenarios = (("disperso", 200_000, 4), ("denso", 3_000, 300))
+    for nombre, nodos, grado in escenarios:
+        grafo_costo = grafo_aleatorio(nodos, grado=grado, semilla=args.semilla)
+        rng = random.Random(args.semilla)
+        consultas = [tuple(rng.sample(list(grafo_costo), 2)) for _ in range(args.consultas)]
+
+        print(f"Grafo {nombre}: {nodos} nodos, {nodos * grado} aristas, {args.consultas} consultas")
+        print(f"  {'cola':<10} {'tiempo (s)':>10} {'expansiones/s':>14} {'pico cola':>10} {'pico (MB)':>10}")
+        referencia = None
+        for cola in ("heapq", "indexada", "buckets"):
+            resultados, segundos, expandidos, pico_cola, pico_memoria = medir(grafo_costo, consultas, cola)
+            costos = [costo for _, costo in resultados]
+            if referencia is None:
+                referencia = costos
+            assert costos == referencia, f"{cola} dio costos distintos a heapq"
+            print(f"  {cola:<10} {segundos:>10.2f} {expandidos / segundos:>14.0f} "
+                  f"{pico_cola:>10} {pico_memoria / 2**20:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
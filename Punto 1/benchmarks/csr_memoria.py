@@ -0,0 +1,60 @@
+import argparse
+import sys
+import tracemalloc
+from pathlib import Path
+
+PUNTO_1 = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PUNTO_1))  # Paquete busqueda
+
+from busqueda import GrafoCSR, bfs_csr, bfs_padres, dfs_correcto, dfs_csr, ucs, ucs_csr
+from generadores import arbol_sintetico
+from medicion import cronometrar
+
+# =============================================================================
+# BENCHMARK: DICCIONARIOS DE ETIQUETAS VS GRAFO CSR
+# =============================================================================
+
+def memoria_de(constructor):
+    """Devuelve (objeto, bytes que siguen vivos después de construirlo)."""
+    tracemalloc.start()
+    objeto = constructor()
+    actual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return objeto, actual
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memoria y tiempo de los buscadores sobre dict vs GrafoCSR")
+    parser.add_argument("--nodos", type=int, default=1_000_000)
+    parser.add_argument("--ramificacion", type=float, default=2.0)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    grafo_costo, bytes_dict = memoria_de(
+        lambda: arbol_sintetico(args.nodos, args.ramificacion, args.semilla, costos=(1, 9)))
+    grafo = {nodo: [vecino for vecino, _ in aristas] for nodo, aristas in grafo_costo.items()}
+    csr, bytes_csr = memoria_de(lambda: GrafoCSR.desde_dict(grafo_costo))
+    aristas = csr.num_aristas
+
+    print(f"Nodos: {len(csr)}  Aristas: {aristas}")
+    print(f"dict (grafo_costo): {bytes_dict / 2**20:8.1f} MB  ({bytes_dict / aristas:6.1f} B/arista)")
+    print(f"GrafoCSR total:     {bytes_csr / 2**20:8.1f} MB  ({bytes_csr / aristas:6.1f} B/arista)")
+    print(f"GrafoCSR aristas:   {csr.memoria_bytes() / 2**20:8.1f} MB  "
+          f"({csr.memoria_bytes() / aristas:6.1f} B/arista)")
+    print()
+
+    meta = f"n{args.nodos - 1}"
+    casos = (
+        ("BFS", bfs_padres, grafo, bfs_csr),
+        ("DFS", dfs_correcto, grafo_costo, dfs_csr),
+        ("UCS", ucs, grafo_costo, ucs_csr),
+    )
+    print(f"{'algoritmo':>9} {'dict (s)':>9} {'CSR (s)':>8}  iguales")
+    for nombre, funcion_dict, entrada, funcion_csr in casos:
+        esperado, t_dict = cronometrar(funcion_dict, entrada, "n0", meta)
+        obtenido, t_csr = cronometrar(funcion_csr, csr, "n0", meta)
+        print(f"{nombre:>9} {t_dict:>9.2f} {t_csr:>8.2f}  {esperado == obtenido}")
+
+
+if __name__ == "__main__":
+    main()
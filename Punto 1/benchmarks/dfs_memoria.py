@@ -0,0 +1,62 @@
+import argparse
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PUNTO_1 = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PUNTO_1))  # Paquete busqueda
+
+from busqueda import dfs_correcto, iddfs
+from generadores import arbol_completo, sucesores_arbol_completo
+
+# =============================================================================
+# BENCHMARK: PICO DE RSS DE dfs_correcto VS IDDFS (DICCIONARIO E IMPLÍCITO)
+# =============================================================================
+
+MODOS = ("dfs_correcto", "iddfs_dict", "iddfs_implicito")
+
+
+def correr_modo(modo, n_nodos, ramificacion, meta):
+    """Ejecuta un modo en este proceso e imprime 'segundos pico_kb largo_camino'."""
+    t0 = time.perf_counter()
+    if modo == "dfs_correcto":
+        camino, _ = dfs_correcto(arbol_completo(n_nodos, ramificacion), 0, meta)
+    elif modo == "iddfs_dict":
+        camino, _ = iddfs(arbol_completo(n_nodos, ramificacion), 0, meta)
+    else:
+        camino, _ = iddfs(sucesores_arbol_completo(n_nodos, ramificacion), 0, meta)
+    segundos = time.perf_counter() - t0
+    pico_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # KB en Linux
+    print(segundos, pico_kb, len(camino))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pico de RSS de dfs_correcto vs iddfs")
+    parser.add_argument("--nodos", type=int, default=1_000_000)
+    parser.add_argument("--ramificacion", type=int, default=4)
+    parser.add_argument("--meta", type=int, default=None, help="por defecto, una hoja a mitad del árbol")
+    parser.add_argument("--modo", choices=MODOS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    meta = args.meta if args.meta is not None else args.nodos - args.nodos // 3
+
+    if args.modo:
+        correr_modo(args.modo, args.nodos, args.ramificacion, meta)
+        return
+
+    # Cada modo corre en un proceso nuevo para que el pico de RSS sea solo suyo
+    print(f"Árbol completo de {args.nodos} nodos, ramificación {args.ramificacion}, meta {meta}")
+    print(f"{'modo':>16} {'tiempo (s)':>11} {'pico RSS (MB)':>14} {'largo':>6}")
+    for modo in MODOS:
+        salida = subprocess.run(
+            [sys.executable, __file__, "--nodos", str(args.nodos), "--ramificacion", str(args.ramificacion),
+             "--meta", str(meta), "--modo", modo],
+            capture_output=True, text=True, check=True,
+        ).stdout.split()
+        segundos, pico_kb, largo = float(salida[0]), int(salida[1]), int(salida[2])
+        print(f"{modo:>16} {segundos:>11.2f} {pico_kb / 1024:>14.1f} {largo:>6}")
+
+
+if __name__ == "__main__":
+    main()
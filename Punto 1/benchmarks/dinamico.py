@@ -0,0 +1,53 @@
+import argparse
+import random
+import sys
+from pathlib import Path
+
+PUNTO_1 = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PUNTO_1))  # Paquete busqueda
+
+from busqueda import UCSDinamico, ucs
+from generadores import grafo_aleatorio
+from medicion import cronometrar
+
+# =============================================================================
+# BENCHMARK: REPARACIÓN CON UCSDinamico VS ucs() DESDE CERO TRAS CAMBIOS DE COSTO
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Reparar con UCSDinamico vs volver a correr ucs()")
+    parser.add_argument("--nodos", type=int, default=100_000)
+    parser.add_argument("--cambios", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--rondas", type=int, default=5, help="actualizaciones medidas por cantidad de cambios")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.semilla)
+    grafo_costo = grafo_aleatorio(args.nodos, grado=4, semilla=args.semilla)
+    nodos = list(grafo_costo)
+    inicio, meta = rng.sample(nodos, 2)
+    dinamico, segundos = cronometrar(UCSDinamico, grafo_costo, inicio, meta)
+    print(f"Grafo aleatorio de {args.nodos} nodos; búsqueda inicial {segundos:.2f} s")
+
+    print(f"{'cambios':>8} {'reparar (s)':>12} {'expandidos':>11} {'ucs() (s)':>10} {'aceleración':>12}")
+    for cantidad in args.cambios:
+        reparar = desde_cero = 0.0
+        expandidos = dinamico.expandidos
+        for _ in range(args.rondas):
+            # Cambios sobre aristas existentes elegidas al azar, con costos nuevos de 1 a 9
+            cambios = []
+            for u in rng.choices(nodos, k=cantidad):
+                v, _ = rng.choice(grafo_costo[u])
+                cambios.append((u, v, rng.randint(1, 9)))
+            _, segundos = cronometrar(dinamico.actualizar_aristas, cambios)
+            reparar += segundos
+            esperado, segundos = cronometrar(ucs, grafo_costo, inicio, meta)
+            desde_cero += segundos
+            assert dinamico.camino()[1] == esperado[1], "La reparación difiere de ucs()"
+        expandidos = (dinamico.expandidos - expandidos) // args.rondas
+        print(f"{cantidad:>8} {reparar / args.rondas:>12.4f} {expandidos:>11} "
+              f"{desde_cero / args.rondas:>10.4f} {desde_cero / reparar:>11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+import argparse
+import gc
+import heapq
+import random
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+PUNTO_1 = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PUNTO_1))  # Paquete busqueda
+
+from busqueda import EstadisticasBusqueda, bfs_padres, como_sucesores, como_vecinos, dfs_correcto, ucs
+from busqueda.anchura import reconstruct_path
+from busqueda.costo_uniforme import reconstruir_camino
+from generadores import grafo_aleatorio
+
+# =============================================================================
+# BENCHMARK: COSTO DE LA INSTRUMENTACIÓN (antes de agregarla, estadisticas=None y activada)
+# =============================================================================
+
+# Copias de los buscadores tal como estaban antes de aceptar `estadisticas`:
+# la referencia para medir cuánto cuesta la instrumentación cuando está apagada.
+
+def bfs_padres_base(graph, start, goal):
+    neighbors_of = como_vecinos(graph, ponderado=False)
+    visited = set()
+    parent = {start: None}
+    queue = deque([start])
+
+    if start == goal:
+        return "Start and goal nodes are the same"
+
+    while queue:
+        node = queue.popleft()
+
+        if node not in visited:
+            for neighbor in neighbors_of(node):
+                if neighbor == goal:
+                    parent[neighbor] = node
+                    return reconstruct_path(parent, goal)
+
+                if neighbor not in parent:
+                    parent[neighbor] = node
+                    queue.append(neighbor)
+
+            visited.add(node)
+
+    return "No path found between start and goal"
+
+
+def dfs_correcto_base(grafo, inicio, meta):
+    sucesores = como_sucesores(grafo, ponderado=True)
+    pila = [inicio]
+    visitados = set()
+    padre = {inicio: None}
+
+    while pila:
+        nodo = pila.pop()
+
+        if nodo == meta:
+            break
+
+        if nodo not in visitados:
+            visitados.add(nodo)
+            for vecino, _ in sucesores(nodo):
+                if vecino not in visitados:
+                    pila.append(vecino)
+                    if vecino not in padre:
+                        padre[vecino] = nodo
+
+    camino = []
+    actual = meta
+    while actual is not None:
+        camino.append(actual)
+        actual = padre.get(actual)
+
+    costo = len(camino) - 1 if camino and camino[0] == inicio else 0
+    return camino[::-1], costo
+
+
+def ucs_base(grafo, inicio, meta):
+    sucesores = como_sucesores(grafo, ponderado=True)
+    cola = [(0, inicio)]
+    visitados = set()
+    costo_acumulado = {inicio: 0}
+    padre = {inicio: None}
+
+    while cola:
+        costo, nodo = heapq.heappop(cola)
+        if nodo in visitados:
+            continue
+        visitados.add(nodo)
+        if nodo == meta:
+            break
+        for vecino, costo_arista in sucesores(nodo):
+            nuevo_costo = costo + costo_arista
+            if vecino not in costo_acumulado or nuevo_costo < costo_acumulado[vecino]:
+                costo_acumulado[vecino] = nuevo_costo
+                heapq.heappush(cola, (nuevo_costo, vecino))
+                padre[vecino] = nodo
+
+    return reconstruir_camino(padre, meta), costo_acumulado.get(meta, float('inf'))
+
+def mejores_tiempos(funciones, repeticiones):
+    # Intercaladas y rotando el orden en cada repetición, para que el ruido de la máquina y la
+    # posición en la secuencia afecten a todas por igual, y sin el recolector de basura: sus
+    # pausas dependen de lo que dejó la llamada anterior, no del buscador. Se mide tiempo de
+    # CPU del proceso: en una máquina compartida el tiempo de reloj varía ±20 % entre corridas
+    mejores = [float('inf')] * len(funciones)
+    for repeticion in range(repeticiones):
+        for desplazamiento in range(len(funciones)):
+            i = (repeticion + desplazamiento) % len(funciones)
+            gc.collect()
+            gc.disable()
+            try:
+                t0 = time.process_time()
+                funciones[i]()
+                mejores[i] = min(mejores[i], time.process_time() - t0)
+            finally:
+                gc.enable()
+    return mejores
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sobrecosto de EstadisticasBusqueda en los buscadores")
+    parser.add_argument("--nodos", type=int, default=200_000)
+    parser.add_argument("--consultas", type=int, default=5, help="consultas por medición")
+    parser.add_argument("--repeticiones", type=int, default=6)
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    grafo_costo = grafo_aleatorio(args.nodos, grado=4, semilla=args.semilla)
+    graph = {nodo: [vecino for vecino, _ in aristas] for nodo, aristas in grafo_costo.items()}
+    rng = random.Random(args.semilla)
+    nodos = list(grafo_costo)
+    consultas = [rng.sample(nodos, 2) for _ in range(args.consultas)]
+
+    print(f"Grafo aleatorio de {args.nodos} nodos, {args.consultas} consultas por medición, "
+          f"mejor de {args.repeticiones} repeticiones (tiempo de CPU)")
+    print("  antes: buscador sin el parámetro estadisticas; sin: estadisticas=None; con: activadas")
+    print(f"  {'buscador':<14} {'antes (s)':>10} {'sin (s)':>9} {'sin/antes':>10} {'con (s)':>9} {'con/sin':>8}  "
+          f"estadísticas")
+    for nombre, buscador, base, grafo in (("bfs_padres", bfs_padres, bfs_padres_base, graph),
+                                          ("dfs_correcto", dfs_correcto, dfs_correcto_base, grafo_costo),
+                                          ("ucs", ucs, ucs_base, grafo_costo)):
+        for inicio, meta in consultas:
+            assert buscador(grafo, inicio, meta) == base(grafo, inicio, meta), f"{nombre}: resultado distinto"
+        estadisticas = EstadisticasBusqueda()  # Queda con las de la última consulta
+        antes, sin, con = mejores_tiempos([
+            lambda: [base(grafo, inicio, meta) for inicio, meta in consultas],
+            lambda: [buscador(grafo, inicio, meta) for inicio, meta in consultas],
+            lambda: [buscador(grafo, inicio, meta, estadisticas=estadisticas) for inicio, meta in consultas],
+        ], args.repeticiones)
+        print(f"  {nombre:<14} {antes:>10.3f} {sin:>9.3f} {100 * (sin / antes - 1):>+9.1f}% {con:>9.3f} "
+              f"{100 * (con / sin - 1):>+7.1f}%  "
+              f"expandidos={estadisticas.expandidos} pico_frontera={estadisticas.pico_frontera}")
+
+
+if __name__ == "__main__":
+    main()
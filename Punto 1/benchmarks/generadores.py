@@ -0,0 +1,111 @@
+import random
+
+# =============================================================================
+# GENERADORES DE ÁRBOLES SINTÉTICOS PARA LOS BENCHMARKS
+# =============================================================================
+
+def arbol_sintetico(n_nodos, ramificacion=2.0, semilla=0, costos=None):
+    """Árbol aleatorio de n_nodos en el formato de diccionario del taller.
+
+    Cada nodo tiene int(ramificacion) hijos más uno extra con probabilidad igual
+    a la parte fraccionaria, así que ramificacion=1.2 produce árboles profundos.
+    Sin costos devuelve listas de etiquetas (formato de `graph` en BFS.py); con
+    costos=(minimo, maximo) devuelve tuplas (vecino, costo) como `grafo_costo`.
+    """
+    rng = random.Random(semilla)
+    etiquetas = [f"n{i}" for i in range(n_nodos)]
+    grafo = {etiqueta: [] for etiqueta in etiquetas}
+    base = int(ramificacion)
+    extra = ramificacion - base
+
+    siguiente = 1  # Próximo nodo libre para colgar como hijo
+    for i in range(n_nodos):
+        if siguiente >= n_nodos:
+            break
+        k = base + (1 if rng.random() < extra else 0)
+        k = max(k, 1) if i == siguiente - 1 else k  # Evitar que el árbol se corte
+        hijos = etiquetas[siguiente:siguiente + k]
+        siguiente += len(hijos)
+        if costos is None:
+            grafo[etiquetas[i]] = hijos
+        else:
+            grafo[etiquetas[i]] = [(h, rng.randint(*costos)) for h in hijos]
+
+    return grafo
+
+
+def profundidad(grafo, inicio):
+    """Profundidad máxima del árbol (en aristas) medida desde inicio."""
+    nivel = [inicio]
+    altura = -1
+    while nivel:
+        altura += 1
+        siguiente = []
+        for nodo in nivel:
+            for vecino in grafo[nodo]:
+                siguiente.append(vecino[0] if isinstance(vecino, tuple) else vecino)
+        nivel = siguiente
+    return altura
+
+
+# =============================================================================
+# GENERADORES DE GRAFOS PONDERADOS CON CICLOS
+# =============================================================================
+
+def reticula(filas, columnas, costos=(1, 9), semilla=0):
+    """Cuadrícula de filas x columnas con aristas en ambos sentidos a los 4 vecinos.
+
+    Las etiquetas son tuplas (fila, columna) y cada sentido de cada arista tiene
+    un costo aleatorio independiente en [costos[0], costos[1]].
+    """
+    rng = random.Random(semilla)
+    grafo = {}
+    for f in range(filas):
+        for c in range(columnas):
+            aristas = []
+            for df, dc in ((-1, 0), (0, 1), (1, 0), (0, -1)):
+                vecino = (f + df, c + dc)
+                if 0 <= vecino[0] < filas and 0 <= vecino[1] < columnas:
+                    aristas.append((vecino, rng.randint(*costos)))
+            grafo[(f, c)] = aristas
+    return grafo
+
+
+def grafo_aleatorio(n_nodos, grado=4, costos=(1, 9), semilla=0):
+    """Grafo dirigido aleatorio con `grado` aristas salientes por nodo."""
+    rng = random.Random(semilla)
+    etiquetas = [f"n{i}" for i in range(n_nodos)]
+    return {
+        etiqueta: [(etiquetas[rng.randrange(n_nodos)], rng.randint(*costos)) for _ in range(grado)]
+        for etiqueta in etiquetas
+    }
+
+
+def consultas_aleatorias(grafo, cantidad, semilla=0):
+    """Pares (inicio, meta) elegidos al azar entre los nodos del grafo."""
+    rng = random.Random(semilla)
+    nodos = list(grafo)
+    return [(rng.choice(nodos), rng.choice(nodos)) for _ in range(cantidad)]
+
+
+# =============================================================================
+# ÁRBOLES IMPLÍCITOS (SIN DICCIONARIO)
+# =============================================================================
+
+def sucesores_arbol_completo(n_nodos, ramificacion=4):
+    """Función de sucesores de un árbol completo con nodos 0..n_nodos-1.
+
+    Los hijos de i son ramificacion*i + 1 ... ramificacion*i + ramificacion, con
+    costo 1. Nunca se materializa el árbol: los hijos se generan al pedirlos.
+    """
+    def sucesores(nodo):
+        primero = ramificacion * nodo + 1
+        for hijo in range(primero, min(primero + ramificacion, n_nodos)):
+            yield hijo, 1
+    return sucesores
+
+
+def arbol_completo(n_nodos, ramificacion=4):
+    """El mismo árbol de sucesores_arbol_completo, materializado como grafo_costo."""
+    sucesores = sucesores_arbol_completo(n_nodos, ramificacion)
+    return {nodo: list(sucesores(nodo)) for nodo in range(n_nodos)}
@@ -0,0 +1,64 @@
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+PUNTO_1 = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PUNTO_1))  # Paquete busqueda
+
+from busqueda import SucesoresMemo, bfs_padres, iddfs, ucs
+from generadores import sucesores_arbol_completo
+
+# =============================================================================
+# BENCHMARK: BÚSQUEDA EN UN ÁRBOL IMPLÍCITO DE MILES DE MILLONES DE NODOS
+# =============================================================================
+
+class ContadorLlamadas:
+    """Función de sucesores que cuenta cuántas veces se generaron hijos."""
+
+    def __init__(self, sucesores):
+        self.funcion = sucesores
+        self.llamadas = 0
+
+    def sucesores(self, nodo):
+        self.llamadas += 1
+        return self.funcion(nodo)
+
+
+def medir(nombre, buscador, grafo, contador, meta):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    resultado = buscador(grafo, 0, meta)
+    segundos = time.perf_counter() - t0
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    camino = resultado[0] if isinstance(resultado, tuple) else resultado
+    print(f"  {nombre:<22} {len(camino) - 1:>6} {contador.llamadas:>12} {segundos:>10.2f} {pico / 2**20:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Buscadores sobre un árbol implícito (sin diccionario)")
+    parser.add_argument("--nodos", type=int, default=10**9)
+    parser.add_argument("--ramificacion", type=int, default=4)
+    parser.add_argument("--profundidad", type=int, default=8, help="profundidad de la meta")
+    parser.add_argument("--memo", type=int, default=50_000, help="nodos en la caché de SucesoresMemo")
+    args = parser.parse_args()
+
+    # Último nodo del nivel `profundidad`: obliga a recorrer el nivel completo
+    meta = sum(args.ramificacion ** k for k in range(args.profundidad + 1)) - 1
+    base = sucesores_arbol_completo(args.nodos, args.ramificacion)
+
+    print(f"Árbol implícito de {args.nodos} nodos, ramificación {args.ramificacion}, meta {meta}")
+    print(f"  {'buscador':<22} {'largo':>6} {'sucesores()':>12} {'tiempo (s)':>10} {'pico (MB)':>10}")
+    for nombre, buscador in (("bfs_padres", bfs_padres), ("ucs", ucs), ("iddfs", iddfs)):
+        contador = ContadorLlamadas(base)
+        medir(nombre, buscador, contador, contador, meta)
+
+    # iddfs repite los niveles superiores en cada iteración: la caché evita regenerarlos
+    contador = ContadorLlamadas(base)
+    medir("iddfs + SucesoresMemo", iddfs, SucesoresMemo(contador, max_nodos=args.memo), contador, meta)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import argparse
+import os
+import random
+import sys
+from pathlib import Path
+
+PUNTO_1 = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PUNTO_1))  # Paquete busqueda
+
+from busqueda import GrafoCSR, resolver_lote, ucs
+from generadores import grafo_aleatorio
+from medicion import cronometrar
+
+# =============================================================================
+# BENCHMARK: ESCALADO DE resolver_lote CON 1..N PROCESOS
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Escalado de resolver_lote() con varios procesos")
+    parser.add_argument("--nodos", type=int, default=100_000)
+    parser.add_argument("--inicios", type=int, default=32)
+    parser.add_argument("--metas", type=int, default=50, help="metas por inicio")
+    parser.add_argument("--procesos", type=int, nargs="+",
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument("--verificar", type=int, default=20, help="consultas comparadas con ucs() serial")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    grafo_costo = grafo_aleatorio(args.nodos, grado=4, semilla=args.semilla)
+    csr = GrafoCSR.desde_dict(grafo_costo)
+    rng = random.Random(args.semilla)
+    nodos = list(grafo_costo)
+    consultas = [(inicio, rng.choice(nodos))
+                 for inicio in rng.sample(nodos, args.inicios) for _ in range(args.metas)]
+
+    print(f"{len(consultas)} consultas ({args.inicios} inicios) sobre {args.nodos} nodos, "
+          f"{os.cpu_count()} CPU disponibles")
+    print(f"{'procesos':>9} {'tiempo (s)':>11} {'consultas/s':>12} {'aceleración':>12}")
+    referencia = base = None
+    for procesos in args.procesos:
+        resultados, segundos = cronometrar(resolver_lote, csr, consultas, "ucs", procesos)
+        if referencia is None:
+            referencia, base = resultados, segundos
+        assert resultados == referencia, f"{procesos} procesos dieron resultados distintos"
+        print(f"{procesos:>9} {segundos:>11.2f} {len(consultas) / segundos:>12.0f} {base / segundos:>11.1f}x")
+
+    for posicion in rng.sample(range(len(consultas)), min(args.verificar, len(consultas))):
+        assert referencia[posicion] == ucs(grafo_costo, *consultas[posicion]), "Difiere de ucs() serial"
+    print(f"{args.verificar} consultas verificadas contra ucs() serial")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+import time
+
+# =============================================================================
+# UTILIDADES DE MEDICIÓN COMPARTIDAS POR LOS BENCHMARKS
+# =============================================================================
+
+class GrafoContador(dict):
+    """Diccionario que cuenta cuántas veces se piden los vecinos de un nodo.
+
+    Los buscadores consultan grafo[nodo] (o grafo.get(nodo)) una sola vez por
+    expansión, así que el contador es el número de nodos expandidos.
+    """
+
+    expansiones = 0
+
+    def __getitem__(self, nodo):
+        self.expansiones += 1
+        return super().__getitem__(nodo)
+
+    def get(self, nodo, defecto=None):
+        self.expansiones += 1
+        return super().get(nodo, defecto)
+
+
+def cronometrar(funcion, *args):
+    """Devuelve (resultado, segundos) de funcion(*args)."""
+    t0 = time.perf_counter()
+    resultado = funcion(*args)
+    return resultado, time.perf_counter() - t0
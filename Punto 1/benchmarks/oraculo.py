@@ -0,0 +1,48 @@
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+PUNTO_1 = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PUNTO_1))  # Paquete busqueda
+
+from busqueda import GrafoCSR, OraculoDistancias, ucs
+from generadores import consultas_aleatorias, grafo_aleatorio
+from medicion import cronometrar
+
+# =============================================================================
+# BENCHMARK: PRECÁLCULO DEL ORÁCULO DE DISTANCIAS SEGÚN EL TAMAÑO DEL GRAFO
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Tiempo y tamaño de OraculoDistancias vs tamaño del grafo")
+    parser.add_argument("--nodos", type=int, nargs="+", default=[250, 500, 1000, 2000])
+    parser.add_argument("--hubs", type=int, default=64, help="fuentes del oráculo parcial en el grafo más grande")
+    parser.add_argument("--procesos", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--consultas", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"Todos los pares, grado 4, {args.procesos} procesos")
+    print(f"{'nodos':>7} {'aristas':>8} {'precálculo (s)':>15} {'tablas (MB)':>12} "
+          f"{'consulta ucs (ms)':>18} {'consulta oráculo (ms)':>22}")
+    for n_nodos in args.nodos:
+        grafo_costo = grafo_aleatorio(n_nodos, grado=4)
+        oraculo, segundos = cronometrar(OraculoDistancias.precalcular, grafo_costo, None, args.procesos)
+        consultas = consultas_aleatorias(grafo_costo, args.consultas)
+        esperado, t_ucs = cronometrar(lambda: [ucs(grafo_costo, i, m) for i, m in consultas])
+        obtenido, t_oraculo = cronometrar(lambda: [oraculo.consultar(i, m) for i, m in consultas])
+        assert obtenido == esperado, "El oráculo difiere de ucs()"
+        print(f"{n_nodos:>7} {4 * n_nodos:>8} {segundos:>15.2f} {oraculo.memoria_bytes() / 2**20:>12.1f} "
+              f"{1000 * t_ucs / len(consultas):>18.3f} {1000 * t_oraculo / len(consultas):>22.3f}")
+
+    # Oráculo parcial: solo las filas de unos hubs (por ejemplo, depósitos), n x hubs en vez de n x n
+    grafo = GrafoCSR.desde_dict(grafo_aleatorio(args.nodos[-1] * 10, grado=4))
+    hubs = list(grafo.etiquetas)[:args.hubs]
+    oraculo, segundos = cronometrar(OraculoDistancias.precalcular, grafo, hubs, args.procesos)
+    print(f"{args.hubs} hubs sobre {len(grafo)} nodos: precálculo {segundos:.2f} s, "
+          f"tablas {oraculo.memoria_bytes() / 2**20:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
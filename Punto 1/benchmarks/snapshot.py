@@ -0,0 +1,83 @@
+import argparse
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PUNTO_1 = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PUNTO_1))  # Paquete busqueda
+
+from busqueda import abrir_snapshot, compilar_snapshot, leer_aristas, ucs, ucs_csr
+
+# =============================================================================
+# BENCHMARK: ARRANQUE DESDE CSV (DICCIONARIO) VS SNAPSHOT MAPEADO
+# =============================================================================
+
+MODOS = ("csv_dict", "snapshot")
+
+
+def escribir_aristas(ruta, n_nodos, grado, semilla):
+    """Lista de aristas aleatoria escrita en streaming (sin armar el grafo en memoria)."""
+    rng = random.Random(semilla)
+    with open(ruta, "w") as archivo:
+        archivo.write("origen,destino,costo\n")
+        for u in range(n_nodos):
+            archivo.writelines(f"n{u},n{rng.randrange(n_nodos)},{rng.randint(1, 9)}\n" for _ in range(grado))
+
+
+def correr_modo(modo, ruta, inicio, meta):
+    """Carga el grafo y resuelve una consulta; imprime 'carga consulta pico_kb costo'."""
+    t0 = time.perf_counter()
+    if modo == "csv_dict":
+        grafo = {}
+        for origen, destino, costo in leer_aristas(ruta):
+            grafo.setdefault(origen, []).append((destino, costo))
+        t1 = time.perf_counter()
+        _, costo = ucs(grafo, inicio, meta)
+    else:
+        grafo = abrir_snapshot(ruta)
+        t1 = time.perf_counter()
+        _, costo = ucs_csr(grafo, inicio, meta)
+    t2 = time.perf_counter()
+    print(t1 - t0, t2 - t1, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, costo)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Arranque desde CSV vs snapshot binario con mmap")
+    parser.add_argument("--nodos", type=int, default=500_000)
+    parser.add_argument("--grado", type=int, default=4)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--modo", choices=MODOS, help=argparse.SUPPRESS)
+    parser.add_argument("--ruta", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    inicio, meta = "n0", f"n{args.nodos // 2}"
+
+    if args.modo:
+        correr_modo(args.modo, args.ruta, inicio, meta)
+        return
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        csv_ruta, snapshot = Path(carpeta) / "aristas.csv", Path(carpeta) / "aristas.csr"
+        escribir_aristas(csv_ruta, args.nodos, args.grado, args.semilla)
+        t0 = time.perf_counter()
+        compilar_snapshot(csv_ruta, snapshot)
+        compilacion = time.perf_counter() - t0
+        print(f"{args.nodos * args.grado} aristas: CSV {csv_ruta.stat().st_size / 2**20:.1f} MB, "
+              f"snapshot {snapshot.stat().st_size / 2**20:.1f} MB, compilado en {compilacion:.2f} s (una vez)")
+
+        # Cada modo corre en un proceso nuevo: arranque en frío y pico de RSS propio
+        print(f"{'modo':>9} {'carga (s)':>10} {'consulta (s)':>13} {'pico RSS (MB)':>14} {'costo':>6}")
+        for modo, ruta in zip(MODOS, (csv_ruta, snapshot)):
+            salida = subprocess.run(
+                [sys.executable, __file__, "--modo", modo, "--ruta", str(ruta), "--nodos", str(args.nodos)],
+                capture_output=True, text=True, check=True,
+            ).stdout.split()
+            carga, consulta, pico_kb, costo = float(salida[0]), float(salida[1]), int(salida[2]), salida[3]
+            print(f"{modo:>9} {carga:>10.3f} {consulta:>13.2f} {pico_kb / 1024:>14.1f} {costo:>6}")
+
+
+if __name__ == "__main__":
+    main()
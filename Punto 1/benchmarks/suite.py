@@ -0,0 +1,226 @@
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+PUNTO_1 = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PUNTO_1))  # Paquete busqueda
+
+from busqueda import (EstadisticasBusqueda, GrafoCSR, HeuristicaLandmarks, astar, bfs_bidireccional, bfs_csr,
+                      bfs_niveles, bfs_padres, dfs_correcto, dfs_csr, grafo_inverso, iddfs, ucs, ucs_bidireccional,
+                      ucs_csr)
+from generadores import arbol_sintetico, grafo_aleatorio, profundidad, reticula
+
+# =============================================================================
+# SUITE DE BENCHMARKS: TODOS LOS BUSCADORES SOBRE GRAFOS SINTÉTICOS CON SEMILLA
+# =============================================================================
+
+# Ejemplos (desde la carpeta benchmarks):
+#   python suite.py --rapido --base base_rapido.json --umbral 0.25   # sale con código 1 si hay regresión
+#   python suite.py --rapido --guardar-base base_rapido.json         # regenera la línea base versionada
+
+COSTOS = {"unitario": (1, 1), "estrecho": (1, 9), "amplio": (1, 1000)}
+TAMANOS = {"rapido": (2_000, 20_000), "completo": (10_000, 100_000, 1_000_000)}
+
+
+def escenarios(tamanos, semilla):
+    """(nombre, grafo_costo, consultas, es_arbol) para cada combinación de forma, tamaño y costos."""
+    for n_nodos in tamanos:
+        for nombre_costos, costos in COSTOS.items():
+            for ramificacion in (1.2, 2.0, 4.0):
+                grafo = arbol_sintetico(n_nodos, ramificacion, semilla, costos)
+                # En un árbol solo la raíz llega a todos: las metas se eligen entre todos los nodos
+                rng = random.Random(semilla)
+                consultas = [("n0", rng.choice(list(grafo))) for _ in range(5)]
+                nombre = f"arbol n={n_nodos} b={ramificacion} prof={profundidad(grafo, 'n0')} {nombre_costos}"
+                yield nombre, grafo, consultas, True
+
+            grafo = grafo_aleatorio(n_nodos, 4, costos, semilla)
+            rng = random.Random(semilla)
+            consultas = [tuple(rng.sample(list(grafo), 2)) for _ in range(5)]
+            yield f"aleatorio n={n_nodos} grado=4 {nombre_costos}", grafo, consultas, False
+
+            lado = int(n_nodos ** 0.5)
+            grafo = reticula(lado, lado, costos, semilla)
+            consultas = [((0, 0), (lado - 1, lado - 1)), ((0, lado - 1), (lado - 1, 0))]
+            yield f"reticula {lado}x{lado} {nombre_costos}", grafo, consultas, False
+
+
+def bfs_niveles_consulta(grafo, inicio, meta):
+    # bfs_niveles hace el barrido completo desde inicio; el camino sale del arreglo de padres
+    if inicio == meta:
+        return "Start and goal nodes are the same"
+    _, padre = bfs_niveles(grafo, inicio)
+    m = grafo.indice.get(meta, -1)
+    if m < 0 or padre[m] == -2:
+        return "No path found between start and goal"
+    return grafo.camino_etiquetas(padre, m)
+
+
+def buscadores(es_arbol, costos_enteros, semilla):
+    """(nombre, preparar, buscar, acepta_estadisticas): preparar convierte el grafo una vez por escenario.
+
+    Lo que se prepara (CSR, índice inverso, landmarks) no entra en el tiempo medido.
+    """
+    sin_costos = lambda grafo: {u: [v for v, _ in aristas] for u, aristas in grafo.items()}
+    csr = lambda grafo: GrafoCSR.desde_dict(grafo, ponderado=True)
+    csr_sin_costos = lambda grafo: GrafoCSR.desde_dict(sin_costos(grafo), ponderado=False)
+    tal_cual = lambda grafo: grafo
+    # Las búsquedas bidireccionales reciben el índice inverso ya armado, como en un servicio de consultas
+    con_inverso = lambda grafo: (grafo, grafo_inverso(grafo, ponderado=True))
+    sin_costos_con_inverso = lambda grafo: (sin_costos(grafo), grafo_inverso(sin_costos(grafo), ponderado=False))
+    con_landmarks = lambda grafo: (grafo, HeuristicaLandmarks.elegir(grafo, 4, semilla))
+
+    lista = [
+        ("bfs_padres", sin_costos, bfs_padres, True),
+        ("bfs_csr", csr_sin_costos, bfs_csr, False),
+        ("bfs_bidireccional", sin_costos_con_inverso, lambda p, i, m: bfs_bidireccional(p[0], i, m, p[1]), False),
+        ("bfs_niveles", csr_sin_costos, bfs_niveles_consulta, False),
+        ("dfs_correcto", tal_cual, dfs_correcto, True),
+        ("dfs_csr", csr, dfs_csr, False),
+        ("ucs", tal_cual, ucs, True),
+        ("ucs indexada", tal_cual, lambda g, i, m, **k: ucs(g, i, m, cola="indexada", **k), True),
+        ("ucs_csr", csr, ucs_csr, False),
+        ("ucs_bidireccional", con_inverso, lambda p, i, m: ucs_bidireccional(p[0], i, m, p[1]), False),
+        ("astar ALT", con_landmarks, lambda p, i, m: astar(p[0], i, m, p[1]), False),
+    ]
+    if costos_enteros:
+        lista.append(("ucs buckets", tal_cual, lambda g, i, m, **k: ucs(g, i, m, cola="buckets", **k), True))
+    if es_arbol:
+        lista.append(("iddfs", tal_cual, iddfs, False))  # En grafos con ciclos repite demasiado
+    return lista
+
+
+def medir(preparar, buscar, acepta_estadisticas, grafo_costo, consultas, repeticiones, minimo):
+    grafo = preparar(grafo_costo)
+
+    # Mejor pasada de al menos `repeticiones`, repitiendo hasta sumar `minimo` segundos:
+    # en los grafos chicos una sola pasada dura milisegundos y el ruido domina
+    gc.collect()
+    mejor = total = 0.0
+    pasadas = 0
+    while pasadas < repeticiones or total < minimo:
+        t0 = time.perf_counter()
+        resultados = [buscar(grafo, inicio, meta) for inicio, meta in consultas]
+        segundos = time.perf_counter() - t0
+        mejor = segundos if pasadas == 0 else min(mejor, segundos)
+        total += segundos
+        pasadas += 1
+
+    expandidos = None
+    if acepta_estadisticas:
+        expandidos = 0
+        for inicio, meta in consultas:
+            estadisticas = EstadisticasBusqueda()
+            buscar(grafo, inicio, meta, estadisticas=estadisticas)
+            expandidos += estadisticas.expandidos
+
+    tracemalloc.start()
+    buscar(grafo, *consultas[0])
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return resultados, {
+        "segundos": mejor,
+        "consultas_por_segundo": len(consultas) / mejor,
+        "expandidos": expandidos,
+        "pico_mb": pico / 2**20,
+    }
+
+
+def costo_de(resultado):
+    # bfs devuelve el camino (o un mensaje); el resto devuelve (camino, costo)
+    if isinstance(resultado, tuple):
+        return resultado[1]
+    return len(resultado) - 1 if isinstance(resultado, list) else resultado
+
+
+def familia(algoritmo):
+    """Buscadores que deben coincidir entre sí: largo del camino en BFS, costo en UCS y A*."""
+    if algoritmo.startswith("bfs"):
+        return "bfs"
+    if algoritmo.startswith(("ucs", "astar")):
+        return "ucs"
+    return None
+
+
+def comparar(resultados, base, umbral):
+    """Filas cuyo rendimiento cayó más de `umbral` (fracción) respecto de la línea base."""
+    anteriores = {(r["escenario"], r["algoritmo"]): r for r in base["resultados"]}
+    regresiones = []
+    for fila in resultados:
+        anterior = anteriores.get((fila["escenario"], fila["algoritmo"]))
+        if anterior is None:
+            continue
+        razon = fila["consultas_por_segundo"] / anterior["consultas_por_segundo"]
+        if razon < 1 - umbral:
+            regresiones.append((fila, razon))
+    return regresiones
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suite de benchmarks de los buscadores con seguimiento de regresiones")
+    parser.add_argument("--rapido", action="store_true", help=f"tamaños {TAMANOS['rapido']} en vez de {TAMANOS['completo']}")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--repeticiones", type=int, default=3, help="se toma el mejor tiempo")
+    parser.add_argument("--minimo", type=float, default=0.5, help="segundos mínimos de medición por buscador")
+    parser.add_argument("--salida", default="resultados_suite.json")
+    parser.add_argument("--base", help="resultados anteriores contra los que comparar")
+    parser.add_argument("--umbral", type=float, default=0.25, help="caída de consultas/s tolerada (0.25 = 25 %%)")
+    parser.add_argument("--guardar-base", help="además, guardar estos resultados como nueva línea base")
+    parser.add_argument("--filtro", default="", help="solo escenarios cuyo nombre contenga este texto")
+    args = parser.parse_args()
+
+    resultados = []
+    for nombre, grafo_costo, consultas, es_arbol in escenarios(TAMANOS["rapido" if args.rapido else "completo"],
+                                                               args.semilla):
+        if args.filtro not in nombre:
+            continue
+        print(nombre)
+        costos_enteros = all(isinstance(c, int) for aristas in grafo_costo.values() for _, c in aristas)
+        referencias = {}
+        for algoritmo, preparar, buscar, acepta_estadisticas in buscadores(es_arbol, costos_enteros, args.semilla):
+            salida, fila = medir(preparar, buscar, acepta_estadisticas, grafo_costo, consultas,
+                                 args.repeticiones, args.minimo)
+            # Verificación: las variantes de BFS dan el mismo largo y las de UCS (y A*) el mismo costo
+            if familia(algoritmo) is not None:
+                costos = [costo_de(r) for r in salida]
+                referencia = referencias.setdefault(familia(algoritmo), (algoritmo, costos))
+                assert costos == referencia[1], f"{algoritmo} difiere de {referencia[0]} en {nombre}"
+            fila.update(escenario=nombre, algoritmo=algoritmo)
+            resultados.append(fila)
+            expandidos = fila["expandidos"] if fila["expandidos"] is not None else "-"
+            print(f"  {algoritmo:<18} {fila['consultas_por_segundo']:>10.1f} consultas/s "
+                  f"{expandidos:>9} expandidos {fila['pico_mb']:>8.1f} MB")
+
+    documento = {
+        "fecha": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "semilla": args.semilla,
+        "resultados": resultados,
+    }
+    for ruta in filter(None, (args.salida, args.guardar_base)):
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump(documento, archivo, indent=2, ensure_ascii=False)
+    print(f"{len(resultados)} mediciones guardadas en {args.salida}")
+
+    if args.base:
+        with open(args.base, encoding="utf-8") as archivo:
+            base = json.load(archivo)
+        regresiones = comparar(resultados, base, args.umbral)
+        for fila, razon in regresiones:
+            print(f"REGRESIÓN {fila['escenario']} / {fila['algoritmo']}: {razon:.2f}x de la línea base")
+        if regresiones:
+            sys.exit(1)
+        print(f"Sin regresiones mayores al {args.umbral:.0%} respecto de {args.base}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import importlib
+
+# Los nombres públicos se importan bajo demanda (PEP 562): importar el paquete
+# no carga ningún submódulo, así que los procesos trabajadores y la línea de
+# comandos solo pagan por lo que usan.
+_EXPORTS = {
+    "abrir_snapshot": "archivos", "cargar_grafo": "archivos", "compilar_snapshot": "archivos",
+    "leer_aristas": "archivos",
+    "bfs": "anchura", "bfs_bidireccional": "anchura", "bfs_csr": "anchura", "bfs_padres": "anchura",
+    "reconstruct_path": "anchura",
+    "COLAS": "colas", "ColaBuckets": "colas", "HeapIndexado": "colas",
+    "HeuristicaLandmarks": "costo_uniforme", "astar": "costo_uniforme", "distancias_ucs": "costo_uniforme",
+    "reconstruir_camino": "costo_uniforme", "ucs": "costo_uniforme", "ucs_bidireccional": "costo_uniforme",
+    "ucs_con_cola": "costo_uniforme", "ucs_csr": "costo_uniforme",
+    "UCSDinamico": "dinamico",
+    "EstadisticasBusqueda": "estadisticas",
+    "GrafoCSR": "grafo_csr",
+    "es_ponderado": "grafos", "grafo_inverso": "grafos",
+    "SucesoresMemo": "implicito", "como_sucesores": "implicito", "como_vecinos": "implicito",
+    "resolver_lote": "lotes",
+    "bfs_niveles": "niveles",
+    "OraculoDistancias": "oraculo",
+    "dfs_correcto": "profundidad", "dfs_csr": "profundidad", "dfs_limitado": "profundidad",
+    "iddfs": "profundidad",
+    "ArbolUCS": "servicio_ucs", "ServicioUCS": "servicio_ucs",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(nombre):
+    modulo = _EXPORTS.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(importlib.import_module(f".{modulo}", __name__), nombre)
+    globals()[nombre] = valor  # Las siguientes consultas no pasan por aquí
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,108 @@
+import argparse
+import itertools
+import json
+import sys
+from pathlib import Path
+
+from .archivos import abrir_snapshot, cargar_grafo
+from .lotes import resolver_lote
+
+# =============================================================================
+# LÍNEA DE COMANDOS: python -m busqueda ALGORITMO GRAFO [INICIO META]
+# =============================================================================
+
+# Ejemplos (desde la carpeta "Punto 1"):
+#   python -m busqueda ucs aristas.csv S W
+#   python -m busqueda bfs aristas.csr < consultas.txt > resultados.jsonl
+#
+# Sin INICIO/META lee una consulta "inicio meta" por línea de la entrada
+# estándar y escribe un resultado JSON por línea, en el mismo orden. Las
+# consultas se resuelven en bloques con resolver_lote (un barrido por inicio).
+# Una línea mal formada o con un inicio que no está en el grafo produce una
+# fila de error (camino y costo null, con "mensaje") y se sigue con las demás.
+
+ALGORITMOS = ("bfs", "dfs", "ucs")
+
+
+def abrir_grafo(ruta):
+    """Snapshot .csr tal cual; cualquier otra extensión se trata como lista de aristas."""
+    ruta = Path(ruta)
+    return abrir_snapshot(ruta) if ruta.suffix == ".csr" else cargar_grafo(ruta)
+
+
+def a_json(inicio, meta, resultado):
+    # bfs devuelve el camino (o un mensaje); dfs y ucs devuelven (camino, costo)
+    if isinstance(resultado, tuple):
+        camino, costo = resultado
+        costo = None if costo == float('inf') else costo
+    elif isinstance(resultado, str):
+        camino, costo = None, None
+    else:
+        camino, costo = resultado, len(resultado) - 1
+    fila = {"inicio": inicio, "meta": meta, "camino": camino, "costo": costo}
+    if isinstance(resultado, str):
+        fila["mensaje"] = resultado
+    return json.dumps(fila, ensure_ascii=False)
+
+
+def error_json(inicio, meta, mensaje):
+    return json.dumps({"inicio": inicio, "meta": meta, "camino": None, "costo": None, "mensaje": mensaje},
+                      ensure_ascii=False)
+
+
+def leer_consultas(entrada):
+    """(inicio, meta, error) por línea no vacía; error es None o el motivo por el que la línea no se entiende."""
+    for numero, linea in enumerate(entrada, 1):
+        partes = linea.split()
+        if not partes:
+            continue
+        if len(partes) != 2:
+            yield None, None, f"línea {numero}: se esperaba 'inicio meta', se leyó {linea.strip()!r}"
+            continue
+        yield partes[0], partes[1], None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m busqueda",
+                                     description="Caminos con bfs, dfs o ucs sobre un grafo en archivo")
+    parser.add_argument("algoritmo", choices=ALGORITMOS)
+    parser.add_argument("grafo", help="lista de aristas CSV/TSV (se compila a .csr) o snapshot .csr")
+    parser.add_argument("inicio", nargs="?")
+    parser.add_argument("meta", nargs="?")
+    parser.add_argument("--bloque", type=int, default=1000,
+                        help="consultas de la entrada estándar resueltas juntas (1 = responder cada línea)")
+    parser.add_argument("--procesos", type=int, default=1)
+    args = parser.parse_args(argv)
+    if (args.inicio is None) != (args.meta is None):
+        parser.error("se necesitan INICIO y META, o ninguno para leer consultas de la entrada estándar")
+
+    grafo = abrir_grafo(args.grafo)
+
+    if args.inicio is not None:
+        if args.inicio not in grafo.indice:
+            raise SystemExit(f"nodo de inicio desconocido: {args.inicio!r}")
+        [resultado] = resolver_lote(grafo, [(args.inicio, args.meta)], args.algoritmo, args.procesos)
+        print(a_json(args.inicio, args.meta, resultado))
+        return
+
+    consultas = leer_consultas(sys.stdin)
+    while True:
+        bloque = list(itertools.islice(consultas, max(args.bloque, 1)))
+        if not bloque:
+            break
+        # Las consultas con error no entran al lote: responden con su fila de error en su lugar
+        validas = [(inicio, meta) for inicio, meta, error in bloque if error is None and inicio in grafo.indice]
+        resultados = iter(resolver_lote(grafo, validas, args.algoritmo, args.procesos) if validas else [])
+        for inicio, meta, error in bloque:
+            if error is not None:
+                fila = error_json(inicio, meta, error)
+            elif inicio not in grafo.indice:
+                fila = error_json(inicio, meta, "nodo de inicio desconocido")
+            else:
+                fila = a_json(inicio, meta, next(resultados))
+            sys.stdout.write(fila + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+from array import array
+from collections import deque
+
+from .grafos import grafo_inverso
+from .implicito import como_vecinos
+
+# =============================================================================
+# BÚSQUEDA EN ANCHURA (BFS)
+# =============================================================================
+
+def bfs(graph, start, goal, estadisticas=None):
+    neighbors_of = como_vecinos(graph, ponderado=False)  # Dict or successor function
+    visited = set()  # Set to keep track of visited nodes
+    queue = deque([[start]])  # Queue for BFS, starting with the initial node
+
+    if start == goal:
+        return "Start and goal nodes are the same"
+
+    if estadisticas is not None:
+        estadisticas.iniciar("bfs")
+
+    while queue:
+        path = queue.popleft()  # Get the first path from the queue
+        node = path[-1]  # Get the last node from the path
+
+        if node not in visited:
+            neighbors = neighbors_of(node)  # Get neighbors of the current node
+
+            for neighbor in neighbors:
+                new_path = list(path)  # Copy the current path
+                new_path.append(neighbor)  # Add the neighbor to the path
+                queue.append(new_path)  # Add the new path to the queue
+
+                if neighbor == goal:
+                    if estadisticas is not None:
+                        registrar_bfs(estadisticas, len(visited) + 1, queue)
+                        estadisticas.fin_reconstruccion()  # The path is already built
+                    return new_path  # If neighbor is the goal, return the path
+
+            visited.add(node)  # Mark the node as explored
+            if estadisticas is not None:
+                estadisticas.frontera(len(queue))
+        elif estadisticas is not None:
+            estadisticas.duplicados += 1
+
+    if estadisticas is not None:
+        registrar_bfs(estadisticas, len(visited), queue)
+    return "No path found between start and goal"
+
+def registrar_bfs(estadisticas, expanded, queue):
+    # Every pop was either an expansion or a duplicate, and every push (except
+    # the start) was either popped or is still in the queue
+    pops = expanded + estadisticas.duplicados
+    estadisticas.fin_expansion(expanded, pops + len(queue) - 1)
+
+def bfs_padres(graph, start, goal, estadisticas=None):
+    # Same search as bfs(), but the queue only holds node ids and each node
+    # remembers who discovered it first. The path is rebuilt once at the end.
+    neighbors_of = como_vecinos(graph, ponderado=False)  # Dict or successor function
+    visited = set()  # Set to keep track of visited nodes
+    parent = {start: None}  # First node that reached each node
+    queue = deque([start])  # Queue for BFS, starting with the initial node
+
+    if start == goal:
+        return "Start and goal nodes are the same"
+
+    if estadisticas is not None:
+        estadisticas.iniciar("bfs_padres")
+
+    while queue:
+        node = queue.popleft()  # Get the first node from the queue
+
+        if node not in visited:
+            for neighbor in neighbors_of(node):
+                if neighbor == goal:
+                    parent[neighbor] = node
+                    if estadisticas is not None:
+                        # Each node enters the queue once: generated = discovered
+                        estadisticas.fin_expansion(len(visited) + 1, len(parent) - 1)
+                        path = reconstruct_path(parent, goal)
+                        estadisticas.fin_reconstruccion()
+                        return path
+                    return reconstruct_path(parent, goal)  # Goal reached
+
+                if neighbor not in parent:  # Keep the first discoverer only
+                    parent[neighbor] = node
+                    queue.append(neighbor)
+
+            visited.add(node)  # Mark the node as explored
+            if estadisticas is not None:
+                estadisticas.frontera(len(queue))
+
+    if estadisticas is not None:
+        estadisticas.fin_expansion(len(visited), len(parent) - 1)
+    return "No path found between start and goal"
+
+def reconstruct_path(parent, goal):
+    path = []
+    node = goal
+    while node is not None:
+        path.append(node)
+        node = parent[node]
+    return path[::-1]
+
+def bfs_bidireccional(graph, start, goal, reverse=None):
+    # Two BFS trees, one from start over graph and one from goal over the reverse
+    # adjacency index. Each round expands one whole level of the smaller frontier
+    # and stops at the first node reached by both sides (shortest in number of edges).
+    # The path has the same length as bfs_padres(), but when several shortest paths
+    # tie it may be a different one: only the length is guaranteed to match.
+    if start == goal:
+        return "Start and goal nodes are the same"
+
+    if reverse is None:
+        if not isinstance(graph, dict):
+            raise TypeError("Implicit graphs need an explicit reverse successor function")
+        reverse = grafo_inverso(graph, ponderado=False)  # Pass it in to reuse it across queries
+    forward_of = como_vecinos(graph, ponderado=False)
+    backward_of = como_vecinos(reverse, ponderado=False)
+
+    parent_f = {start: None}
+    parent_b = {goal: None}
+    frontier_f = [start]
+    frontier_b = [goal]
+
+    while frontier_f and frontier_b:
+        if len(frontier_f) <= len(frontier_b):
+            frontier_f, meeting = expand_level(forward_of, frontier_f, parent_f, parent_b)
+        else:
+            frontier_b, meeting = expand_level(backward_of, frontier_b, parent_b, parent_f)
+
+        if meeting is not None:
+            towards_goal = reconstruct_path(parent_b, meeting)[::-1]  # meeting -> goal
+            return reconstruct_path(parent_f, meeting) + towards_goal[1:]
+
+    return "No path found between start and goal"
+
+def expand_level(neighbors_of, frontier, parent, other_parent):
+    next_frontier = []
+    for node in frontier:
+        for neighbor in neighbors_of(node):
+            if neighbor not in parent:
+                parent[neighbor] = node
+                if neighbor in other_parent:
+                    return next_frontier, neighbor  # Both searches met here
+                next_frontier.append(neighbor)
+    return next_frontier, None
+
+def bfs_csr(grafo, start, goal):
+    # bfs_padres() over a GrafoCSR: integer ids, a bytearray for visited and an
+    # array of parents (-1 = root, -2 = not discovered yet).
+    if start == goal:
+        return "Start and goal nodes are the same"
+
+    s, g = grafo.indice.get(start, -1), grafo.indice.get(goal, -1)
+    if s < 0:  # Unknown start: like bfs_padres(), the search never leaves it
+        return "No path found between start and goal"
+    offsets, destinos = grafo.offsets, grafo.destinos
+    visited = bytearray(len(grafo))
+    parent = array('q', [-2]) * len(grafo)
+    parent[s] = -1
+    queue = deque([s])
+
+    while queue:
+        node = queue.popleft()
+
+        if not visited[node]:
+            for k in range(offsets[node], offsets[node + 1]):
+                neighbor = destinos[k]
+                if neighbor == g:
+                    parent[neighbor] = node
+                    return grafo.camino_etiquetas(parent, g)  # Goal reached
+
+                if parent[neighbor] == -2:
+                    parent[neighbor] = node
+                    queue.append(neighbor)
+
+            visited[node] = 1
+
+    return "No path found between start and goal"
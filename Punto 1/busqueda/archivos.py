@@ -0,0 +1,202 @@
+import bisect
+import csv
+import mmap
+import struct
+from array import array
+from pathlib import Path
+
+from .grafo_csr import GrafoCSR
+
+# =============================================================================
+# CARGA DE GRAFOS DESDE ARCHIVOS Y SNAPSHOT BINARIO MAPEADO EN MEMORIA
+# =============================================================================
+
+# Formato del snapshot (enteros en el orden de bytes de la máquina; cada
+# sección empieza en un múltiplo de 8 bytes):
+#   cabecera    MAGIA, versión, n, m, tipo de costos ('q' o 'd'), bytes de etiquetas
+#   offsets     n + 1 enteros 'q'
+#   destinos    m enteros 'i'
+#   costos      m valores 'q' o 'd'
+#   posiciones  n + 1 enteros 'q': inicio de cada etiqueta dentro del bloque UTF-8
+#   etiquetas   bloque UTF-8 con las etiquetas ordenadas, una tras otra
+
+MAGIA = b"GRAFOCSR"
+VERSION = 1
+CABECERA = struct.Struct("=8sQQQc7xQ")
+
+
+def leer_aristas(ruta, separador=None, encabezado=None):
+    """Genera (origen, destino, costo) leyendo un CSV/TSV fila por fila.
+
+    El separador se deduce de la extensión (.tsv -> tabulador, si no coma). Una
+    tercera columna es el costo (entero o decimal); sin ella cada arista cuesta 1.
+    Con encabezado=None la primera fila se descarta si su costo no es numérico.
+    """
+    ruta = Path(ruta)
+    if separador is None:
+        separador = "\t" if ruta.suffix.lower() == ".tsv" else ","
+    with open(ruta, newline="", encoding="utf-8") as archivo:
+        for numero, fila in enumerate(csv.reader(archivo, delimiter=separador)):
+            if not fila:
+                continue
+            if len(fila) < 2:
+                raise ValueError(f"{ruta}:{numero + 1}: se esperaban al menos 2 columnas")
+            costo = 1
+            if len(fila) > 2:
+                try:
+                    costo = _numero(fila[2])
+                except ValueError:
+                    if numero == 0 and encabezado is not False:
+                        continue
+                    raise ValueError(f"{ruta}:{numero + 1}: costo no numérico {fila[2]!r}") from None
+            if numero == 0 and encabezado:
+                continue
+            yield fila[0], fila[1], costo
+
+
+def _numero(texto):
+    try:
+        return int(texto)
+    except ValueError:
+        return float(texto)
+
+
+def compilar_snapshot(ruta_aristas, ruta_snapshot, separador=None, encabezado=None):
+    """Compila una lista de aristas a un snapshot binario. Devuelve (n, m).
+
+    Las aristas se leen en streaming y se guardan en arreglos compactos (no en un
+    diccionario de listas). Los ids siguen el orden de las etiquetas, igual que
+    GrafoCSR.desde_dict, y dentro de cada nodo se conserva el orden del archivo.
+    """
+    indice = {}
+    origenes, destinos_viejos = array('i'), array('i')
+    costos = array('q')
+    for origen, destino, costo in leer_aristas(ruta_aristas, separador, encabezado):
+        origenes.append(indice.setdefault(origen, len(indice)))
+        destinos_viejos.append(indice.setdefault(destino, len(indice)))
+        if costos.typecode == 'q' and not isinstance(costo, int):
+            costos = array('d', costos)
+        costos.append(costo)
+
+    # Renumerar en orden de etiquetas y ordenar las aristas por origen (counting sort estable)
+    etiquetas = sorted(indice)
+    n, m = len(etiquetas), len(origenes)
+    nuevo_id = array('i', bytes(4 * n))
+    for nuevo, etiqueta in enumerate(etiquetas):
+        nuevo_id[indice[etiqueta]] = nuevo
+    del indice
+
+    offsets = array('q', bytes(8 * (n + 1)))
+    for origen in origenes:
+        offsets[nuevo_id[origen] + 1] += 1
+    for u in range(n):
+        offsets[u + 1] += offsets[u]
+
+    siguiente = array('q', offsets[:-1])
+    destinos = array('i', bytes(4 * m))
+    costos_ordenados = array(costos.typecode, bytes(8 * m))
+    for k in range(m):
+        u = nuevo_id[origenes[k]]
+        posicion = siguiente[u]
+        siguiente[u] += 1
+        destinos[posicion] = nuevo_id[destinos_viejos[k]]
+        costos_ordenados[posicion] = costos[k]
+    del origenes, destinos_viejos, costos, siguiente
+
+    bloque = [etiqueta.encode("utf-8") for etiqueta in etiquetas]
+    posiciones = array('q', [0])
+    for texto in bloque:
+        posiciones.append(posiciones[-1] + len(texto))
+
+    with open(ruta_snapshot, "wb") as archivo:
+        archivo.write(CABECERA.pack(MAGIA, VERSION, n, m, costos_ordenados.typecode.encode(), posiciones[-1]))
+        for seccion in (offsets, destinos, costos_ordenados, posiciones):
+            archivo.write(seccion.tobytes())
+            archivo.write(bytes(-archivo.tell() % 8))
+        for texto in bloque:
+            archivo.write(texto)
+    return n, m
+
+
+class EtiquetasMapeadas:
+    """Secuencia id -> etiqueta que decodifica las etiquetas del snapshot al pedirlas."""
+
+    def __init__(self, posiciones, bloque):
+        self.posiciones = posiciones
+        self.bloque = bloque
+
+    def __len__(self):
+        return len(self.posiciones) - 1
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        return str(self.bloque[self.posiciones[i]:self.posiciones[i + 1]], "utf-8")
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+class IndiceMapeado:
+    """Mapa etiqueta -> id por búsqueda binaria: las etiquetas del snapshot están ordenadas."""
+
+    def __init__(self, etiquetas):
+        self.etiquetas = etiquetas
+
+    def get(self, etiqueta, defecto=None):
+        i = bisect.bisect_left(self.etiquetas, etiqueta)
+        if i < len(self.etiquetas) and self.etiquetas[i] == etiqueta:
+            return i
+        return defecto
+
+    def __getitem__(self, etiqueta):
+        i = self.get(etiqueta)
+        if i is None:
+            raise KeyError(etiqueta)
+        return i
+
+    def __contains__(self, etiqueta):
+        return self.get(etiqueta) is not None
+
+    def __len__(self):
+        return len(self.etiquetas)
+
+
+def abrir_snapshot(ruta):
+    """GrafoCSR de solo lectura sobre el snapshot mapeado con mmap.
+
+    No se lee ni decodifica nada al abrir: el sistema operativo carga las páginas
+    a medida que la búsqueda las toca, y varios procesos que abren el mismo
+    archivo comparten esas páginas. Las etiquetas se buscan por bisección.
+    """
+    with open(ruta, "rb") as archivo:
+        mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+    magia, version, n, m, tipo, tamano = CABECERA.unpack_from(mapa)
+    if magia != MAGIA or version != VERSION:
+        raise ValueError(f"{ruta} no es un snapshot de GrafoCSR (versión {VERSION})")
+
+    vista = memoryview(mapa)
+    posicion = CABECERA.size
+    secciones = []
+    for formato, cantidad in (('q', n + 1), ('i', m), (tipo.decode(), m), ('q', n + 1)):
+        tamano_seccion = struct.calcsize(formato) * cantidad
+        secciones.append(vista[posicion:posicion + tamano_seccion].cast(formato))
+        posicion += tamano_seccion + (-tamano_seccion % 8)
+    offsets, destinos, costos, posiciones = secciones
+
+    etiquetas = EtiquetasMapeadas(posiciones, vista[posicion:posicion + tamano])
+    grafo = GrafoCSR(etiquetas, offsets, destinos, costos, indice=IndiceMapeado(etiquetas))
+    grafo.ruta = Path(ruta)
+    return grafo
+
+
+def cargar_grafo(ruta_aristas, ruta_snapshot=None, separador=None, encabezado=None):
+    """Abre el snapshot de una lista de aristas, compilándolo si falta o es más viejo que el archivo.
+
+    Por defecto el snapshot queda junto al archivo con extensión .csr.
+    """
+    ruta_aristas = Path(ruta_aristas)
+    ruta_snapshot = Path(ruta_snapshot) if ruta_snapshot else ruta_aristas.with_suffix(".csr")
+    if not ruta_snapshot.exists() or ruta_snapshot.stat().st_mtime < ruta_aristas.stat().st_mtime:
+        compilar_snapshot(ruta_aristas, ruta_snapshot, separador, encabezado)
+    return abrir_snapshot(ruta_snapshot)
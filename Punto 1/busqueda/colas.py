@@ -0,0 +1,140 @@
+from numbers import Integral
+
+# =============================================================================
+# COLAS DE PRIORIDAD CON DECREASE-KEY PARA UCS
+# =============================================================================
+
+# ucs() usa heapq con "borrado perezoso": cada mejora de costo agrega otra tupla
+# y las viejas se descartan al salir. Estas colas guardan una sola entrada por
+# nodo y la actualizan en su lugar, así que su tamaño nunca supera el número de
+# nodos descubiertos. No son más rápidas: heapq está en C y en todos los grafos
+# de benchmarks/colas_ucs.py le gana a ambas en tiempo; lo que ahorran es el
+# tamaño de la cola (y algo de memoria en grafos densos). Por eso ucs() sigue
+# usando heapq por defecto. Todas ofrecen la misma interfaz:
+#   cola.mejorar(nodo, prioridad)  -> inserta o baja la prioridad de nodo
+#   cola.extraer()                 -> (prioridad, nodo) mínimo
+#   len(cola)
+
+class HeapIndexado:
+    """Heap binario con un índice nodo -> posición para hacer decrease-key en O(log n).
+
+    Ordena por (prioridad, nodo), igual que las tuplas de ucs(), así que los
+    empates se rompen igual y los caminos son idénticos.
+    """
+
+    def __init__(self):
+        self.heap = []  # [prioridad, nodo]
+        self.posicion = {}  # nodo -> índice en heap
+
+    def __len__(self):
+        return len(self.heap)
+
+    def mejorar(self, nodo, prioridad):
+        i = self.posicion.get(nodo)
+        if i is None:
+            i = len(self.heap)
+            self.heap.append([prioridad, nodo])
+            self.posicion[nodo] = i
+        elif prioridad < self.heap[i][0]:
+            self.heap[i][0] = prioridad
+        else:
+            return
+        self._subir(i)
+
+    def extraer(self):
+        heap = self.heap
+        minimo = heap[0]
+        ultimo = heap.pop()
+        del self.posicion[minimo[1]]
+        if heap:
+            heap[0] = ultimo
+            self.posicion[ultimo[1]] = 0
+            self._bajar(0)
+        return minimo[0], minimo[1]
+
+    def _subir(self, i):
+        heap, posicion = self.heap, self.posicion
+        entrada = heap[i]
+        while i > 0:
+            padre = (i - 1) >> 1
+            if not entrada < heap[padre]:
+                break
+            heap[i] = heap[padre]
+            posicion[heap[i][1]] = i
+            i = padre
+        heap[i] = entrada
+        posicion[entrada[1]] = i
+
+    def _bajar(self, i):
+        heap, posicion = self.heap, self.posicion
+        n = len(heap)
+        entrada = heap[i]
+        while True:
+            hijo = 2 * i + 1
+            if hijo >= n:
+                break
+            if hijo + 1 < n and heap[hijo + 1] < heap[hijo]:
+                hijo += 1
+            if not heap[hijo] < entrada:
+                break
+            heap[i] = heap[hijo]
+            posicion[heap[i][1]] = i
+            i = hijo
+        heap[i] = entrada
+        posicion[entrada[1]] = i
+
+
+class ColaBuckets:
+    """Cola de Dial: un bucket por valor de costo entero, para costos pequeños como los de grafo_costo.
+
+    Como UCS extrae costos no decrecientes, el mínimo solo avanza y el siguiente
+    bucket no vacío está a lo sumo a "costo máximo de arista" pasos. Cada bucket
+    es un diccionario (orden de inserción), así que mover un nodo de bucket es
+    O(1). Dentro de un bucket sale primero el que entró primero, de modo que ante
+    empates el camino puede diferir del de ucs(), aunque el costo es el mismo.
+    """
+
+    def __init__(self):
+        self.buckets = {}  # prioridad -> {nodo: None}
+        self.prioridad = {}  # nodo -> prioridad actual
+        self.actual = 0  # Menor prioridad que todavía puede tener nodos
+
+    def __len__(self):
+        return len(self.prioridad)
+
+    def mejorar(self, nodo, prioridad):
+        if prioridad.__class__ is not int:  # Camino rápido para int; también acepta np.int64 y otros enteros
+            if not isinstance(prioridad, Integral) or isinstance(prioridad, bool):
+                raise TypeError(f"ColaBuckets necesita costos enteros, recibió {prioridad!r}")
+            prioridad = int(prioridad)
+        if prioridad < self.actual:
+            raise ValueError("ColaBuckets necesita costos no negativos (prioridades no decrecientes)")
+        anterior = self.prioridad.get(nodo)
+        if anterior is not None:
+            if prioridad >= anterior:
+                return
+            bucket = self.buckets[anterior]
+            del bucket[nodo]
+            if not bucket:
+                del self.buckets[anterior]
+        self.prioridad[nodo] = prioridad
+        bucket = self.buckets.get(prioridad)
+        if bucket is None:
+            bucket = self.buckets[prioridad] = {}
+        bucket[nodo] = None
+
+    def extraer(self):
+        if not self.prioridad:
+            raise IndexError("extraer de una cola vacía")
+        while self.actual not in self.buckets:
+            self.actual += 1
+        bucket = self.buckets[self.actual]
+        nodo = next(iter(bucket))
+        del bucket[nodo]
+        if not bucket:
+            del self.buckets[self.actual]
+        del self.prioridad[nodo]
+        return self.actual, nodo
+
+
+COLAS = {"indexada": HeapIndexado, "buckets": ColaBuckets}
@@ -0,0 +1,280 @@
+import heapq
+import random
+from array import array
+
+from .colas import COLAS
+from .grafos import grafo_inverso
+from .implicito import como_sucesores
+
+# =============================================================================
+# BÚSQUEDA DE COSTO UNIFORME (UCS), UCS BIDIRECCIONAL Y A*
+# =============================================================================
+
+def ucs(grafo, inicio, meta, estadisticas=None, cola="heapq"):
+    # cola="heapq" (por defecto) es la más rápida; "indexada" y "buckets" (colas con
+    # decrease-key) solo achican la cola, y en los grafos medidos son más lentas
+    if cola != "heapq":
+        return ucs_con_cola(grafo, inicio, meta, COLAS[cola](), estadisticas)
+
+    sucesores = como_sucesores(grafo, ponderado=True)  # Diccionario o función de sucesores
+    cola = [(0, inicio)]  # (costo, nodo)
+    visitados = set()
+    costo_acumulado = {inicio: 0}
+    padre = {inicio: None}
+
+    if estadisticas is not None:
+        estadisticas.iniciar("ucs")
+    
+    while cola:
+        costo, nodo = heapq.heappop(cola)
+        if nodo in visitados:
+            if estadisticas is not None:
+                estadisticas.duplicados += 1  # Entrada vieja del heap
+            continue
+        visitados.add(nodo)
+        if nodo == meta:
+            break
+        for vecino, costo_arista in sucesores(nodo):
+            nuevo_costo = costo + costo_arista
+            if vecino not in costo_acumulado or nuevo_costo < costo_acumulado[vecino]:
+                costo_acumulado[vecino] = nuevo_costo
+                heapq.heappush(cola, (nuevo_costo, vecino))
+                padre[vecino] = nodo
+        if estadisticas is not None:
+            estadisticas.frontera(len(cola))
+
+    if estadisticas is not None:
+        # La meta entra a visitados pero no se expande. Cada extracción fue un
+        # nodo visitado o un duplicado; cada inserción (salvo el inicio) ya se
+        # extrajo o sigue en la cola
+        expandidos = len(visitados) - (meta in visitados)
+        estadisticas.fin_expansion(expandidos, len(visitados) + estadisticas.duplicados + len(cola) - 1)
+        camino = reconstruir_camino(padre, meta)
+        estadisticas.fin_reconstruccion()
+        return camino, costo_acumulado.get(meta, float('inf'))
+    
+    return reconstruir_camino(padre, meta), costo_acumulado.get(meta, float('inf'))
+
+def ucs_con_cola(grafo, inicio, meta, cola, estadisticas=None):
+    # Mismo UCS, pero la cola (HeapIndexado o ColaBuckets) guarda una entrada por
+    # nodo y la mejora en su lugar: no hay entradas viejas ni duplicados
+    sucesores = como_sucesores(grafo, ponderado=True)
+    visitados = set()
+    costo_acumulado = {inicio: 0}
+    padre = {inicio: None}
+    generados = 0
+    cola.mejorar(inicio, 0)
+
+    if estadisticas is not None:
+        estadisticas.iniciar(f"ucs ({type(cola).__name__})")
+
+    while cola:
+        costo, nodo = cola.extraer()
+        visitados.add(nodo)
+        if nodo == meta:
+            break
+        for vecino, costo_arista in sucesores(nodo):
+            nuevo_costo = costo + costo_arista
+            if vecino not in costo_acumulado or nuevo_costo < costo_acumulado[vecino]:
+                costo_acumulado[vecino] = nuevo_costo
+                cola.mejorar(vecino, nuevo_costo)
+                padre[vecino] = nodo
+                generados += 1
+        if estadisticas is not None:
+            estadisticas.frontera(len(cola))
+
+    if estadisticas is not None:
+        estadisticas.fin_expansion(len(visitados) - (meta in visitados), generados)
+        camino = reconstruir_camino(padre, meta)
+        estadisticas.fin_reconstruccion()
+        return camino, costo_acumulado.get(meta, float('inf'))
+
+    return reconstruir_camino(padre, meta), costo_acumulado.get(meta, float('inf'))
+
+# Reconstruir el camino
+def reconstruir_camino(padre, meta):
+    camino = []
+    actual = meta
+    while actual is not None:
+        camino.append(actual)
+        actual = padre.get(actual)
+    return camino[::-1]  # Invertir el camino
+
+def ucs_bidireccional(grafo, inicio, meta, inverso=None):
+    # UCS desde inicio sobre el grafo y desde meta sobre el índice inverso. Siempre
+    # avanza el lado con menor costo en el tope de su cola y guarda en `mejor` el
+    # costo del mejor camino que une ambos lados. Se detiene cuando
+    # tope_adelante + tope_atras >= mejor: ningún camino pendiente puede mejorarlo.
+    # El costo es el mismo que el de ucs(); si hay varios caminos de costo mínimo,
+    # el camino puede ser otro de ellos (solo se garantiza el costo).
+    if inverso is None:
+        if not isinstance(grafo, dict):
+            raise TypeError("Un grafo implícito necesita su función de sucesores inversa")
+        inverso = grafo_inverso(grafo, ponderado=True)  # Se puede pasar para reutilizarlo entre consultas
+
+    grafos = (como_sucesores(grafo, ponderado=True), como_sucesores(inverso, ponderado=True))
+    colas = ([(0, inicio)], [(0, meta)])
+    visitados = (set(), set())
+    costo_acumulado = ({inicio: 0}, {meta: 0})
+    padre = ({inicio: None}, {meta: None})
+    mejor, encuentro = (0, meta) if inicio == meta else (float('inf'), None)
+
+    while colas[0] and colas[1]:
+        if colas[0][0][0] + colas[1][0][0] >= mejor:
+            break
+        lado = 0 if colas[0][0][0] <= colas[1][0][0] else 1
+        otro = 1 - lado
+
+        costo, nodo = heapq.heappop(colas[lado])
+        if nodo in visitados[lado]:
+            continue
+        visitados[lado].add(nodo)
+        for vecino, costo_arista in grafos[lado](nodo):
+            nuevo_costo = costo + costo_arista
+            if vecino not in costo_acumulado[lado] or nuevo_costo < costo_acumulado[lado][vecino]:
+                costo_acumulado[lado][vecino] = nuevo_costo
+                heapq.heappush(colas[lado], (nuevo_costo, vecino))
+                padre[lado][vecino] = nodo
+            if vecino in costo_acumulado[otro]:
+                total = costo_acumulado[lado][vecino] + costo_acumulado[otro][vecino]
+                if total < mejor:
+                    mejor, encuentro = total, vecino
+
+    if encuentro is None:
+        return [meta], float('inf')
+
+    hacia_meta = reconstruir_camino(padre[1], encuentro)[::-1]  # encuentro -> meta
+    return reconstruir_camino(padre[0], encuentro) + hacia_meta[1:], mejor
+
+def distancias_ucs(grafo, inicio):
+    # Barrido completo de UCS (Dijkstra) desde inicio: costo mínimo a cada nodo alcanzable
+    sucesores = como_sucesores(grafo, ponderado=True)
+    cola = [(0, inicio)]
+    costo_acumulado = {inicio: 0}
+    visitados = set()
+
+    while cola:
+        costo, nodo = heapq.heappop(cola)
+        if nodo in visitados:
+            continue
+        visitados.add(nodo)
+        for vecino, costo_arista in sucesores(nodo):
+            nuevo_costo = costo + costo_arista
+            if vecino not in costo_acumulado or nuevo_costo < costo_acumulado[vecino]:
+                costo_acumulado[vecino] = nuevo_costo
+                heapq.heappush(cola, (nuevo_costo, vecino))
+
+    return costo_acumulado
+
+def astar(grafo, inicio, meta, heuristica=None):
+    # UCS guiado por una heurística admisible h(nodo, meta) <= costo real restante.
+    # Sin heurística (h = 0) expande exactamente como ucs().
+    if heuristica is None:
+        heuristica = lambda nodo, meta: 0
+    sucesores = como_sucesores(grafo, ponderado=True)
+
+    cola = [(heuristica(inicio, meta), 0, inicio)]  # (costo + h, costo, nodo)
+    costo_acumulado = {inicio: 0}
+    padre = {inicio: None}
+
+    while cola:
+        _, costo, nodo = heapq.heappop(cola)
+        if costo > costo_acumulado[nodo]:
+            continue  # Entrada vieja: ya se encontró un camino mejor a este nodo
+        if nodo == meta:
+            break
+        for vecino, costo_arista in sucesores(nodo):
+            nuevo_costo = costo + costo_arista
+            if vecino not in costo_acumulado or nuevo_costo < costo_acumulado[vecino]:
+                costo_acumulado[vecino] = nuevo_costo
+                padre[vecino] = nodo
+                h = heuristica(vecino, meta)
+                if h != float('inf'):  # h infinita: desde el vecino no se llega a la meta
+                    heapq.heappush(cola, (nuevo_costo + h, nuevo_costo, vecino))
+
+    return reconstruir_camino(padre, meta), costo_acumulado.get(meta, float('inf'))
+
+class HeuristicaLandmarks:
+    """Heurística ALT (A*, Landmarks, desigualdad Triangular).
+
+    Para cada landmark L se precalculan d(L, v) y d(v, L) con barridos de UCS sobre
+    el grafo y su inverso. Por la desigualdad triangular,
+    d(v, meta) >= d(L, meta) - d(L, v) y d(v, meta) >= d(v, L) - d(meta, L),
+    así que el máximo de esas cotas es admisible (y consistente).
+    """
+
+    def __init__(self, grafo, landmarks):
+        inverso = grafo_inverso(grafo)
+        self.landmarks = list(landmarks)
+        self.desde = [distancias_ucs(grafo, l) for l in self.landmarks]  # d(L, v)
+        self.hacia = [distancias_ucs(inverso, l) for l in self.landmarks]  # d(v, L)
+
+    @classmethod
+    def elegir(cls, grafo, cantidad=4, semilla=0):
+        """Elige landmarks "lejanos": cada uno maximiza la distancia a los anteriores."""
+        inicio = random.Random(semilla).choice(list(grafo))
+        cercania = distancias_ucs(grafo, inicio)  # Distancia mínima al conjunto elegido
+        landmarks = []
+
+        for _ in range(cantidad):
+            candidatos = [nodo for nodo in cercania if nodo not in landmarks]
+            if not candidatos:
+                break
+            landmark = max(candidatos, key=cercania.get)
+            landmarks.append(landmark)
+            for nodo, d in distancias_ucs(grafo, landmark).items():
+                if d < cercania.get(nodo, float('inf')):
+                    cercania[nodo] = d
+
+        return cls(grafo, landmarks)
+
+    def __call__(self, nodo, meta):
+        inf = float('inf')
+        mejor = 0
+        for desde, hacia in zip(self.desde, self.hacia):
+            # Cota con distancias desde L: si L llega a v pero no a la meta, v tampoco
+            if nodo in desde:
+                cota = desde.get(meta, inf) - desde[nodo]
+                if cota > mejor:
+                    mejor = cota
+            # Cota con distancias hacia L: si la meta llega a L pero v no, v no llega a la meta
+            if meta in hacia:
+                cota = hacia.get(nodo, inf) - hacia[meta]
+                if cota > mejor:
+                    mejor = cota
+        return mejor
+
+def ucs_csr(grafo, inicio, meta):
+    # Misma búsqueda que ucs() pero sobre un GrafoCSR: costos y padres en arreglos
+    # indexados por id (padre -1 = nodo inicial, -2 = sin descubrir)
+    n = len(grafo)
+    s, m = grafo.indice.get(inicio, -1), grafo.indice.get(meta, -1)
+    if s < 0:  # Inicio desconocido: como ucs(), solo se llega a la meta si es el mismo nodo
+        return [meta], 0 if meta == inicio else float('inf')
+    offsets, destinos, costos = grafo.offsets, grafo.destinos, grafo.costos
+    cola = [(0, s)]  # (costo, nodo)
+    visitados = bytearray(n)
+    costo_acumulado = array('d', [float('inf')]) * n
+    costo_acumulado[s] = 0
+    padre = array('q', [-2]) * n
+    padre[s] = -1
+
+    while cola:
+        costo, nodo = heapq.heappop(cola)
+        if visitados[nodo]:
+            continue
+        visitados[nodo] = 1
+        if nodo == m:
+            break
+        for k in range(offsets[nodo], offsets[nodo + 1]):
+            vecino = destinos[k]
+            nuevo_costo = costo + costos[k]
+            if nuevo_costo < costo_acumulado[vecino]:
+                costo_acumulado[vecino] = nuevo_costo
+                heapq.heappush(cola, (nuevo_costo, vecino))
+                padre[vecino] = nodo
+
+    if m < 0:  # La meta no existe en el grafo
+        return [meta], float('inf')
+
+    return grafo.camino_etiquetas(padre, m), grafo.costo_desde_arreglo(costo_acumulado[m])
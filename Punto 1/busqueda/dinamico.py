@@ -0,0 +1,133 @@
+import heapq
+
+from .grafos import grafo_inverso
+
+# =============================================================================
+# CAMINO MÍNIMO DINÁMICO (LPA*): REPARAR EN VEZ DE RECALCULAR
+# =============================================================================
+
+INF = float('inf')
+
+
+class UCSDinamico:
+    """Camino mínimo de inicio a meta que se repara cuando cambian costos de aristas (LPA*).
+
+    Conserva entre actualizaciones `costo_acumulado` (g), `rhs` (el mejor costo
+    que ofrecen los predecesores según los g actuales) y `padre`. Un cambio en
+    u -> v solo recalcula rhs(v); la búsqueda vuelve a expandir únicamente los
+    nodos que quedaron inconsistentes (g != rhs) y que pueden afectar a la meta.
+    Sin heurística se comporta como UCS; con una heurística consistente, como
+    A*. El costo coincide siempre con ucs(); ante empates el camino puede ser
+    otro camino del mismo costo.
+
+    grafo debe ser un diccionario de tuplas (vecino, costo) (`grafo_costo`) y
+    se modifica en el lugar al actualizar aristas. Como en LPA*, los costos
+    deben ser positivos: con aristas de costo 0 los padres pueden formar ciclos.
+    """
+
+    def __init__(self, grafo, inicio, meta, heuristica=None):
+        for aristas in grafo.values():
+            for _, costo in aristas:
+                _verificar_costo(costo)
+        self.grafo = grafo
+        self.inverso = grafo_inverso(grafo, ponderado=True)
+        self.inicio = inicio
+        self.meta = meta
+        self.heuristica = heuristica or (lambda nodo, meta: 0)
+        self.costo_acumulado = {}  # g(nodo); ausente = infinito
+        self.rhs = {inicio: 0}
+        self.padre = {inicio: None}
+        self.cola = []  # (clave, nodo); entradas viejas se descartan al salir
+        self.en_cola = {}  # nodo -> clave vigente
+        self.expandidos = 0  # Acumulado de todas las reparaciones
+        self._encolar(inicio)
+        self._calcular()
+
+    def camino(self):
+        """(camino, costo) con el mismo formato que ucs(): ([meta], inf) si no hay camino."""
+        costo = self.costo_acumulado.get(self.meta, INF)
+        if costo == INF:
+            return [self.meta], INF
+        camino = []
+        actual = self.meta
+        while actual is not None:
+            camino.append(actual)
+            actual = self.padre[actual]
+        return camino[::-1], costo
+
+    def actualizar_arista(self, u, v, costo):
+        """Cambia (o agrega) el costo de u -> v y repara el camino."""
+        self.actualizar_aristas([(u, v, costo)])
+
+    update_edge = actualizar_arista
+
+    def actualizar_aristas(self, cambios):
+        """Aplica varios cambios (u, v, costo) y repara una sola vez al final."""
+        for u, v, costo in cambios:
+            _verificar_costo(costo)
+            _cambiar_costo(self.grafo.setdefault(u, []), v, costo)
+            _cambiar_costo(self.inverso.setdefault(v, []), u, costo)
+            self.inverso.setdefault(u, [])
+            self._actualizar_nodo(v)
+        self._calcular()
+
+    def _clave(self, nodo):
+        k = min(self.costo_acumulado.get(nodo, INF), self.rhs.get(nodo, INF))
+        return (k + self.heuristica(nodo, self.meta), k)
+
+    def _encolar(self, nodo):
+        clave = self._clave(nodo)
+        self.en_cola[nodo] = clave
+        heapq.heappush(self.cola, (clave, nodo))
+
+    def _actualizar_nodo(self, nodo):
+        # rhs(nodo) = min sobre los predecesores de g(u) + c(u, nodo)
+        if nodo != self.inicio:
+            mejor, mejor_padre = INF, None
+            for u, costo in self.inverso.get(nodo, ()):
+                candidato = self.costo_acumulado.get(u, INF) + costo
+                if candidato < mejor:
+                    mejor, mejor_padre = candidato, u
+            self.rhs[nodo] = mejor
+            self.padre[nodo] = mejor_padre
+        self.en_cola.pop(nodo, None)
+        if self.costo_acumulado.get(nodo, INF) != self.rhs.get(nodo, INF):
+            self._encolar(nodo)
+
+    def _calcular(self):
+        meta = self.meta
+        while self.cola:
+            clave, nodo = self.cola[0]
+            if self.en_cola.get(nodo) != clave:
+                heapq.heappop(self.cola)  # Entrada vieja
+                continue
+            # La meta es consistente y nada en la cola puede mejorarla
+            if clave >= self._clave(meta) and self.rhs.get(meta, INF) == self.costo_acumulado.get(meta, INF):
+                break
+            heapq.heappop(self.cola)
+            del self.en_cola[nodo]
+            self.expandidos += 1
+
+            g, rhs = self.costo_acumulado.get(nodo, INF), self.rhs.get(nodo, INF)
+            if g > rhs:  # Sobreconsistente: su costo bajó
+                self.costo_acumulado[nodo] = rhs
+                for vecino, _ in self.grafo.get(nodo, ()):
+                    self._actualizar_nodo(vecino)
+            else:  # Subconsistente: su costo subió, se invalida y se reevalúa
+                self.costo_acumulado[nodo] = INF
+                self._actualizar_nodo(nodo)
+                for vecino, _ in self.grafo.get(nodo, ()):
+                    self._actualizar_nodo(vecino)
+
+
+def _verificar_costo(costo):
+    if not costo > 0:
+        raise ValueError(f"UCSDinamico necesita costos positivos, recibió {costo!r}")
+
+
+def _cambiar_costo(aristas, vecino, costo):
+    for i, (otro, _) in enumerate(aristas):
+        if otro == vecino:
+            aristas[i] = (vecino, costo)
+            return
+    aristas.append((vecino, costo))
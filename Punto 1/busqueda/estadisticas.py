@@ -0,0 +1,65 @@
+import json
+import time
+
+# =============================================================================
+# ESTADÍSTICAS DE BÚSQUEDA (INSTRUMENTACIÓN OPCIONAL)
+# =============================================================================
+
+class EstadisticasBusqueda:
+    """Trabajo realizado por una búsqueda.
+
+    Se pasa como `estadisticas=` a bfs, bfs_padres, dfs_correcto o ucs y el
+    buscador la llena. Los contadores se derivan al final de las estructuras
+    que la búsqueda ya mantiene (visitados, padre, cola), así que durante la
+    búsqueda solo se registran los duplicados y el pico de la frontera; sin
+    estadísticas (None) el costo es una comparación por expansión.
+
+    - expandidos: nodos cuyos vecinos se recorrieron.
+    - generados: entradas agregadas a la frontera (sin contar el inicio).
+    - pico_frontera: tamaño máximo de la cola/pila.
+    - duplicados: entradas sacadas de la frontera que ya estaban visitadas
+      (por ejemplo, las entradas viejas del heap que ucs descarta).
+    - segundos_expansion / segundos_reconstruccion: tiempo de la búsqueda y
+      de la reconstrucción del camino.
+    """
+
+    CAMPOS = ("algoritmo", "expandidos", "generados", "pico_frontera", "duplicados",
+              "segundos_expansion", "segundos_reconstruccion")
+
+    def __init__(self):
+        self.algoritmo = None
+        self.expandidos = 0
+        self.generados = 0
+        self.pico_frontera = 0
+        self.duplicados = 0
+        self.segundos_expansion = 0.0
+        self.segundos_reconstruccion = 0.0
+        self._t0 = None
+
+    def iniciar(self, algoritmo):
+        self.algoritmo = algoritmo
+        self._t0 = time.perf_counter()
+
+    def frontera(self, tamano):
+        if tamano > self.pico_frontera:
+            self.pico_frontera = tamano
+
+    def fin_expansion(self, expandidos, generados):
+        t = time.perf_counter()
+        self.segundos_expansion = t - self._t0
+        self.expandidos = expandidos
+        self.generados = generados
+        self._t0 = t
+
+    def fin_reconstruccion(self):
+        self.segundos_reconstruccion = time.perf_counter() - self._t0
+
+    def a_dict(self):
+        return {campo: getattr(self, campo) for campo in self.CAMPOS}
+
+    def a_json(self, **opciones):
+        return json.dumps(self.a_dict(), **opciones)
+
+    def __repr__(self):
+        campos = ", ".join(f"{campo}={valor!r}" for campo, valor in self.a_dict().items())
+        return f"EstadisticasBusqueda({campos})"
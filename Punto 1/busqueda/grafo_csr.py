@@ -0,0 +1,109 @@
+from array import array
+
+from .grafos import es_ponderado
+
+
+def es_arreglo_entero(arreglo):
+    """True si el arreglo guarda enteros; sirve para array, memoryview y ndarray."""
+    tipo = getattr(arreglo, 'typecode', None) or getattr(arreglo, 'format', None) or arreglo.dtype.char
+    return tipo in 'bBhHiIlLqQ'
+
+
+# =============================================================================
+# GRAFO COMPACTO EN FORMATO CSR (COMPRESSED SPARSE ROW)
+# =============================================================================
+
+class GrafoCSR:
+    """Grafo dirigido con etiquetas internadas a enteros y aristas en arreglos contiguos.
+
+    Los vecinos del nodo u son destinos[offsets[u]:offsets[u + 1]] y sus costos
+    están en las mismas posiciones de `costos`. Las etiquetas solo se consultan
+    al entrar (inicio/meta) y al salir (reconstrucción del camino).
+    """
+
+    def __init__(self, etiquetas, offsets, destinos, costos, indice=None):
+        self.etiquetas = etiquetas  # id -> etiqueta
+        if indice is None:
+            indice = {etiqueta: i for i, etiqueta in enumerate(etiquetas)}
+        self.indice = indice  # etiqueta -> id
+        self.offsets = offsets  # array('q') de tamaño n + 1
+        self.destinos = destinos  # array('i') de tamaño m
+        self.costos = costos  # array('q') si todos los costos son enteros, si no array('d')
+        self.costos_enteros = es_arreglo_entero(costos)
+        self.ruta = None  # Archivo del snapshot si el grafo viene de abrir_snapshot()
+
+    @classmethod
+    def desde_dict(cls, grafo, ponderado=None):
+        """Construye el CSR a partir de los diccionarios del taller.
+
+        Acepta listas de vecinos (`graph` de BFS.py, costo 1 por arista) o listas
+        de tuplas (vecino, costo) (`grafo_costo` de DFS.py y UCS.py). Si
+        ponderado es None el formato se detecta con `es_ponderado`.
+        """
+        if ponderado is None:
+            ponderado = es_ponderado(grafo)
+        listas = {nodo: list(aristas) if ponderado else [(a, 1) for a in aristas]
+                  for nodo, aristas in grafo.items()}
+
+        # Nodos que solo aparecen como destino también reciben id
+        conocidas = dict.fromkeys(listas)
+        for aristas in listas.values():
+            conocidas.update((vecino, None) for vecino, _ in aristas)
+
+        # Los ids siguen el orden de las etiquetas: así los empates en el heap de
+        # UCS se resuelven igual que con las etiquetas originales
+        try:
+            etiquetas = sorted(conocidas)
+        except TypeError:
+            etiquetas = list(conocidas)
+        indice = {etiqueta: i for i, etiqueta in enumerate(etiquetas)}
+
+        offsets = array('q', [0])
+        destinos = array('i')
+        valores = []
+        for nodo in etiquetas:
+            for vecino, costo in listas.get(nodo, ()):
+                destinos.append(indice[vecino])
+                valores.append(costo)
+            offsets.append(len(destinos))
+
+        tipo = 'q' if all(isinstance(c, int) for c in valores) else 'd'
+        return cls(etiquetas, offsets, destinos, array(tipo, valores))
+
+    def __len__(self):
+        return len(self.etiquetas)
+
+    @property
+    def num_aristas(self):
+        return len(self.destinos)
+
+    def vecinos(self, u):
+        """Rango de posiciones de las aristas salientes de u en destinos/costos."""
+        return range(self.offsets[u], self.offsets[u + 1])
+
+    def sucesores(self, etiqueta):
+        """Pares (vecino, costo) con etiquetas, para usar el CSR con ucs(), bfs(), iddfs(), etc."""
+        u = self.indice.get(etiqueta)
+        if u is None:
+            return ()
+        etiquetas, destinos, costos = self.etiquetas, self.destinos, self.costos
+        return [(etiquetas[destinos[k]], costos[k]) for k in range(self.offsets[u], self.offsets[u + 1])]
+
+    def costo_desde_arreglo(self, valor):
+        """Convierte un costo acumulado en float al tipo de costo del grafo."""
+        if self.costos_enteros and valor != float('inf'):
+            return int(valor)
+        return valor
+
+    def camino_etiquetas(self, padre, meta):
+        """Reconstruye el camino hasta meta usando un arreglo de padres (-1 = raíz)."""
+        camino = []
+        actual = meta
+        while actual >= 0:
+            camino.append(self.etiquetas[actual])
+            actual = padre[actual]
+        return camino[::-1]
+
+    def memoria_bytes(self):
+        """Bytes ocupados por los arreglos de aristas (sin la tabla de etiquetas)."""
+        return sum(a.itemsize * len(a) for a in (self.offsets, self.destinos, self.costos))
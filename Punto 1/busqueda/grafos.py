@@ -0,0 +1,35 @@
+# =============================================================================
+# UTILIDADES SOBRE LOS GRAFOS EN FORMATO DE DICCIONARIO
+# =============================================================================
+
+def es_ponderado(grafo):
+    """True si las aristas son tuplas (vecino, costo) como en `grafo_costo`.
+
+    Se decide con la primera arista; si las etiquetas de los nodos son tuplas de
+    dos elementos el formato es ambiguo y conviene indicarlo explícitamente.
+    """
+    for aristas in grafo.values():
+        for arista in aristas:
+            return isinstance(arista, tuple)
+    return False
+
+
+def grafo_inverso(grafo, ponderado=None):
+    """Índice de adyacencia inverso: para cada nodo, quién llega a él.
+
+    Conserva el formato de entrada: listas de vecinos (`graph` de BFS.py) o
+    tuplas (vecino, costo) (`grafo_costo`). Todos los nodos, incluidos los que
+    solo aparecen como destino, quedan como clave.
+    """
+    if ponderado is None:
+        ponderado = es_ponderado(grafo)
+
+    inverso = {nodo: [] for nodo in grafo}
+    for nodo, aristas in grafo.items():
+        for arista in aristas:
+            if ponderado:
+                vecino, costo = arista
+                inverso.setdefault(vecino, []).append((nodo, costo))
+            else:
+                inverso.setdefault(arista, []).append(nodo)
+    return inverso
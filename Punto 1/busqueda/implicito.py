@@ -0,0 +1,77 @@
+from collections import OrderedDict
+
+from .grafos import es_ponderado
+
+# =============================================================================
+# GRAFOS IMPLÍCITOS: SUCESORES GENERADOS BAJO DEMANDA
+# =============================================================================
+
+# Los buscadores trabajan con una función sucesores(nodo) que devuelve (o va
+# generando) pares (vecino, costo). Así el espacio de estados no tiene que existir
+# como diccionario: solo se crea la parte que la búsqueda realmente explora.
+
+def como_sucesores(grafo, ponderado=None):
+    """Convierte cualquier grafo aceptado por los buscadores en una función de sucesores.
+
+    - Diccionario de tuplas (vecino, costo) (`grafo_costo`): se usa grafo.get.
+    - Diccionario de listas de vecinos (`graph` de BFS.py): cada vecino con costo 1.
+    - Objeto con método sucesores(nodo): se usa ese método.
+    - Cualquier función nodo -> iterable de (vecino, costo): se usa tal cual.
+    """
+    if isinstance(grafo, dict):
+        if ponderado is None:
+            ponderado = es_ponderado(grafo)
+        if ponderado:
+            return lambda nodo: grafo.get(nodo, ())
+        return lambda nodo: [(vecino, 1) for vecino in grafo.get(nodo, ())]
+    if hasattr(grafo, "sucesores"):
+        return grafo.sucesores
+    if callable(grafo):
+        return grafo
+    raise TypeError(f"No se puede obtener sucesores de {type(grafo).__name__}")
+
+
+def como_vecinos(grafo, ponderado=None):
+    """Como como_sucesores, pero devuelve solo los vecinos (sin costos), para BFS.
+
+    Con un diccionario de listas de vecinos no agrega ninguna tupla intermedia.
+    """
+    if isinstance(grafo, dict):
+        if ponderado is None:
+            ponderado = es_ponderado(grafo)
+        if not ponderado:
+            return lambda nodo: grafo.get(nodo, ())
+    sucesores = como_sucesores(grafo, ponderado)
+    return lambda nodo: (vecino for vecino, _ in sucesores(nodo))
+
+
+class SucesoresMemo:
+    """Envuelve una función de sucesores y recuerda los últimos `max_nodos` resultados.
+
+    Útil cuando generar los sucesores es caro y la búsqueda vuelve a pedir los
+    mismos nodos (por ejemplo, iddfs repite los niveles superiores en cada
+    iteración). La caché es LRU, así que la memoria queda acotada.
+    """
+
+    def __init__(self, sucesores, max_nodos=100_000, ponderado=None):
+        self.funcion = como_sucesores(sucesores, ponderado)
+        self.max_nodos = max_nodos
+        self.cache = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def sucesores(self, nodo):
+        resultado = self.cache.get(nodo)
+        if resultado is not None:
+            self.aciertos += 1
+            self.cache.move_to_end(nodo)
+            return resultado
+
+        self.fallos += 1
+        resultado = tuple(self.funcion(nodo))
+        self.cache[nodo] = resultado
+        if len(self.cache) > self.max_nodos:
+            self.cache.popitem(last=False)
+        return resultado
+
+    __call__ = sucesores
@@ -0,0 +1,244 @@
+import heapq
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .archivos import abrir_snapshot
+from .grafo_csr import GrafoCSR
+
+# =============================================================================
+# CONSULTAS EN LOTE: UN BARRIDO POR INICIO, REPARTIDO ENTRE PROCESOS
+# =============================================================================
+
+SIN_PADRE = -2  # Nodo no descubierto; -1 marca el nodo inicial
+
+# Barridos completos desde un inicio. Como ninguno depende de la meta hasta que
+# la encuentra, el arreglo de padres final contiene el mismo camino que
+# devolverían bfs_padres(), dfs_correcto() y ucs() para cualquier meta.
+
+def barrido_bfs(grafo, s):
+    offsets, destinos = grafo.offsets, grafo.destinos
+    padre = array('q', [SIN_PADRE]) * len(grafo)
+    padre[s] = -1
+    cola = deque([s])
+    while cola:
+        nodo = cola.popleft()
+        for k in range(offsets[nodo], offsets[nodo + 1]):
+            vecino = destinos[k]
+            if padre[vecino] == SIN_PADRE:
+                padre[vecino] = nodo
+                cola.append(vecino)
+    return padre
+
+
+def barrido_dfs(grafo, s):
+    offsets, destinos = grafo.offsets, grafo.destinos
+    visitados = bytearray(len(grafo))
+    padre = array('q', [SIN_PADRE]) * len(grafo)
+    padre[s] = -1
+    pila = [s]
+    while pila:
+        nodo = pila.pop()
+        if not visitados[nodo]:
+            visitados[nodo] = 1
+            for k in range(offsets[nodo], offsets[nodo + 1]):
+                vecino = destinos[k]
+                if not visitados[vecino]:
+                    pila.append(vecino)
+                    if padre[vecino] == SIN_PADRE:
+                        padre[vecino] = nodo
+    return padre
+
+
+def barrido_ucs(grafo, s):
+    offsets, destinos, costos = grafo.offsets, grafo.destinos, grafo.costos
+    visitados = bytearray(len(grafo))
+    costo_acumulado = array('d', [float('inf')]) * len(grafo)
+    costo_acumulado[s] = 0
+    padre = array('q', [SIN_PADRE]) * len(grafo)
+    padre[s] = -1
+    cola = [(0, s)]
+    while cola:
+        costo, nodo = heapq.heappop(cola)
+        if visitados[nodo]:
+            continue
+        visitados[nodo] = 1
+        for k in range(offsets[nodo], offsets[nodo + 1]):
+            vecino = destinos[k]
+            nuevo_costo = costo + costos[k]
+            if nuevo_costo < costo_acumulado[vecino]:
+                costo_acumulado[vecino] = nuevo_costo
+                heapq.heappush(cola, (nuevo_costo, vecino))
+                padre[vecino] = nodo
+    return padre, costo_acumulado
+
+
+def sin_inicio(algoritmo, inicio, metas):
+    """Lo que devuelven las funciones seriales cuando el inicio no es un nodo del grafo.
+
+    La búsqueda no sale del inicio: solo llega a la meta si es el mismo nodo.
+    """
+    if algoritmo == "bfs":
+        return ["Start and goal nodes are the same" if meta == inicio
+                else "No path found between start and goal" for meta in metas]
+    if algoritmo == "dfs":
+        return [([meta], 0) for meta in metas]
+    if algoritmo == "ucs":
+        return [([meta], 0 if meta == inicio else float('inf')) for meta in metas]
+    raise ValueError(f"Algoritmo desconocido: {algoritmo!r} (use 'bfs', 'dfs' o 'ucs')")
+
+
+def responder_inicio(grafo, algoritmo, inicio, metas):
+    """Resultados de algoritmo(grafo, inicio, meta) para cada meta, con un solo barrido.
+
+    Cada resultado tiene el mismo formato que la función serial: el camino (o el
+    mensaje) de bfs_padres, y (camino, costo) de dfs_correcto y ucs.
+    """
+    s = grafo.indice.get(inicio, -1)
+    if s < 0:
+        return sin_inicio(algoritmo, inicio, metas)
+    ids = [grafo.indice.get(meta, -1) for meta in metas]
+
+    if algoritmo == "bfs":
+        padre = barrido_bfs(grafo, s)
+        resultados = []
+        for meta, m in zip(metas, ids):
+            if meta == inicio:
+                resultados.append("Start and goal nodes are the same")
+            elif m < 0 or padre[m] == SIN_PADRE:
+                resultados.append("No path found between start and goal")
+            else:
+                resultados.append(grafo.camino_etiquetas(padre, m))
+        return resultados
+
+    if algoritmo == "dfs":
+        padre = barrido_dfs(grafo, s)
+        resultados = []
+        for meta, m in zip(metas, ids):
+            camino = grafo.camino_etiquetas(padre, m) if m >= 0 else [meta]
+            # Mismo cálculo de costo que dfs_correcto()
+            resultados.append((camino, len(camino) - 1 if camino[-1] == inicio else 0))
+        return resultados
+
+    if algoritmo == "ucs":
+        padre, costo_acumulado = barrido_ucs(grafo, s)
+        return [
+            (grafo.camino_etiquetas(padre, m), grafo.costo_desde_arreglo(costo_acumulado[m]))
+            if m >= 0 else ([meta], float('inf'))
+            for meta, m in zip(metas, ids)
+        ]
+
+    raise ValueError(f"Algoritmo desconocido: {algoritmo!r} (use 'bfs', 'dfs' o 'ucs')")
+
+
+def agrupar_por_inicio(consultas):
+    """{inicio: ([posiciones], [metas])} conservando el orden de llegada."""
+    grupos = {}
+    for posicion, (inicio, meta) in enumerate(consultas):
+        posiciones, metas = grupos.setdefault(inicio, ([], []))
+        posiciones.append(posicion)
+        metas.append(meta)
+    return grupos
+
+
+class GrafoCompartido:
+    """Copia los arreglos de un GrafoCSR a memoria compartida una sola vez.
+
+    Los procesos trabajadores se conectan por nombre (`adjuntar`) y leen los
+    mismos bloques sin copiarlos; solo la tabla de etiquetas viaja a cada
+    trabajador, una vez, al iniciarlo.
+    """
+
+    def __init__(self, grafo):
+        self.etiquetas = list(grafo.etiquetas)
+        self.bloques = []
+        self.descriptor = []  # (nombre del bloque, tipo, cantidad de elementos)
+        for arreglo in (grafo.offsets, grafo.destinos, grafo.costos):
+            datos = memoryview(arreglo).cast('B')
+            bloque = shared_memory.SharedMemory(create=True, size=max(datos.nbytes, 8))
+            bloque.buf[:datos.nbytes] = datos
+            self.bloques.append(bloque)
+            self.descriptor.append((bloque.name, memoryview(arreglo).format, len(arreglo)))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.cerrar()
+
+    def cerrar(self):
+        for bloque in self.bloques:
+            bloque.close()
+            bloque.unlink()
+        self.bloques = []
+
+
+def adjuntar(descriptor, etiquetas):
+    """GrafoCSR de solo lectura sobre los bloques compartidos creados por GrafoCompartido."""
+    bloques, arreglos = [], []
+    for nombre, tipo, cantidad in descriptor:
+        bloque = shared_memory.SharedMemory(name=nombre)
+        bloques.append(bloque)  # Mantener la referencia para que el bloque siga mapeado
+        vista = bloque.buf.cast(tipo)
+        arreglos.append(vista[:cantidad])
+    grafo = GrafoCSR(etiquetas, *arreglos)
+    grafo.bloques = bloques
+    return grafo
+
+
+_grafo_trabajador = None  # GrafoCSR adjuntado en cada proceso trabajador
+
+
+def _iniciar_trabajador(descriptor, etiquetas):
+    global _grafo_trabajador
+    _grafo_trabajador = adjuntar(descriptor, etiquetas)
+
+
+def _abrir_trabajador(ruta):
+    # Snapshot en disco: cada trabajador lo mapea y comparte las páginas del archivo
+    global _grafo_trabajador
+    _grafo_trabajador = abrir_snapshot(ruta)
+
+
+def _resolver_grupo(tarea):
+    algoritmo, inicio, metas = tarea
+    return responder_inicio(_grafo_trabajador, algoritmo, inicio, metas)
+
+
+def resolver_lote(grafo, consultas, algoritmo="ucs", procesos=None, ponderado=None):
+    """Resuelve una lista de (inicio, meta) con bfs, dfs o ucs.
+
+    Las consultas se agrupan por inicio (un barrido por inicio) y los grupos se
+    reparten en un ProcessPoolExecutor que lee el grafo desde memoria compartida
+    (o, si el grafo viene de abrir_snapshot, mapeando el mismo archivo).
+    grafo puede ser un diccionario del taller o un GrafoCSR. Devuelve los
+    resultados en el orden de las consultas, iguales a las llamadas seriales.
+    """
+    if not isinstance(grafo, GrafoCSR):
+        grafo = GrafoCSR.desde_dict(grafo, ponderado)
+    procesos = procesos or os.cpu_count() or 1
+
+    grupos = agrupar_por_inicio(consultas)
+    tareas = [(algoritmo, inicio, metas) for inicio, (_, metas) in grupos.items()]
+
+    if procesos == 1 or len(tareas) == 1:
+        respuestas = [responder_inicio(grafo, *tarea) for tarea in tareas]
+    elif grafo.ruta is not None:
+        with ProcessPoolExecutor(max_workers=procesos, initializer=_abrir_trabajador,
+                                 initargs=(grafo.ruta,)) as ejecutor:
+            respuestas = list(ejecutor.map(_resolver_grupo, tareas))
+    else:
+        with GrafoCompartido(grafo) as compartido, ProcessPoolExecutor(
+            max_workers=procesos,
+            initializer=_iniciar_trabajador,
+            initargs=(compartido.descriptor, compartido.etiquetas),
+        ) as ejecutor:
+            respuestas = list(ejecutor.map(_resolver_grupo, tareas))
+
+    resultados = [None] * len(consultas)
+    for (posiciones, _), respuesta in zip(grupos.values(), respuestas):
+        for posicion, resultado in zip(posiciones, respuesta):
+            resultados[posicion] = resultado
+    return resultados
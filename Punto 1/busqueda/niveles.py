@@ -0,0 +1,59 @@
+import numpy as np
+
+from .lotes import SIN_PADRE
+
+# =============================================================================
+# BFS POR NIVELES CON NUMPY: TODA LA FRONTERA EN CADA PASO
+# =============================================================================
+
+def bfs_niveles(grafo, inicio):
+    """Distancia en aristas y padre de todos los nodos de un GrafoCSR desde inicio.
+
+    Cada nivel se expande completo con operaciones de arreglos: se juntan los
+    vecinos de toda la frontera, se descartan los ya descubiertos y se asignan
+    los padres. inicio puede ser una etiqueta o una lista (BFS desde varias
+    fuentes). Devuelve (distancia, padre) indexados por id: distancia -1 si el
+    nodo no es alcanzable; padre -1 en las fuentes y -2 (SIN_PADRE) si no se
+    descubrió, igual que barrido_bfs. Los padres también coinciden con los de
+    barrido_bfs y bfs_padres, porque cada nodo toma al primero que lo alcanza
+    en el orden de la cola.
+    """
+    offsets = np.asarray(memoryview(grafo.offsets)).astype(np.int64, copy=False)
+    destinos = np.asarray(memoryview(grafo.destinos))
+    fuentes = [inicio] if not isinstance(inicio, list) else inicio
+    frontera = np.array(list(dict.fromkeys(grafo.indice[f] for f in fuentes)), dtype=np.int64)
+
+    distancia = np.full(len(grafo), -1, dtype=np.int64)
+    padre = np.full(len(grafo), SIN_PADRE, dtype=np.int64)
+    # Posición de la primera arista que alcanza a cada nodo en el nivel actual. Cada
+    # nodo participa en un solo nivel (el de su descubrimiento), así que no se reinicia
+    primero = np.full(len(grafo), np.iinfo(np.int64).max, dtype=np.int64)
+    distancia[frontera] = 0
+    padre[frontera] = -1
+
+    nivel = 0
+    while frontera.size:
+        # Posiciones de todas las aristas salientes de la frontera, en orden
+        comienzos = offsets[frontera]
+        largos = offsets[frontera + 1] - comienzos
+        total = int(largos.sum())
+        if total == 0:
+            break
+        desplazamiento = np.repeat(comienzos - (np.cumsum(largos) - largos), largos)
+        vecinos = destinos[desplazamiento + np.arange(total)].astype(np.int64, copy=False)
+        origenes = np.repeat(frontera, largos)
+
+        nuevos = distancia[vecinos] < 0
+        vecinos, origenes = vecinos[nuevos], origenes[nuevos]
+
+        # Primera aparición de cada vecino: es el padre que le asignaría la cola de BFS,
+        # y quedarse con ellas en orden deja la nueva frontera en el orden de la cola
+        posiciones = np.arange(vecinos.size)
+        np.minimum.at(primero, vecinos, posiciones)
+        primeros = primero[vecinos] == posiciones
+        frontera = vecinos[primeros]
+        nivel += 1
+        distancia[frontera] = nivel
+        padre[frontera] = origenes[primeros]
+
+    return distancia, padre
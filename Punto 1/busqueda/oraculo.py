@@ -0,0 +1,149 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import numpy as np
+
+from .grafo_csr import GrafoCSR
+from .lotes import GrafoCompartido, adjuntar, barrido_ucs
+
+# =============================================================================
+# ORÁCULO DE DISTANCIAS: UCS PRECALCULADO DESDE TODOS LOS NODOS (O UNOS HUBS)
+# =============================================================================
+
+class OraculoDistancias:
+    """Tablas de distancias y padres precalculadas para responder ucs() sin buscar.
+
+    La fila i corresponde al barrido de UCS desde fuentes[i]: distancias[i, v]
+    es el costo mínimo hasta v y padres[i, v] el nodo anterior en ese camino
+    (-1 en la fuente, -2 si v no es alcanzable). Con el padre, y no con el
+    "siguiente salto", el camino reconstruido es exactamente el de ucs(), en
+    O(longitud del camino).
+    """
+
+    def __init__(self, etiquetas, fuentes, distancias, padres, costos_enteros):
+        self.etiquetas = etiquetas  # id -> etiqueta
+        self.indice = {etiqueta: i for i, etiqueta in enumerate(etiquetas)}
+        self.fuentes = fuentes  # Etiquetas de las filas
+        self.fila = {fuente: i for i, fuente in enumerate(fuentes)}
+        self.distancias = distancias  # ndarray float64 (fuentes x nodos)
+        self.padres = padres  # ndarray int32 (fuentes x nodos)
+        self.costos_enteros = costos_enteros
+
+    @classmethod
+    def precalcular(cls, grafo, fuentes=None, procesos=None, ponderado=None):
+        """Corre UCS desde cada fuente (por defecto, todos los nodos) repartiendo las filas en procesos.
+
+        Los procesos leen el grafo de memoria compartida (GrafoCompartido) y
+        escriben sus filas directamente en las tablas compartidas.
+        """
+        if not isinstance(grafo, GrafoCSR):
+            grafo = GrafoCSR.desde_dict(grafo, ponderado)
+        fuentes = list(grafo.etiquetas) if fuentes is None else list(fuentes)
+        ids = [grafo.indice[fuente] for fuente in fuentes]
+        procesos = procesos or os.cpu_count() or 1
+        forma = (len(fuentes), len(grafo))
+
+        if procesos == 1 or len(fuentes) < 2:
+            distancias = np.empty(forma, np.float64)
+            padres = np.empty(forma, np.int32)
+            _llenar_filas(grafo, distancias, padres, list(enumerate(ids)))
+        else:
+            tablas = [shared_memory.SharedMemory(create=True, size=max(forma[0] * forma[1] * tamano_celda, 8))
+                      for tamano_celda in (8, 4)]  # float64 e int32
+            try:
+                # Bloques de filas pequeños para repartir bien la carga entre procesos
+                filas = list(enumerate(ids))
+                tamano = max(1, len(filas) // (procesos * 8))
+                tareas = [filas[i:i + tamano] for i in range(0, len(filas), tamano)]
+                with GrafoCompartido(grafo) as compartido, ProcessPoolExecutor(
+                    max_workers=procesos,
+                    initializer=_iniciar_trabajador,
+                    initargs=(compartido.descriptor, compartido.etiquetas, [t.name for t in tablas], forma),
+                ) as ejecutor:
+                    list(ejecutor.map(_llenar_tarea, tareas))
+                distancias = np.ndarray(forma, np.float64, buffer=tablas[0].buf).copy()
+                padres = np.ndarray(forma, np.int32, buffer=tablas[1].buf).copy()
+            finally:
+                for tabla in tablas:
+                    tabla.close()
+                    tabla.unlink()
+
+        return cls(list(grafo.etiquetas), fuentes, distancias, padres, grafo.costos_enteros)
+
+    def consultar(self, inicio, meta):
+        """(camino, costo) igual a ucs(grafo, inicio, meta); inicio debe ser una de las fuentes."""
+        fila = self.fila.get(inicio)
+        if fila is None:
+            raise KeyError(f"{inicio!r} no es una fuente del oráculo")
+        m = self.indice.get(meta)
+        if m is None or self.padres[fila, m] == -2:
+            return [meta], float('inf')
+
+        padres = self.padres[fila]
+        camino = []
+        actual = m
+        while actual >= 0:
+            camino.append(self.etiquetas[actual])
+            actual = int(padres[actual])
+        costo = float(self.distancias[fila, m])
+        return camino[::-1], int(costo) if self.costos_enteros else costo
+
+    def distancia(self, inicio, meta):
+        """Solo el costo, en O(1)."""
+        m = self.indice.get(meta)
+        if m is None:
+            return float('inf')
+        costo = float(self.distancias[self.fila[inicio], m])
+        return int(costo) if self.costos_enteros and costo != float('inf') else costo
+
+    def memoria_bytes(self):
+        return self.distancias.nbytes + self.padres.nbytes
+
+    def guardar(self, carpeta):
+        """Escribe las tablas como .npy y las etiquetas como JSON (etiquetas str o int)."""
+        carpeta = Path(carpeta)
+        carpeta.mkdir(parents=True, exist_ok=True)
+        np.save(carpeta / "distancias.npy", self.distancias)
+        np.save(carpeta / "padres.npy", self.padres)
+        with open(carpeta / "etiquetas.json", "w", encoding="utf-8") as archivo:
+            json.dump({"etiquetas": self.etiquetas, "fuentes": self.fuentes,
+                       "costos_enteros": self.costos_enteros}, archivo, ensure_ascii=False)
+
+    @classmethod
+    def cargar(cls, carpeta, mapear=True):
+        """Abre un oráculo guardado; con mapear=True las tablas se leen con np.load(mmap_mode='r')."""
+        carpeta = Path(carpeta)
+        modo = "r" if mapear else None
+        with open(carpeta / "etiquetas.json", encoding="utf-8") as archivo:
+            datos = json.load(archivo)
+        return cls(datos["etiquetas"], datos["fuentes"],
+                   np.load(carpeta / "distancias.npy", mmap_mode=modo),
+                   np.load(carpeta / "padres.npy", mmap_mode=modo),
+                   datos["costos_enteros"])
+
+
+def _llenar_filas(grafo, distancias, padres, filas):
+    for fila, s in filas:
+        padre, costo_acumulado = barrido_ucs(grafo, s)
+        distancias[fila] = np.frombuffer(costo_acumulado, np.float64)
+        padres[fila] = np.frombuffer(padre, np.int64)
+
+
+_estado_trabajador = None  # (grafo, distancias, padres, bloques) en cada proceso trabajador
+
+
+def _iniciar_trabajador(descriptor, etiquetas, nombres_tablas, forma):
+    global _estado_trabajador
+    grafo = adjuntar(descriptor, etiquetas)
+    bloques = [shared_memory.SharedMemory(name=nombre) for nombre in nombres_tablas]
+    distancias = np.ndarray(forma, np.float64, buffer=bloques[0].buf)
+    padres = np.ndarray(forma, np.int32, buffer=bloques[1].buf)
+    _estado_trabajador = (grafo, distancias, padres, bloques)
+
+
+def _llenar_tarea(filas):
+    grafo, distancias, padres, _ = _estado_trabajador
+    _llenar_filas(grafo, distancias, padres, filas)
@@ -0,0 +1,159 @@
+from array import array
+
+from .implicito import como_sucesores
+
+# =============================================================================
+# BÚSQUEDA EN PROFUNDIDAD (DFS, DFS LIMITADO E IDDFS)
+# =============================================================================
+
+def dfs_correcto(grafo, inicio, meta, estadisticas=None):
+    sucesores = como_sucesores(grafo, ponderado=True)  # Diccionario o función de sucesores
+    pila = [inicio]  # Usar LISTA como PILA
+    visitados = set()
+    padre = {inicio: None}  # Mejor usar None para el nodo inicial
+    encontrada = False
+
+    if estadisticas is not None:
+        estadisticas.iniciar("dfs_correcto")
+    
+    while pila:
+        nodo = pila.pop()  # Último en entrar, primero en salir (LIFO)
+        
+        if nodo == meta:
+            encontrada = True
+            break
+            
+        if nodo not in visitados:
+            visitados.add(nodo)
+            # Explorar vecinos en orden natural (no inverso)
+            for vecino, _ in sucesores(nodo):
+                if vecino not in visitados:
+                    pila.append(vecino)
+                    if vecino not in padre:  # Evitar sobrescribir padres
+                        padre[vecino] = nodo
+            if estadisticas is not None:
+                estadisticas.frontera(len(pila))
+        elif estadisticas is not None:
+            estadisticas.duplicados += 1
+
+    if estadisticas is not None:
+        # Cada extracción fue expansión, duplicado o la meta; cada inserción
+        # (salvo el inicio) ya se extrajo o sigue en la pila
+        extracciones = len(visitados) + estadisticas.duplicados + encontrada
+        estadisticas.fin_expansion(len(visitados), extracciones + len(pila) - 1)
+    
+    # Reconstruir camino
+    camino = []
+    actual = meta
+    while actual is not None:
+        camino.append(actual)
+        actual = padre.get(actual)
+    
+    # Calcular costo total (suma de costos unitarios)
+    costo = len(camino) - 1 if camino and camino[0] == inicio else 0
+
+    if estadisticas is not None:
+        estadisticas.fin_reconstruccion()
+    
+    return camino[::-1], costo
+
+def dfs_csr(grafo, inicio, meta):
+    # Misma búsqueda que dfs_correcto() pero sobre un GrafoCSR:
+    # padre = -1 para el nodo inicial y -2 para nodos aún no descubiertos
+    n = len(grafo)
+    s, m = grafo.indice.get(inicio, -1), grafo.indice.get(meta, -1)
+    if s < 0:  # Inicio desconocido: como dfs_correcto(), no hay nada que recorrer
+        return [meta], 0
+    offsets, destinos = grafo.offsets, grafo.destinos
+    pila = [s]
+    visitados = bytearray(n)
+    padre = array('q', [-2]) * n
+    padre[s] = -1
+
+    while pila:
+        nodo = pila.pop()
+
+        if nodo == m:
+            break
+
+        if not visitados[nodo]:
+            visitados[nodo] = 1
+            for k in range(offsets[nodo], offsets[nodo + 1]):
+                vecino = destinos[k]
+                if not visitados[vecino]:
+                    pila.append(vecino)
+                    if padre[vecino] == -2:
+                        padre[vecino] = nodo
+
+    if m < 0:  # La meta no existe en el grafo
+        return [meta], 0
+
+    # Reconstruir camino (mismo cálculo de costo que dfs_correcto)
+    camino = grafo.camino_etiquetas(padre, m)
+    costo = len(camino) - 1 if camino and camino[-1] == inicio else 0
+
+    return camino, costo
+
+def dfs_limitado(sucesores, inicio, meta, limite):
+    # DFS que no baja más de `limite` aristas. Solo guarda el camino actual (y un
+    # iterador de sucesores por nivel), sin `visitados` ni `padre` globales.
+    # sucesores(nodo) devuelve pares (vecino, costo); también acepta un diccionario.
+    sucesores = como_sucesores(sucesores, ponderado=True)
+    camino, costo, _ = _buscar_limitado(sucesores, inicio, meta, limite)
+    return (camino, costo) if camino is not None else ([meta], float('inf'))
+
+def iddfs(sucesores, inicio, meta, limite_maximo=None):
+    # Profundización iterativa: dfs_limitado con límite 0, 1, 2, ... Encuentra el
+    # camino con menos aristas usando memoria proporcional a su profundidad.
+    # Se detiene cuando ningún nodo quedó cortado por el límite (árbol agotado).
+    sucesores = como_sucesores(sucesores, ponderado=True)
+    limite = 0
+    while limite_maximo is None or limite <= limite_maximo:
+        camino, costo, cortado = _buscar_limitado(sucesores, inicio, meta, limite)
+        if camino is not None:
+            return camino, costo
+        if not cortado:
+            break
+        limite += 1
+    return [meta], float('inf')
+
+def _buscar_limitado(sucesores, inicio, meta, limite):
+    # Devuelve (camino, costo, cortado); cortado indica si algún nodo con
+    # sucesores se quedó sin expandir por el límite.
+    if inicio == meta:
+        return [inicio], 0, False
+    if limite == 0:
+        return None, None, _tiene_sucesores(sucesores, inicio)
+
+    camino = [inicio]
+    acumulado = [0]  # Costo acumulado hasta cada nodo del camino
+    en_camino = {inicio}  # Evita ciclos dentro del camino actual
+    iteradores = [iter(sucesores(inicio))]
+    cortado = False
+
+    while iteradores:
+        siguiente = next(iteradores[-1], None)
+        if siguiente is None:  # Nivel agotado: retroceder
+            iteradores.pop()
+            acumulado.pop()
+            en_camino.discard(camino.pop())
+            continue
+
+        vecino, costo_arista = siguiente
+        if vecino in en_camino:
+            continue
+        if vecino == meta:
+            return camino + [vecino], acumulado[-1] + costo_arista, cortado
+        if len(camino) == limite:  # El vecino está justo en el límite
+            cortado = cortado or _tiene_sucesores(sucesores, vecino)
+            continue
+
+        camino.append(vecino)
+        acumulado.append(acumulado[-1] + costo_arista)
+        en_camino.add(vecino)
+        iteradores.append(iter(sucesores(vecino)))
+
+    return None, None, cortado
+
+def _tiene_sucesores(sucesores, nodo):
+    return next(iter(sucesores(nodo)), None) is not None
@@ -0,0 +1,135 @@
+import heapq
+import sys
+from collections import OrderedDict
+
+from .implicito import como_sucesores
+
+# =============================================================================
+# CACHÉ DE ÁRBOLES DE CAMINOS MÍNIMOS PARA CONSULTAS REPETIDAS DE UCS
+# =============================================================================
+
+class ArbolUCS:
+    """Estado de un UCS desde `inicio` que se puede pausar y reanudar.
+
+    Guarda la cola, los nodos ya cerrados (visitados), `costo_acumulado` y `padre`
+    igual que ucs(). Como el orden de extracción del heap no depende de la meta,
+    reanudar la búsqueda produce exactamente el mismo camino que una llamada
+    nueva a ucs(grafo, inicio, meta).
+    """
+
+    def __init__(self, grafo, inicio):
+        self.sucesores = como_sucesores(grafo, ponderado=True)
+        self.inicio = inicio
+        self.cola = [(0, inicio)]  # (costo, nodo)
+        self.visitados = set()
+        self.costo_acumulado = {inicio: 0}
+        self.padre = {inicio: None}
+
+    def avanzar_hasta(self, meta):
+        """Expande nodos hasta cerrar meta o agotar la cola. Devuelve cuántos expandió."""
+        expandidos = 0
+        while meta not in self.visitados and self.cola:
+            costo, nodo = heapq.heappop(self.cola)
+            if nodo in self.visitados:
+                continue
+            self.visitados.add(nodo)
+            # A diferencia de ucs(), la meta también se expande: una consulta
+            # posterior reanuda desde aquí y necesita sus vecinos en la cola
+            expandidos += 1
+            for vecino, costo_arista in self.sucesores(nodo):
+                nuevo_costo = costo + costo_arista
+                if vecino not in self.costo_acumulado or nuevo_costo < self.costo_acumulado[vecino]:
+                    self.costo_acumulado[vecino] = nuevo_costo
+                    heapq.heappush(self.cola, (nuevo_costo, vecino))
+                    self.padre[vecino] = nodo
+        return expandidos
+
+    def camino(self, meta):
+        """(camino, costo) hasta meta en O(longitud del camino); meta debe estar cerrada
+        o la cola agotada (si no hay camino devuelve ([meta], inf) como ucs())."""
+        if meta not in self.visitados:
+            return [meta], float('inf')
+        camino = []
+        actual = meta
+        while actual is not None:
+            camino.append(actual)
+            actual = self.padre[actual]
+        return camino[::-1], self.costo_acumulado[meta]
+
+    def afectado_por(self, u, v, costo_nuevo):
+        """True si cambiar el costo de u -> v puede alterar lo ya calculado.
+
+        Si u todavía no se expandió, la arista no se ha leído y la búsqueda verá el
+        costo nuevo al reanudarse. Si ya se expandió, importa cuando la arista
+        sostiene el padre de v o cuando ahora ofrece un camino igual o mejor a v.
+        """
+        if u not in self.visitados:
+            return False
+        if self.padre.get(v) == u:
+            return True
+        return self.costo_acumulado[u] + costo_nuevo <= self.costo_acumulado.get(v, float('inf'))
+
+    def memoria_bytes(self):
+        """Tamaño aproximado de las estructuras (tablas hash y cola), calculado en O(1)."""
+        return sum(sys.getsizeof(x) for x in (self.cola, self.visitados, self.costo_acumulado, self.padre))
+
+
+class ServicioUCS:
+    """Responde consultas ucs(grafo, inicio, meta) reutilizando el árbol de cada inicio.
+
+    Los árboles se guardan en una caché LRU limitada por `max_bytes`: una meta ya
+    cerrada se responde sin buscar, una meta nueva reanuda la expansión desde
+    donde quedó y, si se supera el límite, se descartan los árboles menos usados.
+    """
+
+    def __init__(self, grafo, max_bytes=256 * 2**20):
+        self.grafo = grafo
+        self.max_bytes = max_bytes
+        self.arboles = OrderedDict()  # inicio -> ArbolUCS, del menos al más reciente
+        self.aciertos = 0  # Meta ya cerrada en la caché
+        self.reanudaciones = 0  # Árbol en caché, pero hubo que seguir expandiendo
+        self.fallos = 0  # Árbol construido desde cero
+
+    def consultar(self, inicio, meta):
+        arbol = self.arboles.get(inicio)
+        if arbol is None:
+            self.fallos += 1
+            arbol = self.arboles[inicio] = ArbolUCS(self.grafo, inicio)
+        elif meta in arbol.visitados:
+            self.aciertos += 1
+        else:
+            self.reanudaciones += 1
+        self.arboles.move_to_end(inicio)
+
+        arbol.avanzar_hasta(meta)
+        resultado = arbol.camino(meta)
+        self._respetar_limite()
+        return resultado
+
+    def actualizar_arista(self, u, v, costo):
+        """Cambia (o agrega) el costo de la arista u -> v e invalida los árboles afectados."""
+        aristas = self.grafo.setdefault(u, [])
+        for i, (vecino, _) in enumerate(aristas):
+            if vecino == v:
+                aristas[i] = (v, costo)
+                break
+        else:
+            aristas.append((v, costo))
+
+        for inicio in [i for i, arbol in self.arboles.items() if arbol.afectado_por(u, v, costo)]:
+            del self.arboles[inicio]
+
+    def invalidar(self, inicio=None):
+        """Descarta el árbol de `inicio`, o todos si el grafo cambió por fuera del servicio."""
+        if inicio is None:
+            self.arboles.clear()
+        else:
+            self.arboles.pop(inicio, None)
+
+    def memoria_bytes(self):
+        return sum(arbol.memoria_bytes() for arbol in self.arboles.values())
+
+    def _respetar_limite(self):
+        # Siempre se conserva el árbol más reciente, aunque solo supere el límite
+        while len(self.arboles) > 1 and self.memoria_bytes() > self.max_bytes:
+            self.arboles.popitem(last=False)
@@ -0,0 +1,78 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+from scipy.signal import periodogram
+
+PUNTO_2 = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PUNTO_2))  # Paquete sensores
+
+from datos_sinteticos import tabla_voltajes
+from sensores import BANDAS, cargar_sensores, filtrar_matriz
+from sensores.caracteristicas import LARGO_VENTANA, PASO, caracteristicas, procesar_carpeta
+
+# =============================================================================
+# BENCHMARK: CARACTERÍSTICAS POR VENTANA, BUCLE POR VENTANA VS VECTORIZADO Y EN PARALELO
+# =============================================================================
+
+def caracteristicas_por_ventana(matriz, fs=100.0, largo=LARGO_VENTANA, paso=PASO):
+    """Lo que habría que hacer a mano: un periodograma y las cuentas por cada ventana y sensor."""
+    filas = []
+    for inicio in range(0, len(matriz) - largo + 1, paso):
+        for j in range(matriz.shape[1]):
+            x = matriz[inicio:inicio + largo, j]
+            centrada = x - x.mean()
+            f, psd = periodogram(x, fs, window="hann", detrend="constant")
+            filas.append([np.sqrt((x ** 2).mean()), np.abs(x).mean(), (np.diff(np.signbit(centrada)) != 0).sum(),
+                          (f * psd).sum() / psd.sum(),
+                          *(psd[(f >= a) & (f < b)].sum() * (f[1] - f[0]) for a, b in BANDAS.values())])
+    return np.array(filas)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Características de una carpeta: bucle vs vectorizado vs paralelo")
+    parser.add_argument("--archivos", type=int, default=8)
+    parser.add_argument("--muestras", type=int, default=50_000)
+    parser.add_argument("--sensores", type=int, default=16)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        carpeta = Path(carpeta)
+        for i in range(args.archivos):
+            tabla_voltajes(args.muestras, args.sensores, semilla=i) \
+                .to_csv(carpeta / f"sesion_{i}.csv", header=False, index=False)
+        procesar_carpeta(carpeta, carpeta / "salida", procesos=1)  # Deja listo el cache Parquet de cada CSV
+
+        df, _ = cargar_sensores(carpeta / "sesion_0.csv")
+        matriz = filtrar_matriz(df.select(pl.all().fill_null(0.0)).to_numpy())
+        t0 = time.perf_counter()
+        referencia = caracteristicas_por_ventana(matriz)
+        t_bucle = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        tabla = caracteristicas(matriz, df.columns)
+        t_vector = time.perf_counter() - t0
+        diferencia = np.abs(tabla.drop("ventana", "inicio", "tiempo_s", "sensor").to_numpy() - referencia).max()
+        assert diferencia < 1e-9, f"las características vectorizadas difieren en {diferencia}"
+
+        t0 = time.perf_counter()
+        procesar_carpeta(carpeta, carpeta / "salida", procesos=1)
+        t_serie = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        procesar_carpeta(carpeta, carpeta / "salida", procesos=os.cpu_count())
+        t_paralelo = time.perf_counter() - t0
+
+    print(f"{args.archivos} grabaciones de {args.muestras} muestras x {args.sensores} sensores, "
+          f"ventanas de {LARGO_VENTANA} cada {PASO}, {os.cpu_count()} CPU")
+    print(f"  una grabación, bucle por ventana:  {t_bucle:8.2f} s")
+    print(f"  una grabación, vectorizado:        {t_vector:8.2f} s  ({t_bucle / t_vector:.0f}x)")
+    print(f"  carpeta completa, un proceso:      {t_serie:8.2f} s  (lectura + filtro + Parquet)")
+    print(f"  carpeta completa, un proceso/CPU:  {t_paralelo:8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
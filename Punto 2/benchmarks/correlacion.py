@@ -0,0 +1,90 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+
+PUNTO_2 = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PUNTO_2))  # Paquete sensores
+
+from datos_sinteticos import senales
+from sensores import AcumuladorCorrelacion, correlacion_movil
+
+# =============================================================================
+# BENCHMARK: MATRIZ DE CORRELACIÓN, PANDAS VS SUMAS POR PARES VS MOMENTOS INCREMENTALES
+# =============================================================================
+
+def sumas_por_pares(matriz, filas_por_bloque):
+    """El acumulador anterior: cuatro productos de matrices con la máscara por bloque, aunque no haya NaN."""
+    k = matriz.shape[1]
+    n, suma, cuadrados, productos = (np.zeros((k, k)) for _ in range(4))
+    referencia = np.nanmean(matriz[:filas_por_bloque], axis=0)
+    for inicio in range(0, len(matriz), filas_por_bloque):
+        bloque = matriz[inicio:inicio + filas_por_bloque]
+        presente = ~np.isnan(bloque)
+        m = presente.astype(np.float64)
+        x = np.where(presente, bloque - referencia, 0.0)
+        n += m.T @ m
+        suma += x.T @ m
+        cuadrados += (x * x).T @ m
+        productos += x.T @ x
+    covarianza = productos - suma * suma.T / n
+    varianza = cuadrados - suma ** 2 / n
+    return covarianza / np.sqrt(varianza * varianza.T)
+
+
+def incremental(matriz, filas_por_bloque, dtype):
+    acumulador = AcumuladorCorrelacion(matriz.shape[1], dtype)
+    for inicio in range(0, len(matriz), filas_por_bloque):
+        acumulador.agregar(matriz[inicio:inicio + filas_por_bloque])
+    return acumulador.matriz()
+
+
+def mejor_tiempo(funcion, repeticiones):
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        resultado = funcion()
+        mejor = min(mejor, time.perf_counter() - t0)
+    return mejor, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Matriz de correlación: pandas vs sumas por pares vs incremental")
+    parser.add_argument("--muestras", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--sensores", type=int, default=61)
+    parser.add_argument("--filas-por-bloque", type=int, default=100_000)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{args.sensores} sensores, bloques de {args.filas_por_bloque} filas, mejor de {args.repeticiones} (ms)")
+    print(f"  {'muestras':>9} {'pandas corr':>12} {'sumas x par':>12} {'incr. f64':>10} {'incr. f32':>10} "
+          f"{'+100 muestras':>14} {'móvil 5 s':>10}")
+    for n_muestras in args.muestras:
+        df = pl.DataFrame(senales(n_muestras, args.sensores),
+                          schema=[f"Sensor_{j + 1}" for j in range(args.sensores)], orient="row")
+        matriz = df.to_numpy()
+
+        t_pandas, referencia = mejor_tiempo(lambda: df.to_pandas().corr().to_numpy(), args.repeticiones)
+        t_pares, _ = mejor_tiempo(lambda: sumas_por_pares(matriz, args.filas_por_bloque), args.repeticiones)
+        t_f64, r64 = mejor_tiempo(lambda: incremental(matriz, args.filas_por_bloque, np.float64), args.repeticiones)
+        t_f32, r32 = mejor_tiempo(lambda: incremental(matriz, args.filas_por_bloque, np.float32), args.repeticiones)
+        assert np.abs(r64 - referencia).max() < 1e-12 and np.abs(r32 - referencia).max() < 1e-4
+
+        # Actualizar la matriz ya calculada con 100 muestras nuevas (1 s a 100 Hz)
+        acumulador = AcumuladorCorrelacion(args.sensores)
+        acumulador.agregar(matriz)
+        nuevas = matriz[:100]
+        t_nuevas, _ = mejor_tiempo(lambda: (acumulador.agregar(nuevas), acumulador.matriz()), args.repeticiones)
+
+        # Correlación móvil de un par en ventanas de 5 s cada 1.25 s (lo que grafica el dashboard)
+        par = matriz[:min(n_muestras, 100_000), :2]
+        t_movil, _ = mejor_tiempo(lambda: correlacion_movil(par, 500, 125), args.repeticiones)
+        print(f"  {n_muestras:>9} {1000 * t_pandas:>12.1f} {1000 * t_pares:>12.1f} {1000 * t_f64:>10.1f} "
+              f"{1000 * t_f32:>10.1f} {1000 * t_nuevas:>14.2f} {1000 * t_movil:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
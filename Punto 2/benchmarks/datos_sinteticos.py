@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+# =============================================================================
+# SEÑALES SINTÉTICAS CON EL FORMATO DE BD_SENSORES.xlsx PARA LOS BENCHMARKS
+# =============================================================================
+
+def senales(n_muestras, n_sensores, semilla=0, fs=100.0):
+    """Matriz (muestras x sensores) en voltios: un par de senos por sensor más ruido."""
+    rng = np.random.default_rng(semilla)
+    t = np.arange(n_muestras)[:, None] / fs
+    frecuencias = rng.uniform(0.5, 12.0, size=(2, n_sensores))
+    amplitudes = rng.uniform(0.05, 0.4, size=(2, n_sensores))
+    base = rng.uniform(0.5, 2.0, size=n_sensores)
+    matriz = base + sum(a * np.sin(2 * np.pi * f * t) for a, f in zip(amplitudes, frecuencias))
+    return matriz + rng.normal(0, 0.05, size=matriz.shape)
+
+
+def tabla_voltajes(n_muestras, n_sensores, semilla=0, filas_encabezado=1, fraccion_invalida=0.001):
+    """DataFrame de texto como el que se lee del Excel: "1.66V", celdas vacías, "ERR" y encabezados."""
+    rng = np.random.default_rng(semilla)
+    matriz = senales(n_muestras, n_sensores, semilla)
+    texto = np.char.add(np.char.mod("%.2f", matriz), "V").astype(object)
+    texto[rng.random(texto.shape) < fraccion_invalida] = "ERR"
+    texto[rng.random(texto.shape) < fraccion_invalida] = None
+    texto[rng.integers(0, n_muestras, size=max(1, n_muestras // 1000))] = None  # Filas vacías
+    encabezado = np.array([[f"Canal {j + 1}" for j in range(n_sensores)]] * filas_encabezado, dtype=object)
+    return pd.DataFrame(np.vstack([encabezado, texto]))
+
+
+def escribir_excel(ruta, n_muestras, n_sensores, semilla=0):
+    tabla_voltajes(n_muestras, n_sensores, semilla).to_excel(ruta, header=False, index=False)
@@ -0,0 +1,76 @@
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+from scipy.signal import welch
+
+PUNTO_2 = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PUNTO_2))  # Paquete sensores
+
+from datos_sinteticos import senales
+from sensores import densidad_espectral, espectro, espectrograma, huella_datos
+
+# =============================================================================
+# BENCHMARK: ESPECTROS POR SENSOR EN CADA RERUN VS EN LOTE Y CACHEADOS
+# =============================================================================
+
+def fft_por_sensor(matriz):
+    """El cálculo anterior, repetido para cada sensor: fft compleja completa y la mitad positiva."""
+    espectros = []
+    for j in range(matriz.shape[1]):
+        señal = np.nan_to_num(matriz[:, j], nan=0.0)
+        espectros.append(np.abs(np.fft.fft(señal)[:len(señal) // 2]))
+    return espectros
+
+
+def mejor_tiempo(funcion, repeticiones):
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        resultado = funcion()
+        mejor = min(mejor, time.perf_counter() - t0)
+    return mejor, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Espectros de todos los sensores: por sensor vs lote vs cache")
+    parser.add_argument("--muestras", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--sensores", type=int, default=61)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{args.sensores} sensores, mejor de {args.repeticiones} repeticiones (ms)")
+    print(f"  {'muestras':>9} {'fft x sensor':>13} {'rfft lote':>10} {'con cache':>10} {'STFT lote':>10} "
+          f"{'Welch bloques':>14}")
+    with tempfile.TemporaryDirectory() as carpeta:
+        for n_muestras in args.muestras:
+            df = pl.DataFrame(senales(n_muestras, args.sensores),
+                              schema=[f"Sensor_{j + 1}" for j in range(args.sensores)], orient="row")
+            matriz = df.to_numpy()  # Lo que recibe espectro() en el dashboard
+            ruta = Path(carpeta) / f"sensores_{n_muestras}.parquet"
+            df.write_parquet(ruta)
+
+            t_anterior, anterior = mejor_tiempo(lambda: fft_por_sensor(matriz), args.repeticiones)
+            t_lote, (_, magnitudes) = mejor_tiempo(lambda: espectro(matriz), args.repeticiones)
+            # Un rerun con cache solo calcula la huella de la ventana y busca el resultado (como st.cache_data)
+            cache = {huella_datos(df): magnitudes}
+            t_cache, _ = mejor_tiempo(lambda: cache[huella_datos(df)], args.repeticiones)
+            t_stft, _ = mejor_tiempo(lambda: espectrograma(matriz), args.repeticiones)
+            t_welch, (frecuencias, psd) = mejor_tiempo(
+                lambda: densidad_espectral(pl.scan_parquet(ruta)), args.repeticiones
+            )
+
+            diferencia = max(np.abs(a - magnitudes[:len(a), j]).max() for j, a in enumerate(anterior))
+            assert diferencia < 1e-6 * magnitudes.max(), f"rfft difiere de fft en {diferencia}"
+            _, referencia = welch(matriz, 100.0, nperseg=256, axis=0)
+            assert np.allclose(psd, referencia, rtol=1e-9, atol=0), "Welch por bloques difiere de scipy"
+            print(f"  {n_muestras:>9} {1000 * t_anterior:>13.1f} {1000 * t_lote:>10.1f} {1000 * t_cache:>10.2f} "
+                  f"{1000 * t_stft:>10.1f} {1000 * t_welch:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
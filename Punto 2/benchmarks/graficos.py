@@ -0,0 +1,60 @@
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+
+PUNTO_2 = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PUNTO_2))  # Paquete sensores
+
+from datos_sinteticos import senales
+from sensores import serie_reducida
+
+# =============================================================================
+# BENCHMARK: PUNTOS QUE SE MANDAN AL NAVEGADOR, COMPLETOS VS REDUCIDOS (MIN-MAX + LTTB)
+# =============================================================================
+
+# Bytes por punto en la figura: x e y como float64 (plotly los manda como arreglos binarios)
+BYTES_POR_PUNTO = 16
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Graficar señales largas: completas vs reducidas a un presupuesto")
+    parser.add_argument("--muestras", type=int, nargs="+", default=[100_000, 1_000_000, 10_000_000])
+    parser.add_argument("--sensores", type=int, default=8)
+    parser.add_argument("--puntos", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{args.sensores} sensores, presupuesto de {args.puntos} puntos por traza")
+    print(f"  {'muestras':>10} {'MB completo':>12} {'MB reducido':>12} {'ms reducir':>11} {'ms acercar 1%':>14}")
+    with tempfile.TemporaryDirectory() as carpeta:
+        for n_muestras in args.muestras:
+            ruta = Path(carpeta) / f"sensores_{n_muestras}.parquet"
+            matriz = senales(n_muestras, args.sensores)
+            matriz[n_muestras // 3, 0] += 5.0  # Un pico aislado que no se puede perder
+            pl.DataFrame(matriz, schema=[f"Sensor_{j + 1}" for j in range(args.sensores)], orient="row") \
+              .write_parquet(ruta)
+            maximo = matriz[:, 0].max()
+            del matriz
+            lf = pl.scan_parquet(ruta)
+
+            t0 = time.perf_counter()
+            x, y = serie_reducida(lf, "Sensor_1", 0, n_muestras, args.puntos)
+            t_reducir = time.perf_counter() - t0
+            assert len(x) <= args.puntos and y.max() == maximo, "la reducción perdió el pico"
+
+            # Acercarse a un 1 % del rango alrededor del pico: se vuelve a leer solo ese tramo
+            inicio = max(0, n_muestras // 3 - n_muestras // 200)
+            t0 = time.perf_counter()
+            serie_reducida(lf, "Sensor_1", inicio, inicio + n_muestras // 100, args.puntos)
+            t_acercar = time.perf_counter() - t0
+
+            print(f"  {n_muestras:>10} {n_muestras * BYTES_POR_PUNTO / 1e6:>12.1f} "
+                  f"{len(x) * BYTES_POR_PUNTO / 1e6:>12.3f} {1000 * t_reducir:>11.1f} {1000 * t_acercar:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import polars as pl
+import pyarrow.parquet as pq
+
+PUNTO_2 = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PUNTO_2))  # Paquete sensores
+
+from datos_sinteticos import senales
+from sensores import contar_filas, correlacion, describir, histograma, ventana
+
+# =============================================================================
+# BENCHMARK: MEMORIA DE LAS ESTADÍSTICAS EN STREAMING vs CARGAR TODO
+# =============================================================================
+
+# Ejemplo (desde la carpeta benchmarks):
+#   python ingesta_streaming.py --muestras 2000000 8000000 --sensores 16
+
+def escribir_grabacion(ruta, n_muestras, n_sensores, filas_por_bloque=500_000):
+    """Parquet sintético escrito por bloques, sin tener nunca la grabación completa en memoria."""
+    escritor = None
+    for inicio in range(0, n_muestras, filas_por_bloque):
+        largo = min(filas_por_bloque, n_muestras - inicio)
+        bloque = pl.DataFrame(senales(largo, n_sensores, semilla=inicio),
+                              schema=[f"Sensor_{j + 1}" for j in range(n_sensores)]).to_arrow()
+        if escritor is None:
+            escritor = pq.ParquetWriter(ruta, bloque.schema)
+        escritor.write_table(bloque)
+    escritor.close()
+
+
+def pico_rss_mb():
+    # VmHWM y no ru_maxrss: este último conserva el pico del proceso padre al hacer fork
+    with open("/proc/self/status") as archivo:
+        for linea in archivo:
+            if linea.startswith("VmHWM:"):
+                return int(linea.split()[1]) / 1024
+    return float('nan')
+
+
+def medir(ruta, modo):
+    """Corre en este proceso (nuevo) las consultas del dashboard e imprime segundos y pico de RSS."""
+    lf = pl.scan_parquet(ruta)
+    t0 = time.perf_counter()
+    if modo == "completo":
+        df = pl.read_parquet(ruta)
+        df.describe()
+        df.to_pandas().corr()
+        df["Sensor_1"].to_numpy()
+        muestras = len(df)
+    else:
+        muestras = contar_filas(lf)
+        describir(lf)
+        correlacion(lf)
+        histograma(lf, "Sensor_1")
+        ventana(lf, muestras // 2, 100_000)
+    segundos = time.perf_counter() - t0
+    pico_mb = pico_rss_mb()
+    print(f"{modo} {muestras} {segundos:.2f} {pico_mb:.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pico de memoria: estadísticas en streaming vs DataFrame completo")
+    parser.add_argument("--muestras", type=int, nargs="+", default=[1_000_000, 4_000_000])
+    parser.add_argument("--sensores", type=int, default=16)
+    parser.add_argument("--carpeta", default=".")
+    parser.add_argument("--medir", nargs=2, metavar=("RUTA", "MODO"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.medir:
+        medir(*args.medir)
+        return
+
+    print(f"{args.sensores} sensores; cada modo en un proceso nuevo")
+    print(f"  {'muestras':>9} {'MB en disco':>12} {'modo':<10} {'segundos':>9} {'pico RSS (MB)':>14}")
+    for n_muestras in args.muestras:
+        ruta = Path(args.carpeta) / f"grabacion_{n_muestras}.parquet"
+        escribir_grabacion(ruta, n_muestras, args.sensores)
+        for modo in ("completo", "streaming"):
+            salida = subprocess.run([sys.executable, __file__, "--medir", str(ruta), modo],
+                                    capture_output=True, text=True, check=True).stdout.split()
+            print(f"  {n_muestras:>9} {ruta.stat().st_size / 2**20:>12.1f} {modo:<10} "
+                  f"{float(salida[2]):>9.2f} {float(salida[3]):>14.1f}")
+        ruta.unlink()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import polars as pl
+
+PUNTO_2 = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PUNTO_2))  # Paquete sensores
+
+from datos_sinteticos import tabla_voltajes
+from sensores import fila_de_datos, limpiar_valor, limpiar_voltajes
+
+# =============================================================================
+# BENCHMARK: LIMPIEZA DE "V" CELDA POR CELDA (apply) vs EXPRESIONES DE POLARS
+# =============================================================================
+
+def limpiar_con_apply(crudo):
+    """El camino anterior de cargar_y_procesar_datos: detección por filas y apply por celda."""
+    fila_inicio = 0
+    for i in range(min(10, len(crudo))):
+        if any('V' in str(cell) for cell in crudo.iloc[i] if pd.notna(cell)):
+            fila_inicio = i
+            break
+    df_excel = crudo.iloc[fila_inicio:].copy()
+    for col in df_excel.columns:
+        df_excel[col] = df_excel[col].apply(limpiar_valor)
+    df_excel = df_excel.dropna(how='all')
+    df_excel.columns = [f'Sensor_{i+1}' for i in range(len(df_excel.columns))]
+    return pl.from_pandas(df_excel)
+
+
+def limpiar_con_polars(crudo):
+    crudo = pl.from_pandas(crudo).select(pl.all().cast(pl.String))
+    return limpiar_voltajes(crudo.slice(fila_de_datos(crudo)))
+
+
+def mejor_tiempo(funcion, repeticiones):
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        resultado = funcion()
+        mejor = min(mejor, time.perf_counter() - t0)
+    return mejor, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Limpieza de voltajes: apply por celda vs Polars vectorizado")
+    parser.add_argument("--muestras", type=int, nargs="+", default=[10_000, 100_000, 500_000])
+    parser.add_argument("--sensores", type=int, default=61)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{args.sensores} sensores, mejor de {args.repeticiones} repeticiones (sin contar la lectura del Excel)")
+    print(f"  {'muestras':>9} {'apply (s)':>10} {'polars (s)':>11} {'aceleración':>12}")
+    for n_muestras in args.muestras:
+        crudo = tabla_voltajes(n_muestras, args.sensores)
+        t_apply, con_apply = mejor_tiempo(lambda: limpiar_con_apply(crudo), args.repeticiones)
+        t_polars, con_polars = mejor_tiempo(lambda: limpiar_con_polars(crudo), args.repeticiones)
+        # Mismos valores y mismos nulos en las mismas celdas
+        assert con_apply.equals(con_polars), "la limpieza vectorizada no coincide con apply"
+        print(f"  {n_muestras:>9} {t_apply:>10.3f} {t_polars:>11.3f} {t_apply / t_polars:>11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import argparse
+import sys
+import threading
+import time
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+
+PUNTO_2 = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PUNTO_2))  # Paquete sensores
+
+from sensores import FRECUENCIA_MUESTREO, FiltroCausal, MonitorVivo, disenar_pasabajos, lineas_socket
+from sensores.simulador import SenalSimulada, servir_socket
+from scipy.signal import sosfiltfilt
+
+# =============================================================================
+# BENCHMARK: LATENCIA DEL MODO EN VIVO Y COSTO DEL FILTRO INCREMENTAL
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulador por TCP -> MonitorVivo: latencia y costo por refresco")
+    parser.add_argument("--sensores", type=int, nargs="+", default=[8, 61])
+    parser.add_argument("--segundos", type=float, default=10)
+    parser.add_argument("--refresco", type=float, default=0.5, help="segundos entre lecturas del dashboard")
+    parser.add_argument("--ventana", type=float, default=60, help="segundos guardados en los buffers")
+    parser.add_argument("--puerto", type=int, default=9500)
+    args = parser.parse_args()
+
+    sos = disenar_pasabajos()
+    print(f"{args.segundos:g} s por corrida a {FRECUENCIA_MUESTREO:g} Hz, refresco cada {args.refresco:g} s")
+    print(f"  {'sensores':>8} {'muestras':>9} {'p50 ms':>7} {'p95 ms':>7} {'p99 ms':>7} "
+          f"{'al dibujar ms':>14} {'bloque ms':>11} {'incremental ms':>15} {'refiltrar ms':>13}")
+    for i, n_sensores in enumerate(args.sensores):
+        puerto = args.puerto + i
+        detener, listo = threading.Event(), threading.Event()
+        threading.Thread(target=servir_socket, args=("127.0.0.1", puerto, n_sensores),
+                         kwargs=dict(detener=detener, listo=listo), daemon=True).start()
+        listo.wait()
+        monitor = MonitorVivo(partial(lineas_socket, "127.0.0.1", puerto),
+                              capacidad=int(args.ventana * FRECUENCIA_MUESTREO)).iniciar()
+
+        # Lo que haría el dashboard en cada refresco: leer los buffers y medir la antigüedad de la última muestra
+        al_dibujar = []
+        fin = time.time() + args.segundos
+        while time.time() < fin:
+            time.sleep(args.refresco)
+            instantanea = monitor.instantanea()
+            if instantanea is not None:
+                marcas, _, _ = instantanea
+                al_dibujar.append(time.time() - marcas[-1])
+        monitor.detener()
+        detener.set()
+        latencia = monitor.latencia()
+
+        # Filtro por refresco: solo las muestras nuevas con estado, o todo el buffer lleno otra vez
+        senal = SenalSimulada(n_sensores)
+        buffer_lleno = senal.muestras(0, monitor.capacidad)
+        nuevas = senal.muestras(0, int(args.refresco * FRECUENCIA_MUESTREO))
+        filtro = FiltroCausal()
+        filtro.filtrar(nuevas)
+        incremental = mejor_tiempo(lambda: filtro.filtrar(nuevas))
+        refiltrar = mejor_tiempo(lambda: sosfiltfilt(sos, buffer_lleno, axis=0))
+        print(f"  {n_sensores:>8} {monitor.crudo.total:>9} {latencia['p50_ms']:>7.1f} {latencia['p95_ms']:>7.1f} "
+              f"{latencia['p99_ms']:>7.1f} {1000 * np.median(al_dibujar):>14.1f} {latencia['proceso_ms']:>11.2f} "
+              f"{1000 * incremental:>15.3f} {1000 * refiltrar:>13.2f}")
+
+
+def mejor_tiempo(funcion, repeticiones=20):
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - t0)
+    return mejor
+
+if __name__ == "__main__":
+    main()
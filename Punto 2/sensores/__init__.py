@@ -0,0 +1,23 @@
+from .agregados import (BINS_CUANTILES, AcumuladorCorrelacion, CorrelacionMovil, bloques, contar_filas, correlacion,
+                        correlacion_movil, cuantil_de_histograma, describir, histograma, histogramas, reagrupar,
+                        resumen_caja, ventana)
+from .espectro import (BANDAS, MUESTRAS_VENTANA, SOLAPAMIENTO, AcumuladorWelch, bandas_por_ventana,
+                       densidad_espectral, espectro, espectrograma, potencia_bandas)
+from .filtros import (CORTE, FRECUENCIA_MUESTREO, ORDEN, disenar_pasabajos, filtrar_matriz, filtrar_senales,
+                      huella_datos, longitud_minima)
+from .ingesta import (cargar_sensores, convertir_a_parquet, escanear_sensores, fila_de_datos, huella, leer_excel,
+                      limpiar_valor, limpiar_voltajes, preparar_parquet)
+from .reduccion import lttb_indices, minmax_indices, reducir, serie_reducida
+from .vivo import BufferCircular, FiltroCausal, MonitorVivo, lineas_archivo, lineas_socket, parsear_lineas
+
+__all__ = [
+    "AcumuladorCorrelacion", "AcumuladorWelch", "BANDAS", "BINS_CUANTILES", "BufferCircular", "CORTE",
+    "CorrelacionMovil", "FRECUENCIA_MUESTREO", "FiltroCausal", "MUESTRAS_VENTANA", "MonitorVivo", "ORDEN",
+    "SOLAPAMIENTO", "bandas_por_ventana", "bloques", "cargar_sensores", "contar_filas", "convertir_a_parquet",
+    "correlacion", "correlacion_movil", "cuantil_de_histograma", "densidad_espectral", "describir",
+    "disenar_pasabajos", "escanear_sensores", "espectro", "espectrograma", "fila_de_datos", "filtrar_matriz",
+    "filtrar_senales", "histograma", "histogramas", "huella", "huella_datos", "leer_excel", "limpiar_valor",
+    "limpiar_voltajes", "lineas_archivo", "lineas_socket", "longitud_minima", "lttb_indices", "minmax_indices",
+    "parsear_lineas", "potencia_bandas", "preparar_parquet", "reagrupar", "reducir", "resumen_caja",
+    "serie_reducida", "ventana"
+]
@@ -0,0 +1,323 @@
+from collections import deque
+from functools import reduce
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+# =============================================================================
+# AGREGADOS EN STREAMING: ESTADÍSTICAS SIN CARGAR LA GRABACIÓN EN MEMORIA
+# =============================================================================
+
+# Resolución de los histogramas con que se aproximan los cuartiles en describir()
+BINS_CUANTILES = 4096
+
+
+def contar_filas(lf):
+    """Cantidad de muestras; con un Parquet sale de los metadatos, sin leer los datos."""
+    return lf.select(pl.len()).collect().item()
+
+
+def ventana(lf, inicio, largo, columnas=None):
+    """DataFrame con las muestras [inicio, inicio + largo): lo único que se trae a memoria para graficar."""
+    if columnas is not None:
+        lf = lf.select(columnas)
+    return lf.slice(inicio, largo).collect()
+
+
+def bloques(lf, filas_por_bloque=100_000):
+    """DataFrames consecutivos de filas_por_bloque filas.
+
+    Cada bloque es un slice del LazyFrame: sobre un Parquet solo se leen los
+    row groups que lo cubren. (collect_batches, en cambio, llegó a retener
+    toda la grabación.)
+    """
+    total = contar_filas(lf)
+    for inicio in range(0, total, filas_por_bloque):
+        yield lf.slice(inicio, filas_por_bloque).collect()
+
+
+def _resumen(lf):
+    """count, null_count, mean, std, min y max de cada columna en una sola pasada de streaming."""
+    columnas = lf.collect_schema().names()
+    agregados = {
+        "count": lambda c: pl.col(c).count(),
+        "null_count": lambda c: pl.col(c).null_count(),
+        "mean": lambda c: pl.col(c).mean(),
+        "std": lambda c: pl.col(c).std(),
+        "min": lambda c: pl.col(c).min(),
+        "max": lambda c: pl.col(c).max(),
+    }
+    fila = lf.select(
+        funcion(c).cast(pl.Float64).alias(f"{nombre}|{c}")
+        for nombre, funcion in agregados.items() for c in columnas
+    ).collect(engine="streaming").row(0)
+    valores = iter(fila)
+    return {nombre: {c: next(valores) for c in columnas} for nombre in agregados}
+
+
+def histograma(lf, columna, bins=50, rango=None):
+    """(bordes, conteos) del histograma de una columna, contado en streaming.
+
+    rango=(minimo, maximo); si no se da, se calcula con otra pasada. Los
+    valores fuera del rango se suman al primer o al último bin y los nulos se
+    ignoran.
+    """
+    if rango is None:
+        rango = lf.select(pl.col(columna).min().alias("min"), pl.col(columna).max().alias("max")) \
+                  .collect(engine="streaming").row(0)
+    minimo, maximo = rango
+    bordes = np.linspace(minimo, maximo, bins + 1) if minimo is not None else np.zeros(bins + 1)
+    conteos = np.zeros(bins, dtype=np.int64)
+    if minimo is None:  # Columna sin valores
+        return bordes, conteos
+
+    ancho = (maximo - minimo) or 1.0
+    bin_ = ((pl.col(columna) - minimo) * (bins / ancho)).floor().cast(pl.Int64).clip(0, bins - 1)
+    por_bin = lf.select(bin_.alias("bin")).drop_nulls().group_by("bin").len().collect(engine="streaming")
+    conteos[por_bin["bin"].to_numpy()] = por_bin["len"].to_numpy()
+    return bordes, conteos
+
+
+def histogramas(lf, rangos, bins=50, filas_por_bloque=100_000):
+    """{columna: (bordes, conteos)} de varias columnas, contados en una sola pasada por bloques.
+
+    rangos={columna: (minimo, maximo)}, como los de _resumen. Cada columna se
+    cuenta igual que en histograma(): los valores fuera del rango van al primer
+    o al último bin y los nulos se ignoran. Por bloque, los bins de todas las
+    columnas se cuentan con un solo np.bincount (el bin de la columna j se
+    desplaza j * bins).
+    """
+    columnas = list(rangos)
+    sin_valores = [rangos[c][0] is None for c in columnas]
+    minimos = np.array([np.nan if vacia else rangos[c][0] for c, vacia in zip(columnas, sin_valores)])
+    maximos = np.array([np.nan if vacia else rangos[c][1] for c, vacia in zip(columnas, sin_valores)])
+    escala = bins / np.where((maximos - minimos) > 0, maximos - minimos, 1.0)
+    desplazamiento = np.arange(len(columnas)) * bins
+    conteos = np.zeros((len(columnas), bins), dtype=np.int64)
+
+    if not all(sin_valores):
+        for bloque in bloques(lf.select(pl.col(columnas).cast(pl.Float64)), filas_por_bloque):
+            bin_ = np.array(bloque.to_numpy(), dtype=np.float64)  # Copia propia: se opera en el lugar
+            bin_ -= minimos
+            bin_ *= escala
+            np.floor(bin_, out=bin_)
+            np.clip(bin_, 0, bins - 1, out=bin_)
+            bin_ += desplazamiento
+            bin_[np.isnan(bin_)] = conteos.size  # Nulos: a un bin extra que se descarta
+            por_bin = np.bincount(bin_.astype(np.int64).ravel(), minlength=conteos.size + 1)
+            conteos += por_bin[:-1].reshape(conteos.shape)
+
+    return {
+        c: (np.zeros(bins + 1) if vacia else np.linspace(rangos[c][0], rangos[c][1], bins + 1), conteos[j])
+        for j, (c, vacia) in enumerate(zip(columnas, sin_valores))
+    }
+
+
+def cuantil_de_histograma(bordes, conteos, q):
+    """Cuantil q interpolando dentro del bin; el error es como mucho el ancho de un bin."""
+    total = conteos.sum()
+    if total == 0:
+        return None
+    acumulado = np.cumsum(conteos)
+    rango = q * (total - 1)
+    i = int(np.searchsorted(acumulado, rango, side="right"))
+    antes = acumulado[i - 1] if i else 0
+    fraccion = (rango - antes + 0.5) / conteos[i]
+    return float(bordes[i] + fraccion * (bordes[i + 1] - bordes[i]))
+
+
+def reagrupar(bordes, conteos, factor):
+    """Histograma más grueso sumando de a `factor` bins (bins debe ser múltiplo de factor)."""
+    return bordes[::factor], conteos.reshape(-1, factor).sum(axis=1)
+
+
+def resumen_caja(bordes, conteos):
+    """Cuartiles, bigotes (regla de 1.5 IQR) y cantidad de atípicos desde un histograma.
+
+    Sirve para dibujar un box plot sin pasarle todas las muestras al gráfico:
+    los bigotes llegan hasta el borde del último bin con datos dentro de los
+    límites, así que tienen el error de un bin, como los cuartiles.
+    """
+    q1, mediana, q3 = (cuantil_de_histograma(bordes, conteos, q) for q in (0.25, 0.5, 0.75))
+    if mediana is None:
+        return None
+    limite_inferior = q1 - 1.5 * (q3 - q1)
+    limite_superior = q3 + 1.5 * (q3 - q1)
+    con_datos = conteos > 0
+    dentro = con_datos & (bordes[1:] >= limite_inferior) & (bordes[:-1] <= limite_superior)
+    indices = np.flatnonzero(dentro)
+    bigote_inferior = max(float(bordes[indices[0]]), limite_inferior) if len(indices) else q1
+    bigote_superior = min(float(bordes[indices[-1] + 1]), limite_superior) if len(indices) else q3
+    atipicos = int(conteos[con_datos & ~dentro].sum())
+    return {"q1": q1, "mediana": mediana, "q3": q3, "bigote_inferior": min(bigote_inferior, q1),
+            "bigote_superior": max(bigote_superior, q3), "atipicos": atipicos,
+            "minimo": float(bordes[np.flatnonzero(con_datos)[0]]),
+            "maximo": float(bordes[np.flatnonzero(con_datos)[-1] + 1])}
+
+
+def describir(lf, bins=BINS_CUANTILES):
+    """Equivalente en streaming de DataFrame.describe() de Polars.
+
+    count, null_count, mean, std, min y max son exactos. Los percentiles 25,
+    50 y 75 se aproximan desde un histograma de `bins` bins entre min y max
+    de cada columna, así que la memoria no depende de la cantidad de muestras.
+    Son dos pasadas en total: la del resumen y una para todos los histogramas.
+    """
+    resumen = _resumen(lf)
+    columnas = lf.collect_schema().names()
+    percentiles = {"25%": 0.25, "50%": 0.5, "75%": 0.75}
+    for nombre in percentiles:
+        resumen[nombre] = {}
+    rangos = {c: (resumen["min"][c], resumen["max"][c]) for c in columnas}
+    for c, (bordes, conteos) in histogramas(lf, rangos, bins).items():
+        for nombre, q in percentiles.items():
+            resumen[nombre][c] = cuantil_de_histograma(bordes, conteos, q)
+
+    orden = ["count", "null_count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+    return pl.DataFrame(
+        {"statistic": orden, **{c: [resumen[nombre][c] for nombre in orden] for c in columnas}},
+        schema={"statistic": pl.String, **{c: pl.Float64 for c in columnas}},
+    )
+
+
+def _momentos(bloque, dtype=np.float64):
+    """(n, media, m2, comomento) de un bloque, por par de columnas (matrices k x k, en float64).
+
+    Para el par (i, j), con las filas en que ambas tienen valor: n es la
+    cantidad de filas, media[i, j] la media de i, m2[i, j] la suma de los
+    cuadrados de los desvíos de i y comomento[i, j] la suma de los productos
+    de los desvíos de i y de j. Si el bloque no tiene NaN todas las filas
+    cuentan para todos los pares y alcanza con un producto de matrices.
+    """
+    x = np.asarray(bloque, dtype=dtype)
+    k = x.shape[1]
+    presente = ~np.isnan(x)
+    if presente.all():
+        media = x.mean(axis=0, dtype=np.float64)
+        centrada = x - media.astype(dtype)
+        comomento = (centrada.T @ centrada).astype(np.float64)
+        return (np.full((k, k), float(len(x))), np.repeat(media[:, None], k, axis=1),
+                np.repeat(np.diag(comomento)[:, None], k, axis=1), comomento)
+
+    # Con faltantes, cuatro productos de matrices con la máscara (centrado en la media del bloque)
+    validos = presente.sum(axis=0)
+    referencia = np.where(presente, x, 0).sum(axis=0, dtype=np.float64) / np.maximum(validos, 1)
+    m = presente.astype(dtype)
+    x = np.where(presente, x - referencia.astype(dtype), 0).astype(dtype)
+    n = (m.T @ m).astype(np.float64)
+    suma = (x.T @ m).astype(np.float64)  # suma[i, j]: suma de x_i en las filas con i y j presentes
+    with np.errstate(invalid="ignore", divide="ignore"):
+        media_relativa = np.where(n > 0, suma / n, 0.0)
+    m2 = ((x * x).T @ m).astype(np.float64) - suma * media_relativa
+    comomento = (x.T @ x).astype(np.float64) - suma * media_relativa.T
+    return n, referencia[:, None] + media_relativa, m2, comomento
+
+
+def _combinar(a, b):
+    """Momentos de la unión de dos conjuntos de filas (Chan et al.): sin restar sumas grandes."""
+    n_a, media_a, m2_a, comomento_a = a
+    n_b, media_b, m2_b, comomento_b = b
+    n = n_a + n_b
+    with np.errstate(invalid="ignore", divide="ignore"):
+        fraccion = np.where(n > 0, n_b / n, 0.0)
+    delta = media_b - media_a
+    return (n, media_a + delta * fraccion, m2_a + m2_b + delta ** 2 * n_a * fraccion,
+            comomento_a + comomento_b + delta * delta.T * n_a * fraccion)
+
+
+def _correlacion(momentos):
+    n, _, m2, comomento = momentos
+    with np.errstate(invalid="ignore", divide="ignore"):
+        correlacion = comomento / np.sqrt(m2 * m2.T)
+    correlacion[n < 2] = np.nan
+    return np.clip(correlacion, -1.0, 1.0)
+
+
+class AcumuladorCorrelacion:
+    """Correlación de Pearson por pares que se actualiza con cada bloque de filas que llega.
+
+    Como DataFrame.corr() de pandas, cada par (i, j) usa solo las filas en
+    que ambas columnas tienen valor. Se guardan la cantidad de filas, las
+    medias y los co-momentos (suma de productos de desvíos) de cada par, y
+    cada bloque nuevo se combina con la fórmula de Chan, estable aunque la
+    grabación sea larga. Un bloque sin faltantes cuesta un solo producto de
+    matrices; con dtype=np.float32 ese producto va en float32 (el doble de
+    rápido, ~1e-6 de error) y los momentos siguen en float64.
+    """
+
+    def __init__(self, n_columnas, dtype=np.float64):
+        self.n_columnas = n_columnas
+        self.dtype = dtype
+        self.momentos = None
+
+    def agregar(self, bloque):
+        """bloque: ndarray (filas x columnas) con NaN en los valores faltantes."""
+        if len(bloque) == 0:
+            return
+        momentos = _momentos(bloque, self.dtype)
+        self.momentos = momentos if self.momentos is None else _combinar(self.momentos, momentos)
+
+    @property
+    def n(self):
+        """Filas usadas por cada par."""
+        if self.momentos is None:
+            return np.zeros((self.n_columnas, self.n_columnas))
+        return self.momentos[0]
+
+    def matriz(self):
+        """Matriz de correlación (NaN donde un par no tiene al menos dos filas o no varía)."""
+        if self.momentos is None:
+            return np.full((self.n_columnas, self.n_columnas), np.nan)
+        return _correlacion(self.momentos)
+
+
+class CorrelacionMovil:
+    """Correlación de los últimos `bloques_por_ventana` bloques agregados.
+
+    Guarda los momentos de cada bloque (no las filas) y al pedir la matriz
+    combina los de la ventana: no se arrastra error de ir quitando bloques.
+    """
+
+    def __init__(self, n_columnas, bloques_por_ventana, dtype=np.float64):
+        self.n_columnas = n_columnas
+        self.dtype = dtype
+        self.bloques = deque(maxlen=bloques_por_ventana)
+
+    def agregar(self, bloque):
+        self.bloques.append(_momentos(bloque, self.dtype))
+
+    def matriz(self):
+        if not self.bloques:
+            return np.full((self.n_columnas, self.n_columnas), np.nan)
+        return _correlacion(reduce(_combinar, self.bloques))
+
+
+def correlacion_movil(matriz, largo, paso, dtype=np.float64):
+    """(inicios, correlaciones): matriz de correlación de cada ventana de `largo` filas, cada `paso` filas.
+
+    largo tiene que ser múltiplo de paso: cada bloque de `paso` filas se
+    resume una vez y cada ventana combina los largo / paso bloques que la
+    forman. correlaciones tiene forma (ventanas x columnas x columnas).
+    """
+    if largo % paso:
+        raise ValueError(f"el largo ({largo}) tiene que ser múltiplo del paso ({paso})")
+    matriz = np.asarray(matriz)
+    movil = CorrelacionMovil(matriz.shape[1], largo // paso, dtype)
+    inicios, correlaciones = [], []
+    for inicio in range(0, len(matriz) - paso + 1, paso):
+        movil.agregar(matriz[inicio:inicio + paso])
+        if len(movil.bloques) == movil.bloques.maxlen:
+            inicios.append(inicio + paso - largo)
+            correlaciones.append(movil.matriz())
+    forma = (0, matriz.shape[1], matriz.shape[1])
+    return np.array(inicios, dtype=np.int64), np.array(correlaciones) if correlaciones else np.empty(forma)
+
+
+def correlacion(lf, filas_por_bloque=100_000, dtype=np.float64):
+    """Matriz de correlación (DataFrame de pandas, como df.corr()) recorriendo la grabación por bloques."""
+    columnas = lf.collect_schema().names()
+    acumulador = AcumuladorCorrelacion(len(columnas), dtype)
+    for bloque in bloques(lf, filas_por_bloque):
+        acumulador.agregar(bloque.to_numpy())
+    return pd.DataFrame(acumulador.matriz(), index=columnas, columns=columnas)
@@ -0,0 +1,153 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import polars.selectors as cs
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .espectro import BANDAS, espectrograma, potencia_bandas
+from .filtros import CORTE, FRECUENCIA_MUESTREO, ORDEN, filtrar_matriz, longitud_minima
+from .ingesta import SEPARADORES, cargar_sensores
+
+# =============================================================================
+# CARACTERÍSTICAS POR VENTANA PARA ENTRENAR LA RED: UNA CARPETA DE GRABACIONES A PARQUET
+# =============================================================================
+
+# Ejemplo (desde la carpeta Punto 2):
+#   python -m sensores.caracteristicas ~/Descargas/grabaciones --salida caracteristicas --procesos 4
+
+LARGO_VENTANA = 256  # 2.56 s a 100 Hz
+PASO = 128  # Ventanas solapadas a la mitad
+VENTANAS_POR_BLOQUE = 512  # Acota la memoria temporal de las vistas por ventana
+
+# Orígenes que se leen con cargar_sensores
+EXTENSIONES = (".xlsx", ".xlsm", *SEPARADORES)
+
+
+def caracteristicas(matriz, columnas, fs=FRECUENCIA_MUESTREO, largo=LARGO_VENTANA, paso=PASO, bandas=BANDAS):
+    """DataFrame con una fila por (ventana, sensor) y las características de esa ventana.
+
+    Las ventanas son vistas de la matriz (sliding_window_view, sin copiar)
+    de `largo` muestras cada `paso`. Por ventana y sensor:
+
+    - rms y mav (valor absoluto medio).
+    - cruces_cero: cambios de signo de la señal menos la media de la ventana
+      (los voltajes tienen un nivel de continua, no cruzan el 0).
+    - centroide (Hz) y la potencia de cada banda de `bandas`: de la STFT
+      con ventanas Hann del mismo largo y paso que las de tiempo.
+
+    Se procesa de a VENTANAS_POR_BLOQUE ventanas para no materializar todas
+    las ventanas solapadas a la vez.
+    """
+    if not 0 < paso <= largo:
+        raise ValueError(f"el paso debe estar entre 1 y el largo de la ventana ({largo}), no {paso}")
+    matriz = np.asfortranarray(matriz, dtype=np.float64)
+    n_ventanas = max(0, (len(matriz) - largo) // paso + 1)
+    partes = []
+    for primera in range(0, n_ventanas, VENTANAS_POR_BLOQUE):
+        cantidad = min(VENTANAS_POR_BLOQUE, n_ventanas - primera)
+        tramo = matriz[primera * paso:(primera + cantidad - 1) * paso + largo]
+        vistas = sliding_window_view(tramo, largo, axis=0)[::paso]  # (ventanas x sensores x largo)
+
+        centradas = vistas - vistas.mean(axis=-1, keepdims=True)
+        # STFT con las mismas ventanas: psd es (frecuencias x sensores x ventanas)
+        frecuencias, _, psd = espectrograma(tramo, fs, largo, 1 - paso / largo)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            centroide = (frecuencias[:, None, None] * psd).sum(axis=0) / psd.sum(axis=0)
+        valores = {
+            "rms": np.sqrt(np.einsum("vsl,vsl->vs", vistas, vistas) / largo),
+            "mav": np.abs(vistas).mean(axis=-1),
+            "cruces_cero": (np.signbit(centradas[..., 1:]) != np.signbit(centradas[..., :-1])).sum(axis=-1),
+            "centroide": centroide.T,
+            **{nombre: potencia.T for nombre, potencia in potencia_bandas(frecuencias, psd, bandas).items()},
+        }
+        ventana = np.arange(primera, primera + cantidad)
+        partes.append(pl.DataFrame({
+            "ventana": np.repeat(ventana, len(columnas)),
+            "inicio": np.repeat(ventana * paso, len(columnas)),
+            "tiempo_s": np.repeat(ventana * paso / fs, len(columnas)),
+            "sensor": np.tile(columnas, cantidad),
+            **{nombre: valor.ravel() for nombre, valor in valores.items()},
+        }))
+    if not partes:
+        return pl.DataFrame(schema={"ventana": pl.Int64, "inicio": pl.Int64, "tiempo_s": pl.Float64,
+                                    "sensor": pl.String, "rms": pl.Float64, "mav": pl.Float64,
+                                    "cruces_cero": pl.Int64, "centroide": pl.Float64,
+                                    **{nombre: pl.Float64 for nombre in bandas}})
+    return pl.concat(partes)
+
+
+def caracteristicas_archivo(ruta, destino, fs=FRECUENCIA_MUESTREO, largo=LARGO_VENTANA, paso=PASO,
+                            filtrar=True, orden=ORDEN, corte=CORTE):
+    """Lee una grabación (con el cache Parquet de cargar_sensores), la filtra y escribe sus características.
+
+    Devuelve un resumen (archivo, muestras, ventanas, segundos) para el informe.
+    """
+    t0 = time.perf_counter()
+    ruta, destino = Path(ruta), Path(destino)
+    df, _ = cargar_sensores(ruta)
+    columnas = df.select(cs.numeric()).columns
+    matriz = df.select(pl.col(columnas).cast(pl.Float64).fill_null(0.0).fill_nan(0.0)).to_numpy()
+    if filtrar and len(matriz) >= longitud_minima(orden, corte, fs):
+        matriz = filtrar_matriz(matriz, orden, corte, fs)
+
+    tabla = caracteristicas(matriz, columnas, fs, largo, paso)
+    tabla = tabla.select(pl.lit(ruta.name).alias("archivo"), pl.all())
+    # Temporal + os.replace: un proceso interrumpido no deja un Parquet a medias
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    temporal = destino.with_suffix(".parquet.tmp")
+    tabla.write_parquet(temporal)
+    os.replace(temporal, destino)
+    return {"archivo": ruta.name, "muestras": len(matriz), "ventanas": tabla["ventana"].n_unique(),
+            "segundos": time.perf_counter() - t0}
+
+
+def grabaciones(carpeta):
+    """Grabaciones de la carpeta (Excel, CSV, TSV o TXT), ordenadas por nombre."""
+    return sorted(ruta for ruta in Path(carpeta).iterdir()
+                  if ruta.is_file() and ruta.suffix.lower() in EXTENSIONES and not ruta.name.startswith("~$"))
+
+
+def procesar_carpeta(carpeta, salida, procesos=None, **opciones):
+    """Características de todas las grabaciones de `carpeta`, en paralelo (un proceso por archivo).
+
+    Cada grabación queda en `salida/<nombre con extensión>.parquet`; opciones se pasan a
+    caracteristicas_archivo (fs, largo, paso, filtrar...). Devuelve los
+    resúmenes en el orden de los archivos.
+    """
+    archivos = grabaciones(carpeta)
+    destinos = [Path(salida) / f"{ruta.name}.parquet" for ruta in archivos]  # sesion.xlsx y sesion.csv no chocan
+    if procesos == 1 or len(archivos) <= 1:
+        return [caracteristicas_archivo(ruta, destino, **opciones) for ruta, destino in zip(archivos, destinos)]
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        tareas = [ejecutor.submit(caracteristicas_archivo, ruta, destino, **opciones)
+                  for ruta, destino in zip(archivos, destinos)]
+        return [tarea.result() for tarea in tareas]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Características por ventana de una carpeta de grabaciones")
+    parser.add_argument("carpeta", help="carpeta con las grabaciones (.xlsx, .csv, .tsv, .txt)")
+    parser.add_argument("--salida", default="caracteristicas", help="carpeta de los Parquet de salida")
+    parser.add_argument("--procesos", type=int, default=None, help="procesos en paralelo (por defecto, uno por CPU)")
+    parser.add_argument("--fs", type=float, default=FRECUENCIA_MUESTREO, help="muestras por segundo")
+    parser.add_argument("--largo", type=int, default=LARGO_VENTANA, help="muestras por ventana")
+    parser.add_argument("--paso", type=int, default=PASO, help="muestras entre el inicio de dos ventanas")
+    parser.add_argument("--sin-filtro", action="store_true", help="usar la señal sin filtrar")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    resumenes = procesar_carpeta(args.carpeta, args.salida, args.procesos, fs=args.fs, largo=args.largo,
+                                 paso=args.paso, filtrar=not args.sin_filtro)
+    for resumen in resumenes:
+        print(f"{resumen['archivo']}: {resumen['muestras']} muestras, {resumen['ventanas']} ventanas "
+              f"({resumen['segundos']:.2f} s)")
+    print(f"{len(resumenes)} grabaciones en {time.perf_counter() - t0:.2f} s -> {args.salida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import numpy as np
+import polars as pl
+from scipy.signal import spectrogram
+
+from .agregados import bloques
+from .filtros import FRECUENCIA_MUESTREO
+
+# =============================================================================
+# ANÁLISIS ESPECTRAL: FFT, WELCH Y ESPECTROGRAMA DE TODOS LOS SENSORES A LA VEZ
+# =============================================================================
+
+MUESTRAS_VENTANA = 256  # 2.56 s a 100 Hz: resolución de ~0.4 Hz
+SOLAPAMIENTO = 0.5
+
+# Bandas de potencia (Hz): [inferior, superior)
+BANDAS = {
+    "movimiento": (0.5, 4.0),  # Movimiento voluntario de la mano
+    "temblor_patologico": (4.0, 8.0),  # Temblor parkinsoniano y esencial
+    "temblor_fisiologico": (8.0, 12.0),
+    "alta": (12.0, 30.0),
+}
+
+
+def _columnas_contiguas(matriz):
+    """Matriz float64 en orden Fortran (cada sensor contiguo, como la da Polars) con los NaN en 0."""
+    matriz = np.asfortranarray(matriz, dtype=np.float64)
+    if np.isnan(matriz).any():  # nan_to_num copia siempre; solo si hace falta
+        matriz = np.nan_to_num(matriz, nan=0.0)
+    return matriz
+
+
+def espectro(matriz, fs=FRECUENCIA_MUESTREO):
+    """(frecuencias, magnitudes): |rfft| de cada columna de una matriz (muestras x sensores) en una sola llamada."""
+    matriz = _columnas_contiguas(matriz)
+    return np.fft.rfftfreq(len(matriz), d=1 / fs), np.abs(np.fft.rfft(matriz, axis=0))
+
+
+def _solape(muestras_ventana, solapamiento):
+    """Muestras compartidas por dos ventanas seguidas (al menos una muestra de avance)."""
+    return min(int(round(muestras_ventana * solapamiento)), muestras_ventana - 1)
+
+
+def espectrograma(matriz, fs=FRECUENCIA_MUESTREO, muestras_ventana=MUESTRAS_VENTANA, solapamiento=SOLAPAMIENTO):
+    """(frecuencias, tiempos, psd) de la STFT con ventanas Hann de todas las columnas.
+
+    psd tiene forma (frecuencias x sensores x ventanas), en V²/Hz; tiempos es
+    el centro de cada ventana en segundos. El promedio sobre las ventanas es
+    la PSD de Welch con los mismos parámetros.
+    """
+    matriz = _columnas_contiguas(matriz)
+    return spectrogram(matriz, fs, window="hann", nperseg=muestras_ventana,
+                       noverlap=_solape(muestras_ventana, solapamiento), axis=0)
+
+
+def potencia_bandas(frecuencias, psd, bandas=BANDAS):
+    """{banda: potencia (V²)} integrando la PSD (eje 0 = frecuencias) dentro de cada banda."""
+    df = frecuencias[1] - frecuencias[0]
+    return {
+        nombre: psd[(frecuencias >= inferior) & (frecuencias < superior)].sum(axis=0) * df
+        for nombre, (inferior, superior) in bandas.items()
+    }
+
+
+def bandas_por_ventana(matriz, columnas, fs=FRECUENCIA_MUESTREO, muestras_ventana=MUESTRAS_VENTANA,
+                       solapamiento=SOLAPAMIENTO, bandas=BANDAS, inicio=0):
+    """DataFrame con una fila por (ventana, sensor): el tiempo central y la potencia de cada banda.
+
+    inicio es el índice de la primera muestra de la matriz en la grabación,
+    para que tiempo_s quede en el tiempo de la grabación.
+    """
+    frecuencias, tiempos, psd = espectrograma(matriz, fs, muestras_ventana, solapamiento)
+    potencias = potencia_bandas(frecuencias, psd, bandas)  # Cada una: (sensores x ventanas)
+    return pl.DataFrame({
+        "tiempo_s": np.tile(tiempos + inicio / fs, len(columnas)),
+        "sensor": np.repeat(columnas, len(tiempos)),
+        **{nombre: potencia.ravel() for nombre, potencia in potencias.items()},
+    })
+
+
+class AcumuladorWelch:
+    """PSD de Welch de varias columnas acumulada por bloques de filas.
+
+    Welch es el promedio de los periodogramas de ventanas solapadas: por
+    bloque se suman los periodogramas de las ventanas completas y se guardan
+    las muestras que todavía no completan la siguiente, así que el resultado
+    es el mismo que con la señal entera y en memoria solo hay un bloque.
+    """
+
+    def __init__(self, fs=FRECUENCIA_MUESTREO, muestras_ventana=MUESTRAS_VENTANA, solapamiento=SOLAPAMIENTO):
+        self.fs = fs
+        self.muestras_ventana = muestras_ventana
+        self.solapamiento = solapamiento
+        self.paso = muestras_ventana - _solape(muestras_ventana, solapamiento)
+        self.pendiente = None  # Muestras del final del bloque anterior
+        self.frecuencias = self.suma = None
+        self.ventanas = 0
+
+    def agregar(self, bloque):
+        """bloque: ndarray (filas x columnas); los NaN se toman como 0."""
+        bloque = np.asarray(bloque, dtype=np.float64)
+        datos = bloque if self.pendiente is None else np.concatenate([self.pendiente, bloque])
+        if len(datos) < self.muestras_ventana:
+            self.pendiente = datos
+            return
+        self.frecuencias, _, psd = espectrograma(datos, self.fs, self.muestras_ventana, self.solapamiento)
+        suma = psd.sum(axis=-1)
+        self.suma = suma if self.suma is None else self.suma + suma
+        self.ventanas += psd.shape[-1]
+        self.pendiente = datos[psd.shape[-1] * self.paso:]
+
+    def densidad(self):
+        """(frecuencias, psd (frecuencias x columnas)); None si no se completó ninguna ventana."""
+        if not self.ventanas:
+            return None
+        return self.frecuencias, self.suma / self.ventanas
+
+
+def densidad_espectral(lf, fs=FRECUENCIA_MUESTREO, muestras_ventana=MUESTRAS_VENTANA, solapamiento=SOLAPAMIENTO,
+                       filas_por_bloque=100_000):
+    """(frecuencias, psd (frecuencias x sensores)) de Welch de toda la grabación, recorriéndola por bloques."""
+    acumulador = AcumuladorWelch(fs, muestras_ventana, solapamiento)
+    for bloque in bloques(lf, filas_por_bloque):
+        acumulador.agregar(bloque.to_numpy())
+    return acumulador.densidad()
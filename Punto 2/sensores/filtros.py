@@ -0,0 +1,63 @@
+import hashlib
+from functools import lru_cache
+
+import numpy as np
+import polars as pl
+import polars.selectors as cs
+from scipy.signal import butter, sosfiltfilt
+
+# =============================================================================
+# FILTRADO: UN SOLO sosfiltfilt SOBRE LA MATRIZ DE TODOS LOS SENSORES
+# =============================================================================
+
+FRECUENCIA_MUESTREO = 100.0  # Hz
+CORTE = 5.0  # Hz, pasa bajas
+ORDEN = 4
+
+
+@lru_cache(maxsize=None)
+def disenar_pasabajos(orden=ORDEN, corte=CORTE, fs=FRECUENCIA_MUESTREO):
+    """Butterworth pasa bajas en secciones de segundo orden (más estable que b, a); se diseña una vez."""
+    return butter(orden, corte, btype='low', fs=fs, output='sos')
+
+
+def longitud_minima(orden=ORDEN, corte=CORTE, fs=FRECUENCIA_MUESTREO):
+    """Muestras necesarias para sosfiltfilt con el padding por defecto."""
+    sos = disenar_pasabajos(orden, corte, fs)
+    ceros = min((sos[:, 2] == 0).sum(), (sos[:, 5] == 0).sum())
+    return 3 * (2 * len(sos) + 1 - ceros) + 1
+
+
+def filtrar_matriz(matriz, orden=ORDEN, corte=CORTE, fs=FRECUENCIA_MUESTREO):
+    """Filtra sin desfase cada columna de una matriz (muestras x sensores); los NaN se toman como 0."""
+    sos = disenar_pasabajos(orden, corte, fs)
+    if np.isnan(matriz).any():  # nan_to_num copia siempre; solo si hace falta
+        matriz = np.nan_to_num(matriz, nan=0.0)
+    return sosfiltfilt(sos, matriz, axis=0)
+
+
+def huella_datos(df):
+    """Texto que identifica el contenido de un DataFrame: hash vectorizado de cada fila, en orden."""
+    hashes = df.hash_rows(seed=0).to_numpy()
+    resumen = hashlib.blake2b(hashes.tobytes(), digest_size=16)
+    resumen.update("|".join(df.columns).encode())
+    return resumen.hexdigest()
+
+
+def filtrar_senales(df, orden=ORDEN, corte=CORTE, fs=FRECUENCIA_MUESTREO):
+    """df con una columna `<sensor>_filtrado` por cada columna numérica.
+
+    Las columnas se filtran juntas con un sosfiltfilt a lo largo de axis=0 y
+    el resultado se arma en un solo DataFrame que se pega a df, en vez de un
+    with_columns (y una copia) por sensor.
+    """
+    columnas = df.select(cs.numeric()).columns
+    if not columnas:
+        return df
+    # Nulos a 0 en Polars (como el nan_to_num anterior) y una columna contigua por sensor
+    matriz = df.select(pl.col(columnas).cast(pl.Float64).fill_null(0.0).fill_nan(0.0)).to_numpy()
+    filtrada = filtrar_matriz(matriz, orden, corte, fs)
+    return pl.concat(
+        [df, pl.DataFrame(filtrada, schema=[f"{col}_filtrado" for col in columnas], orient="row")],
+        how="horizontal",
+    )
@@ -0,0 +1,254 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import openpyxl
+import pandas as pd
+import polars as pl
+import pyarrow.parquet as pq
+
+# =============================================================================
+# INGESTA: EL EXCEL SE PARSEA UNA SOLA VEZ Y SE GUARDA COMO PARQUET
+# =============================================================================
+
+# Versión del formato limpio: si cambia la limpieza, los Parquet anteriores dejan de valer
+VERSION_LIMPIEZA = 3
+
+# Grabaciones largas en texto (una fila por muestra, una columna por sensor), separador por extensión
+SEPARADORES = {".csv": ",", ".tsv": "\t", ".txt": ","}
+
+
+# Función para limpiar y convertir valores con "V" (celda por celda; referencia de limpiar_voltajes)
+def limpiar_valor(valor):
+    if isinstance(valor, str):
+        # Remover "V" y convertir a float
+        valor_limpio = valor.replace('V', '').strip()
+        try:
+            return float(valor_limpio)
+        except:
+            return np.nan
+    return valor
+
+
+def fila_de_datos(crudo):
+    """Primera de las 10 primeras filas con alguna celda que contenga "V" (0 si ninguna)."""
+    tiene_v = crudo.head(10).select(
+        pl.any_horizontal(pl.all().str.contains("V", literal=True)).fill_null(False)
+    ).to_series()
+    filas = tiene_v.arg_true()
+    return int(filas[0]) if len(filas) else 0
+
+
+def limpiar_voltajes(crudo):
+    """Convierte un DataFrame de texto ("1.66V", ...) a Float64 con expresiones de Polars.
+
+    Mismo resultado que aplicar limpiar_valor a cada celda y luego
+    dropna(how='all') y pl.from_pandas: lo que no es un número queda nulo
+    (también "nan"), se descartan las filas sin ningún valor y las columnas
+    se llaman Sensor_1..Sensor_n.
+    """
+    nombres = crudo.collect_schema().names()  # También sirve con un LazyFrame
+    limpio = crudo.select(
+        pl.all().str.replace_all("V", "", literal=True).str.strip_chars().cast(pl.Float64, strict=False)
+    )
+    # fill_nan en un paso aparte: dentro de la misma expresión evalúa dos veces la cadena de texto
+    limpio = limpio.select(pl.all().fill_nan(None))
+    limpio = limpio.rename({col: f"Sensor_{i+1}" for i, col in enumerate(nombres)})
+    return limpio.filter(pl.any_horizontal(pl.all().is_not_null()))
+
+
+def leer_excel(ruta):
+    """Lee BD_SENSORES.xlsx y devuelve un DataFrame de Polars con columnas Sensor_1..Sensor_n."""
+    # Una sola lectura, todo como texto: la fila de inicio se busca sobre el mismo DataFrame
+    crudo = pl.from_pandas(pd.read_excel(ruta, header=None, dtype=str))
+    crudo = crudo.select(pl.all().cast(pl.String))
+    return limpiar_voltajes(crudo.slice(fila_de_datos(crudo)))
+
+
+def convertir_a_parquet(ruta, destino, filas_por_bloque=100_000):
+    """Limpia `ruta` (Excel o CSV/TSV) y escribe el resultado en `destino` sin cargarlo entero.
+
+    Los CSV se leen con pl.scan_csv y se escriben con sink_parquet (motor de
+    streaming). Los Excel se recorren con openpyxl en modo read_only, de a
+    filas_por_bloque filas, y cada bloque limpio se agrega como un row group
+    del Parquet. La memoria queda acotada por el tamaño del bloque. El primer
+    bloque define la fila de inicio. Si más abajo aparece una columna nueva
+    (un sensor conectado después) se sigue en otro Parquet más ancho, y al
+    final se unen en uno solo rellenando con nulos; también se quitan las
+    columnas vacías del final, como pd.read_excel.
+    """
+    ruta = Path(ruta)
+    separador = SEPARADORES.get(ruta.suffix.lower())
+    if separador is not None:
+        crudo = pl.scan_csv(ruta, has_header=False, separator=separador, infer_schema=False)
+        fila_inicio = fila_de_datos(crudo.head(10).collect())
+        limpiar_voltajes(crudo.slice(fila_inicio)).sink_parquet(destino)
+        return
+
+    destino = Path(destino)
+    partes = []  # Un Parquet por ancho de bloque; el primero es destino
+    escritor = None
+    usadas = 0  # Columnas hasta la última con algún valor en toda la hoja
+    try:
+        try:
+            # Al menos las 10 filas en las que fila_de_datos busca el encabezado
+            for i, bloque in enumerate(_bloques_excel(ruta, max(filas_por_bloque, 10))):
+                usadas = max(usadas, _columnas_usadas(bloque))
+                if i == 0:
+                    bloque = bloque.slice(fila_de_datos(bloque))
+                tabla = limpiar_voltajes(bloque).to_arrow()
+                if escritor is None or tabla.num_columns > len(escritor.schema.names):
+                    if escritor is not None:
+                        escritor.close()
+                    partes.append(destino.with_name(f"{destino.name}.parte{len(partes)}") if partes else destino)
+                    escritor = pq.ParquetWriter(partes[-1], tabla.schema)
+                escritor.write_table(tabla)
+        finally:
+            if escritor is not None:
+                escritor.close()
+        if escritor is None:
+            raise ValueError(f"{ruta} no tiene filas")
+
+        nombres = tabla.column_names
+        columnas = nombres[:usadas] if usadas else nombres
+        if len(partes) > 1 or len(columnas) < len(nombres):
+            # Una sola reescritura: une las partes (nulos donde un bloque era más angosto)
+            # y quita las columnas vacías del final que traía la dimensión (celdas con formato)
+            unido = destino.with_name(destino.name + ".unido")
+            pl.concat([pl.scan_parquet(parte) for parte in partes], how="diagonal") \
+                .select(columnas).sink_parquet(unido)
+            os.replace(unido, destino)
+    finally:
+        for parte in partes[1:]:
+            parte.unlink(missing_ok=True)
+
+
+def _bloques_excel(ruta, filas_por_bloque):
+    """DataFrames de texto de filas_por_bloque filas de la primera hoja (la que lee pd.read_excel).
+
+    El ancho parte de la dimensión declarada de la hoja y solo crece: si un
+    bloque trae valores más allá (la dimensión falta o se queda corta, o un
+    sensor empieza más abajo), ese bloque y los siguientes son más anchos.
+    """
+    libro = openpyxl.load_workbook(ruta, read_only=True, data_only=True)
+    try:
+        hoja = libro.worksheets[0]
+        filas = []
+        ancho = hoja.max_column or 0  # Dimensión declarada en el archivo (None si no la tiene)
+        # Sin esto openpyxl recorta cada fila a la dimensión declarada, aunque esté mal (pandas hace lo mismo)
+        hoja.reset_dimensions()
+        for fila in hoja.iter_rows(values_only=True):
+            filas.append(fila)
+            if len(filas) == filas_por_bloque:
+                ancho = _ancho_bloque(filas, ancho)
+                yield _bloque_texto(filas, ancho)
+                filas = []
+        if filas:
+            yield _bloque_texto(filas, _ancho_bloque(filas, ancho))
+    finally:
+        libro.close()
+
+
+def _ancho_bloque(filas, ancho):
+    # Tras reset_dimensions cada fila tiene su largo real: solo se recorren las celdas si alguna es más larga
+    if max(map(len, filas), default=0) <= ancho:
+        return ancho
+    return max(ancho, _ancho_usado(filas))
+
+
+def _ancho_usado(filas):
+    # Hasta la última columna con algún valor
+    return max((j + 1 for fila in filas for j, valor in enumerate(fila) if valor is not None), default=0)
+
+
+def _columnas_usadas(bloque):
+    presentes = bloque.select(pl.all().is_not_null().any()).row(0)
+    return max((j + 1 for j, presente in enumerate(presentes) if presente), default=0)
+
+
+def _bloque_texto(filas, ancho):
+    columnas = {
+        f"column_{j}": [None if j >= len(fila) or fila[j] is None else str(fila[j]) for fila in filas]
+        for j in range(ancho)
+    }
+    return pl.DataFrame(columnas, schema={nombre: pl.String for nombre in columnas})
+
+
+def huella(ruta, con_hash=True):
+    """mtime (ns), tamaño, versión de la limpieza y, si con_hash, SHA-256 del archivo leído por bloques."""
+    estado = os.stat(ruta)
+    datos = {"mtime_ns": estado.st_mtime_ns, "tamano": estado.st_size, "version": VERSION_LIMPIEZA}
+    if con_hash:
+        sha = hashlib.sha256()
+        with open(ruta, "rb") as archivo:
+            for bloque in iter(lambda: archivo.read(1 << 20), b""):
+                sha.update(bloque)
+        datos["sha256"] = sha.hexdigest()
+    return datos
+
+
+def preparar_parquet(ruta, carpeta_cache=None):
+    """(ruta_parquet, desde_cache): convierte `ruta` a Parquet solo si cambió desde la última vez.
+
+    La primera vez el origen se limpia con convertir_a_parquet() y se escribe
+    en carpeta_cache (por defecto `.cache_sensores` junto al origen), con un
+    JSON al lado que guarda la huella del origen. Las llamadas siguientes
+    comparan mtime y tamaño; si difieren se calcula el SHA-256 y solo se
+    vuelve a convertir si el contenido cambió de verdad (un `touch` o una
+    copia no invalidan el cache).
+    """
+    ruta = Path(ruta)
+    carpeta_cache = Path(carpeta_cache) if carpeta_cache else ruta.parent / ".cache_sensores"
+    # Con el nombre completo: BD.xlsx y BD.csv en la misma carpeta no comparten cache
+    ruta_parquet = carpeta_cache / f"{ruta.name}.parquet"
+    ruta_huella = carpeta_cache / f"{ruta.name}.json"
+
+    actual = huella(ruta, con_hash=False)
+    guardada = None
+    if ruta_parquet.exists() and ruta_huella.exists():
+        with open(ruta_huella, encoding="utf-8") as archivo:
+            guardada = json.load(archivo)
+
+    desde_cache = False
+    # Un Parquet escrito por otra versión de la limpieza se regenera
+    if guardada is not None and guardada.get("version") == VERSION_LIMPIEZA:
+        if all(guardada.get(k) == actual[k] for k in ("mtime_ns", "tamano")):
+            desde_cache = True
+        else:
+            actual = huella(ruta)
+            if guardada.get("sha256") == actual["sha256"]:
+                desde_cache = True
+                _escribir_json(ruta_huella, actual)  # Mismo contenido, nuevo mtime
+
+    if not desde_cache:
+        if "sha256" not in actual:
+            actual = huella(ruta)
+        carpeta_cache.mkdir(parents=True, exist_ok=True)
+        # Se escribe a un temporal y se renombra: una carga interrumpida no deja un Parquet a medias
+        temporal = ruta_parquet.with_suffix(".parquet.tmp")
+        convertir_a_parquet(ruta, temporal)
+        os.replace(temporal, ruta_parquet)
+        _escribir_json(ruta_huella, actual)
+
+    return ruta_parquet, desde_cache
+
+
+def cargar_sensores(ruta, carpeta_cache=None):
+    """(DataFrame, desde_cache): los datos limpios de `ruta`, leídos del Parquet mapeado en memoria."""
+    ruta_parquet, desde_cache = preparar_parquet(ruta, carpeta_cache)
+    return pl.read_parquet(ruta_parquet, memory_map=True), desde_cache
+
+
+def escanear_sensores(ruta, carpeta_cache=None):
+    """(LazyFrame, desde_cache): como cargar_sensores, pero sin leer nada hasta que se consulte."""
+    ruta_parquet, desde_cache = preparar_parquet(ruta, carpeta_cache)
+    return pl.scan_parquet(ruta_parquet), desde_cache
+
+
+def _escribir_json(ruta, datos):
+    temporal = ruta.with_suffix(".json.tmp")
+    with open(temporal, "w", encoding="utf-8") as archivo:
+        json.dump(datos, archivo)
+    os.replace(temporal, ruta)
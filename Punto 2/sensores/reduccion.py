@@ -0,0 +1,99 @@
+import numpy as np
+
+from .agregados import ventana
+
+# =============================================================================
+# REDUCCIÓN DE PUNTOS PARA GRAFICAR: MIN-MAX + LTTB A UN PRESUPUESTO DE PÍXELES
+# =============================================================================
+
+def minmax_indices(y, n_buckets):
+    """Índices (ordenados) del mínimo y el máximo de cada uno de n_buckets tramos iguales de y.
+
+    Es vectorizado: los tramos son las filas de una matriz. Conserva todos los
+    picos, que es lo que se pierde al tomar una muestra cada tantas, y también
+    el primer y el último punto.
+    """
+    n = len(y)
+    tamano = -(-n // n_buckets)
+    n_buckets = -(-n // tamano)
+    relleno = n_buckets * tamano - n
+    nan = np.isnan(y)
+    bajos = np.concatenate([np.where(nan, np.inf, y), np.full(relleno, np.inf)]).reshape(n_buckets, tamano)
+    altos = np.concatenate([np.where(nan, -np.inf, y), np.full(relleno, -np.inf)]).reshape(n_buckets, tamano)
+    base = np.arange(n_buckets) * tamano
+    return np.unique(np.concatenate([[0, n - 1], base + bajos.argmin(axis=1), base + altos.argmax(axis=1)]))
+
+
+def lttb_indices(x, y, n_puntos):
+    """Índices elegidos por Largest Triangle Three Buckets (Steinarsson, 2013).
+
+    De cada tramo se queda con el punto que forma el triángulo más grande con
+    el punto elegido en el tramo anterior y el promedio del tramo siguiente,
+    lo que preserva la forma visual de la curva. Siempre incluye el primer y
+    el último punto.
+    """
+    n = len(y)
+    if n_puntos >= n or n_puntos < 3:
+        return np.arange(n)
+    bordes = np.append(np.linspace(1, n - 1, n_puntos - 1).astype(np.int64), n)
+    # Promedio de cada tramo (no depende de lo elegido): se calcula todo de una vez
+    presentes = ~np.isnan(y)
+    cantidad = np.add.reduceat(presentes.astype(np.int64), bordes[:-1])
+    px = np.add.reduceat(x, bordes[:-1]) / np.diff(bordes)
+    with np.errstate(invalid="ignore"):
+        py = np.add.reduceat(np.where(presentes, y, 0.0), bordes[:-1]) / cantidad
+    elegidos = np.empty(n_puntos, dtype=np.int64)
+    elegidos[0], elegidos[-1] = 0, n - 1
+    a = 0
+    for i in range(n_puntos - 2):
+        inicio, fin = bordes[i], bordes[i + 1]
+        xa, ya = x[a], y[a]
+        if ya != ya:  # El punto anterior es un hueco (NaN): se usa el promedio de su tramo
+            ya = py[i] if cantidad[i] else 0.0
+        pxi, pyi = px[i + 1], (py[i + 1] if cantidad[i + 1] else ya)
+        # Doble del área de cada triángulo (a, punto, promedio del siguiente), como función lineal del punto
+        areas = np.abs(y[inicio:fin] * (xa - pxi) + x[inicio:fin] * (pyi - ya) + (pxi * ya - xa * pyi))
+        a = inicio + int(np.argmax(np.nan_to_num(areas, nan=-1.0)))
+        elegidos[i + 1] = a
+    return elegidos
+
+
+def reducir(x, y, n_puntos):
+    """(x, y) con a lo sumo n_puntos: min-max hasta ~4 * n_puntos y luego LTTB (como MinMaxLTTB)."""
+    x, y = np.asarray(x), np.asarray(y, dtype=np.float64)
+    if len(y) <= n_puntos:
+        return x, y
+    if len(y) > 4 * n_puntos:
+        previos = minmax_indices(y, 2 * n_puntos)
+        x, y = x[previos], y[previos]
+    elegidos = lttb_indices(x, y, n_puntos)
+    return x[elegidos], y[elegidos]
+
+
+def serie_reducida(lf, columna, inicio, fin, n_puntos, filas_por_bloque=1_000_000):
+    """(x, y) de la columna entre las muestras [inicio, fin) reducida a n_puntos, leyendo por bloques.
+
+    Si el rango es grande, cada bloque (un múltiplo del tamaño de tramo) se
+    reduce con min-max apenas se lee, así que en memoria nunca hay más de un
+    bloque de la columna; al final LTTB deja n_puntos. Al acercarse (un rango
+    más chico) se vuelve a llamar y se obtiene más resolución en ese tramo.
+    """
+    lf = lf.select(columna)
+    largo = fin - inicio
+    if largo <= 4 * n_puntos:
+        y = ventana(lf, inicio, largo).to_series().to_numpy()
+        return reducir(np.arange(inicio, inicio + len(y)), y, n_puntos)
+
+    tamano = -(-largo // (2 * n_puntos))  # Tramo de min-max, igual para todos los bloques
+    paso = max(1, filas_por_bloque // tamano) * tamano
+    xs, ys = [], []
+    for desde in range(inicio, fin, paso):
+        y = ventana(lf, desde, min(paso, fin - desde)).to_series().to_numpy()
+        if not len(y):
+            break
+        indices = minmax_indices(y, -(-len(y) // tamano))
+        xs.append(desde + indices)
+        ys.append(y[indices])
+    x, y = np.concatenate(xs), np.concatenate(ys)
+    elegidos = lttb_indices(x, y, n_puntos)
+    return x[elegidos], y[elegidos]
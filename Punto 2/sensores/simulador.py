@@ -0,0 +1,119 @@
+import argparse
+import socket
+import threading
+import time
+
+import numpy as np
+
+from .filtros import FRECUENCIA_MUESTREO
+
+# =============================================================================
+# SIMULADOR DE SENSORES: EMITE MUESTRAS EN TIEMPO REAL POR TCP O A UN ARCHIVO
+# =============================================================================
+
+# Ejemplos (desde la carpeta Punto 2):
+#   python -m sensores.simulador --puerto 9000 --sensores 8
+#   python -m sensores.simulador --archivo vivo.csv --sensores 8
+
+class SenalSimulada:
+    """Voltajes sintéticos continuos en el tiempo: un par de senos por sensor más ruido."""
+
+    def __init__(self, n_sensores, fs=FRECUENCIA_MUESTREO, semilla=0):
+        self.rng = np.random.default_rng(semilla)
+        self.fs = fs
+        self.frecuencias = self.rng.uniform(0.5, 12.0, size=(2, n_sensores))
+        self.amplitudes = self.rng.uniform(0.05, 0.4, size=(2, n_sensores))
+        self.base = self.rng.uniform(0.5, 2.0, size=n_sensores)
+
+    def muestras(self, desde, cantidad):
+        """Matriz (cantidad x sensores) de las muestras con índice desde..desde + cantidad - 1."""
+        t = np.arange(desde, desde + cantidad)[:, None] / self.fs
+        senos = sum(a * np.sin(2 * np.pi * f * t) for a, f in zip(self.amplitudes, self.frecuencias))
+        return self.base + senos + self.rng.normal(0, 0.05, size=(cantidad, len(self.base)))
+
+
+def formatear(marcas, valores):
+    """Líneas "marca,1.2345V,..." (el formato que lee parsear_lineas)."""
+    return "".join(
+        f"{marca:.6f}," + ",".join(f"{v:.4f}V" for v in fila) + "\n" for marca, fila in zip(marcas, valores)
+    )
+
+
+def transmitir(escribir, n_sensores, fs=FRECUENCIA_MUESTREO, periodo=0.01, detener=None, semilla=0,
+               duracion=None):
+    """Llama a escribir(texto) cada `periodo` segundos con las muestras que corresponden a ese intervalo.
+
+    La marca de cada muestra es el instante en que "se midió" (t0 + k/fs), así
+    que la latencia medida del otro lado incluye la espera hasta el envío.
+    """
+    detener = detener or threading.Event()
+    senal = SenalSimulada(n_sensores, fs, semilla)
+    t0 = time.time()
+    enviadas = 0
+    while not detener.is_set() and (duracion is None or enviadas < duracion * fs):
+        hasta = int((time.time() - t0) * fs) + 1
+        if duracion is not None:
+            hasta = min(hasta, int(duracion * fs))
+        if hasta > enviadas:
+            marcas = t0 + np.arange(enviadas, hasta) / fs
+            escribir(formatear(marcas, senal.muestras(enviadas, hasta - enviadas)))
+            enviadas = hasta
+        time.sleep(periodo)
+    return enviadas
+
+
+def servir_socket(host, puerto, n_sensores, fs=FRECUENCIA_MUESTREO, periodo=0.01, detener=None, listo=None):
+    """Servidor TCP: cada cliente que se conecta recibe su propio flujo desde ese momento."""
+    detener = detener or threading.Event()
+    with socket.create_server((host, puerto)) as servidor:
+        servidor.settimeout(0.5)
+        if listo is not None:
+            listo.set()
+        while not detener.is_set():
+            try:
+                conexion, _ = servidor.accept()
+            except socket.timeout:
+                continue
+            threading.Thread(target=_atender, args=(conexion, n_sensores, fs, periodo, detener), daemon=True).start()
+
+
+def _atender(conexion, n_sensores, fs, periodo, detener):
+    with conexion:
+        try:
+            transmitir(lambda texto: conexion.sendall(texto.encode()), n_sensores, fs, periodo, detener)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # El cliente se desconectó
+
+
+def escribir_archivo(ruta, n_sensores, fs=FRECUENCIA_MUESTREO, periodo=0.01, detener=None, duracion=None):
+    """Agrega las muestras al final de `ruta`, como lo haría un registrador (para lineas_archivo)."""
+    with open(ruta, "a", encoding="utf-8") as archivo:
+        def escribir(texto):
+            archivo.write(texto)
+            archivo.flush()
+        return transmitir(escribir, n_sensores, fs, periodo, detener, duracion=duracion)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulador de sensores en tiempo real")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=9000)
+    parser.add_argument("--archivo", help="escribir a este archivo en vez de servir por TCP")
+    parser.add_argument("--sensores", type=int, default=8)
+    parser.add_argument("--fs", type=float, default=FRECUENCIA_MUESTREO, help="muestras por segundo")
+    parser.add_argument("--periodo", type=float, default=0.01, help="segundos entre envíos")
+    args = parser.parse_args()
+
+    try:
+        if args.archivo:
+            print(f"Escribiendo {args.sensores} sensores a {args.fs:g} Hz en {args.archivo}")
+            escribir_archivo(args.archivo, args.sensores, args.fs, args.periodo)
+        else:
+            print(f"Sirviendo {args.sensores} sensores a {args.fs:g} Hz en {args.host}:{args.puerto}")
+            servir_socket(args.host, args.puerto, args.sensores, args.fs, args.periodo)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+import socket
+import threading
+import time
+from collections import Counter, deque
+
+import numpy as np
+from scipy.signal import sosfilt, sosfilt_zi
+
+from .filtros import CORTE, FRECUENCIA_MUESTREO, ORDEN, disenar_pasabajos
+
+# =============================================================================
+# MODO EN VIVO: MUESTRAS POR SOCKET O ARCHIVO, BUFFERS CIRCULARES Y FILTRO CAUSAL
+# =============================================================================
+
+# Formato de línea: "marca,v1,v2,...,vk" con marca = time.time() de la muestra y los
+# voltajes con o sin sufijo "V" (como en el Excel). Una línea por muestra.
+
+
+class BufferCircular:
+    """Últimas `capacidad` muestras de varios sensores en un arreglo fijo: agregar no crece ni reubica."""
+
+    def __init__(self, capacidad, n_columnas):
+        self.datos = np.full((capacidad, n_columnas), np.nan)
+        self.capacidad = capacidad
+        self.total = 0  # Muestras agregadas desde el inicio
+
+    def agregar(self, bloque):
+        bloque = np.asarray(bloque).reshape(len(bloque), -1)
+        if len(bloque) > self.capacidad:  # Solo sobreviven las últimas
+            self.total += len(bloque) - self.capacidad
+            bloque = bloque[-self.capacidad:]
+        inicio = self.total % self.capacidad
+        primera = min(len(bloque), self.capacidad - inicio)
+        self.datos[inicio:inicio + primera] = bloque[:primera]
+        self.datos[:len(bloque) - primera] = bloque[primera:]
+        self.total += len(bloque)
+
+    def ultimos(self, n=None):
+        """Copia de las últimas n muestras (todas las guardadas si n es None), de la más vieja a la más nueva."""
+        n = min(self.capacidad if n is None else n, self.capacidad, self.total)
+        fin = self.total % self.capacidad
+        return self.datos[np.arange(fin - n, fin) % self.capacidad]
+
+
+class FiltroCausal:
+    """Butterworth pasa bajas aplicado de a bloques con sosfilt, guardando el estado zi entre bloques.
+
+    Filtrar una señal en bloques da lo mismo que filtrarla entera de una vez,
+    así que cada muestra se filtra una sola vez. Es causal (tiene el desfase
+    del Butterworth), a diferencia del sosfiltfilt del modo archivo, que
+    necesita la señal completa.
+    """
+
+    def __init__(self, orden=ORDEN, corte=CORTE, fs=FRECUENCIA_MUESTREO):
+        self.sos = disenar_pasabajos(orden, corte, fs)
+        self.zi = None
+
+    def filtrar(self, bloque):
+        """bloque: ndarray (muestras x sensores)."""
+        bloque = np.nan_to_num(np.asarray(bloque, dtype=np.float64), nan=0.0)
+        if self.zi is None:
+            # Estado estacionario para la primera muestra: sin el transitorio de arrancar desde 0 V
+            self.zi = sosfilt_zi(self.sos)[:, :, None] * bloque[0]
+        salida, self.zi = sosfilt(self.sos, bloque, axis=0, zi=self.zi)
+        return salida
+
+
+def parsear_lineas(lineas, sensores=None):
+    """(marcas, valores) de las líneas válidas; las que no se pueden leer se descartan.
+
+    También se descartan las que no tienen `sensores` valores después de la
+    marca. Si no se sabe cuántos sensores hay (sensores=None), vale el ancho
+    más común del bloque: una primera línea cortada no tira las demás.
+    """
+    filas = []
+    for linea in lineas:
+        try:
+            filas.append([float(campo.replace("V", "")) for campo in linea.split(",")])
+        except ValueError:
+            continue
+    if filas:
+        ancho = sensores + 1 if sensores is not None else Counter(map(len, filas)).most_common(1)[0][0]
+        if any(len(fila) != ancho for fila in filas):
+            filas = [fila for fila in filas if len(fila) == ancho]
+    if not filas:
+        return np.empty(0), np.empty((0, 0))
+    matriz = np.array(filas)
+    return matriz[:, 0], matriz[:, 1:]
+
+
+def lineas_socket(host, puerto, detener, espera=0.5):
+    """Bloques de líneas completas recibidas por TCP, hasta que se active `detener` o se corte la conexión."""
+    with socket.create_connection((host, puerto)) as conexion:
+        conexion.settimeout(espera)
+        pendiente = b""
+        while not detener.is_set():
+            try:
+                datos = conexion.recv(1 << 16)
+            except socket.timeout:
+                continue
+            if not datos:
+                break
+            *completas, pendiente = (pendiente + datos).split(b"\n")
+            if completas:
+                yield [linea.decode() for linea in completas]
+
+
+def lineas_archivo(ruta, detener, desde_inicio=False, espera=0.01):
+    """Como `tail -f`: bloques de líneas nuevas que se van agregando a `ruta`."""
+    with open(ruta, encoding="utf-8") as archivo:
+        if not desde_inicio:
+            archivo.seek(0, 2)
+        pendiente = ""
+        while not detener.is_set():
+            trozo = archivo.read()
+            if not trozo:
+                time.sleep(espera)
+                continue
+            *completas, pendiente = (pendiente + trozo).split("\n")
+            if completas:
+                yield completas
+
+
+class MonitorVivo:
+    """Consume una fuente de líneas en un hilo y mantiene buffers circulares de señal cruda y filtrada.
+
+    fuente es una función que recibe un threading.Event y devuelve un
+    iterador de bloques de líneas (lineas_socket, lineas_archivo o cualquier
+    otra con esa forma). Cada bloque se filtra con FiltroCausal apenas llega y
+    se agrega a los buffers; el dashboard solo lee copias de los buffers con
+    instantanea(). La latencia de cada muestra se mide desde su marca de
+    tiempo hasta que queda en el buffer.
+    """
+
+    def __init__(self, fuente, capacidad=60 * int(FRECUENCIA_MUESTREO), orden=ORDEN, corte=CORTE,
+                 fs=FRECUENCIA_MUESTREO):
+        self.fuente = fuente
+        self.capacidad = capacidad
+        self.filtro = FiltroCausal(orden, corte, fs)
+        self.crudo = self.filtrado = self.marcas = None  # Se crean con la primera muestra
+        self.latencias = deque(maxlen=capacidad)  # Segundos, por muestra
+        self.segundos_proceso = deque(maxlen=1000)  # Por bloque: parseo + filtro + buffers
+        self.error = None
+        self._candado = threading.Lock()
+        self._detener = threading.Event()
+        self._hilo = None
+
+    def iniciar(self):
+        self._hilo = threading.Thread(target=self._consumir, daemon=True)
+        self._hilo.start()
+        return self
+
+    def detener(self):
+        self._detener.set()
+        if self._hilo is not None:
+            self._hilo.join(timeout=2)
+
+    @property
+    def activo(self):
+        return self._hilo is not None and self._hilo.is_alive()
+
+    def agregar_lineas(self, lineas):
+        t0 = time.perf_counter()
+        # Una vez creados los buffers, la cantidad de sensores es la de ellos
+        marcas, valores = parsear_lineas(lineas, None if self.crudo is None else self.crudo.datos.shape[1])
+        if not len(marcas):
+            return
+        with self._candado:
+            if self.crudo is None:
+                self.crudo = BufferCircular(self.capacidad, valores.shape[1])
+                self.filtrado = BufferCircular(self.capacidad, valores.shape[1])
+                self.marcas = BufferCircular(self.capacidad, 1)
+            elif valores.shape[1] != self.crudo.datos.shape[1]:
+                return  # Cambió la cantidad de sensores: se ignora el bloque
+            self.crudo.agregar(valores)
+            self.filtrado.agregar(self.filtro.filtrar(valores))
+            self.marcas.agregar(marcas)
+            ahora = time.time()
+            self.latencias.extend(ahora - marcas)
+            self.segundos_proceso.append(time.perf_counter() - t0)
+
+    def _consumir(self):
+        try:
+            for lineas in self.fuente(self._detener):
+                self.agregar_lineas(lineas)
+        except Exception as e:  # Se muestra en el dashboard; el hilo termina
+            self.error = e
+
+    def instantanea(self, n=None):
+        """(marcas, crudo, filtrado) de las últimas n muestras, copiados; None si todavía no llegó nada."""
+        with self._candado:
+            if self.crudo is None:
+                return None
+            return self.marcas.ultimos(n)[:, 0], self.crudo.ultimos(n), self.filtrado.ultimos(n)
+
+    def latencia(self):
+        """Percentiles de la latencia de ingesta (ms) de las muestras recientes."""
+        with self._candado:
+            latencias = np.array(self.latencias)
+            proceso = np.array(self.segundos_proceso)
+        if not len(latencias):
+            return None
+        p50, p95, p99 = (float(v) for v in np.percentile(latencias, [50, 95, 99]) * 1000)
+        return {"p50_ms": p50, "p95_ms": p95, "p99_ms": p99, "max_ms": float(latencias.max()) * 1000,
+                "proceso_ms": float(proceso.mean()) * 1000 if len(proceso) else 0.0}
@@ -2,13 +2,22 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import polars as pl
+import polars.selectors as cs
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from scipy.signal import butter, filtfilt
 from pathlib import Path
+from functools import partial
+import time
 import warnings
 import re
+from sensores import contar_filas, describir, histograma, preparar_parquet, ventana
+from sensores import correlacion as correlacion_streaming
+from sensores import correlacion_movil
+from sensores import CORTE, FRECUENCIA_MUESTREO, ORDEN, filtrar_senales, huella_datos, longitud_minima
+from sensores import MonitorVivo, lineas_archivo, lineas_socket
+from sensores import BINS_CUANTILES, reagrupar, reducir, resumen_caja, serie_reducida
+from sensores import MUESTRAS_VENTANA, SOLAPAMIENTO, densidad_espectral, espectro, espectrograma, potencia_bandas
 warnings.filterwarnings('ignore')
 
 # Configuración de la página de Streamlit
@@ -22,23 +31,21 @@ st.set_page_config(
 st.title("🖐️ Sistema de Prevención del Síndrome del Túnel Carpiano")
 st.markdown("---")
 
-# Función para limpiar y convertir valores con "V"
-def limpiar_valor(valor):
-    if isinstance(valor, str):
-        # Remover "V" y convertir a float
-        valor_limpio = valor.replace('V', '').strip()
-        try:
-            return float(valor_limpio)
-        except:
-            return np.nan
-    return valor
+# Ruta al archivo Excel
+RUTA_EXCEL = Path.home() / "Descargas" / "BD_SENSORES.xlsx"
+
+# Máximo de muestras que se traen a memoria para graficar y filtrar (la ventana visible)
+VENTANA_MAXIMA = 100_000
+
+# Puntos por traza que se mandan al navegador (del orden del ancho del gráfico en píxeles)
+PUNTOS_GRAFICO = 2000
 
 # Función para cargar y procesar los datos reales
 @st.cache_data
-def cargar_y_procesar_datos():
+def cargar_y_procesar_datos(mtime_ns=None):
+    # mtime_ns solo forma parte de la clave de st.cache_data: si el Excel cambia, se vuelve a cargar
     try:
-        # Ruta al archivo Excel
-        ruta_principal = Path.home() / "Descargas" / "BD_SENSORES.xlsx"
+        ruta_principal = RUTA_EXCEL
         
         # Verificar si el archivo existe
         if not ruta_principal.exists():
@@ -46,39 +53,19 @@ def cargar_y_procesar_datos():
             st.info("Por favor, asegúrate de que el archivo BD_SENSORES.xlsx está en la carpeta Descargas")
             return None
         
-        # Cargar datos desde Excel
-        st.info(f"📂 Cargando datos desde: {ruta_principal}")
-        
-        # Leer el archivo Excel - sin encabezados ya que los datos comienzan desde la fila 2
-        df_excel = pd.read_excel(ruta_principal, header=None)
-        
-        # Encontrar la fila donde comienzan los datos numéricos
-        fila_inicio = 0
-        for i in range(min(10, len(df_excel))):  # Revisar primeras 10 filas
-            if any('V' in str(cell) for cell in df_excel.iloc[i] if pd.notna(cell)):
-                fila_inicio = i
-                break
-        
-        # Leer nuevamente saltando las filas de encabezado
-        df_excel = pd.read_excel(ruta_principal, header=None, skiprows=fila_inicio)
-        
-        # Limpiar los datos - convertir valores con "V" a números
-        for col in df_excel.columns:
-            df_excel[col] = df_excel[col].apply(limpiar_valor)
-        
-        # Eliminar filas completamente vacías
-        df_excel = df_excel.dropna(how='all')
-        
-        # Renombrar columnas
-        df_excel.columns = [f'Sensor_{i+1}' for i in range(len(df_excel.columns))]
-        
-        # Convertir a Polars
-        df = pl.from_pandas(df_excel)
+        # Cargar datos: el Excel solo se parsea si cambió desde la última vez, si no se usa el Parquet.
+        # Se devuelve la ruta del Parquet, no los datos: el resto lo consulta en streaming
+        ruta_datos, desde_cache = preparar_parquet(ruta_principal)
+        if desde_cache:
+            st.info(f"⚡ Datos leídos del cache Parquet de: {ruta_principal}")
+        else:
+            st.info(f"📂 Datos cargados desde: {ruta_principal} (cache Parquet actualizado)")
         
-        st.success(f"✅ Datos cargados exitosamente. Forma: {df.shape}")
-        st.info(f"📊 Se detectaron {len(df.columns)} sensores")
+        lf = pl.scan_parquet(ruta_datos)
+        st.success(f"✅ Datos cargados exitosamente. Forma: {(contar_filas(lf), len(lf.collect_schema()))}")
+        st.info(f"📊 Se detectaron {len(lf.collect_schema())} sensores")
         
-        return df
+        return str(ruta_datos)
         
     except Exception as e:
         st.error(f"❌ Error al cargar los datos: {str(e)}")
@@ -86,61 +73,194 @@ def cargar_y_procesar_datos():
         st.error(traceback.format_exc())
         return None
 
+# Estadísticas de la grabación completa, calculadas en streaming una vez por versión de los datos
+@st.cache_data
+def estadisticas_descriptivas(ruta_datos, mtime_ns=None):
+    return describir(pl.scan_parquet(ruta_datos)).to_pandas()
+
+@st.cache_data
+def matriz_correlacion(ruta_datos, mtime_ns=None):
+    return correlacion_streaming(pl.scan_parquet(ruta_datos))
+
+@st.cache_data
+def histograma_sensor(ruta_datos, sensor, bins, mtime_ns=None):
+    return histograma(pl.scan_parquet(ruta_datos), sensor, bins)
+
+# Señal de un sensor en un rango de muestras, reducida a n_puntos (min-max + LTTB) leyendo por bloques
+@st.cache_data(max_entries=64)
+def serie_sensor(ruta_datos, sensor, inicio, fin, n_puntos, mtime_ns=None):
+    return serie_reducida(pl.scan_parquet(ruta_datos), sensor, inicio, fin, n_puntos)
+
+# Correlación de un par de sensores en ventanas deslizantes de la ventana de análisis
+@st.cache_data(max_entries=16)
+def correlacion_movil_par(_df, huella, sensor_x, sensor_y, largo, paso):
+    inicios, correlaciones = correlacion_movil(_df.select(sensor_x, sensor_y).to_numpy(), largo, paso)
+    return inicios, correlaciones[:, 0, 1]
+
+# Espectros de todos los sensores, calculados una vez por versión de los datos y parámetros
+@st.cache_data
+def densidad_grabacion(ruta_datos, fs, muestras_ventana, solapamiento, mtime_ns=None):
+    return densidad_espectral(pl.scan_parquet(ruta_datos), fs, muestras_ventana, solapamiento)
+
+@st.cache_data(max_entries=8)
+def espectro_ventana(_df, huella, fs):
+    return espectro(_df.to_numpy(), fs)
+
+@st.cache_data(max_entries=8)
+def espectrograma_ventana(_df, huella, fs, muestras_ventana, solapamiento):
+    return espectrograma(_df.to_numpy(), fs, muestras_ventana, solapamiento)
+
+# Señales filtradas en memoria de Streamlit: la clave es la huella de los datos y los parámetros del filtro
+# (el DataFrame lleva "_" para que Streamlit no lo hashee; la huella ya lo identifica)
+@st.cache_data(max_entries=8)
+def senales_filtradas(_df, huella, orden, corte, fs):
+    return filtrar_senales(_df, orden, corte, fs)
+
 # Función para aplicar filtros a las señales
-def aplicar_filtros(df):
+def aplicar_filtros(df, orden=ORDEN, corte=CORTE, fs=FRECUENCIA_MUESTREO):
     try:
         # Identificar columnas numéricas
-        columnas_numericas = df.select(pl.col(pl.NUMERIC_DTYPES)).columns
+        columnas_numericas = df.select(cs.numeric()).columns
         
         if not columnas_numericas:
             st.warning("No se encontraron columnas numéricas para filtrar")
             return df
         
-        st.info(f"🔍 Aplicando filtros a {len(columnas_numericas)} señales")
-        
-        # Diseñar filtro pasa bajas (Butterworth)
-        nyquist = 0.5 * 100  # Frecuencia de muestreo asumida de 100 Hz
-        normal_cutoff = 5 / nyquist  # Frecuencia de corte de 5 Hz
-        b, a = butter(4, normal_cutoff, btype='low', analog=False)
-        
-        # Aplicar filtro a cada señal
-        df_filtrado = df.clone()
+        if len(df) < longitud_minima(orden, corte, fs):
+            st.warning(f"No se pudo filtrar: se necesitan al menos {longitud_minima(orden, corte, fs)} muestras")
+            return df
         
-        for col in columnas_numericas:
-            try:
-                señal = df[col].to_numpy()
-                # Reemplazar NaN si existen
-                señal = np.nan_to_num(señal, nan=0.0)
-                señal_filtrada = filtfilt(b, a, señal)
-                df_filtrado = df_filtrado.with_columns(pl.Series(f"{col}_filtrado", señal_filtrada))
-            except Exception as e:
-                st.warning(f"No se pudo filtrar la columna {col}: {str(e)}")
+        st.info(f"🔍 Aplicando filtros a {len(columnas_numericas)} señales")
         
-        return df_filtrado
+        # Butterworth pasa bajas de 5 Hz (100 Hz de muestreo) sobre todos los sensores a la vez
+        return senales_filtradas(df, huella_datos(df), orden, corte, fs)
         
     except Exception as e:
         st.error(f"Error en el filtrado: {str(e)}")
         return df
 
+# Monitor en vivo: un hilo por fuente que sigue recibiendo entre reruns (st.cache_resource)
+@st.cache_resource
+def monitor_en_vivo(tipo, destino, capacidad):
+    if tipo == "socket":
+        host, puerto = destino.rsplit(":", 1)
+        fuente = partial(lineas_socket, host, int(puerto))
+    else:
+        fuente = partial(lineas_archivo, destino)
+    return MonitorVivo(fuente, capacidad).iniciar()
+
+# Función para mostrar los sensores en vivo desde los buffers del monitor
+def mostrar_en_vivo(modo):
+    st.header("📡 Monitoreo en Vivo")
+    
+    if modo == "En vivo (socket)":
+        tipo = "socket"
+        destino = st.sidebar.text_input("Servidor (host:puerto):", "127.0.0.1:9000")
+    else:
+        tipo = "archivo"
+        destino = st.sidebar.text_input("Archivo:", str(Path.home() / "Descargas" / "sensores_vivo.csv"))
+    segundos = st.sidebar.slider("Segundos visibles:", 5, 60, 10)
+    refresco = st.sidebar.slider("Refresco (s):", 0.2, 2.0, 0.5)
+    st.caption("Para probar sin hardware, desde la carpeta Punto 2: "
+               "`python -m sensores.simulador --puerto 9000` o `--archivo <ruta>`")
+    
+    try:
+        monitor = monitor_en_vivo(tipo, destino, 60 * int(FRECUENCIA_MUESTREO))
+    except Exception as e:
+        st.error(f"❌ No se pudo abrir la fuente: {str(e)}")
+        return
+    if not monitor.activo:
+        st.error(f"❌ La fuente se cerró: {monitor.error}")
+        if st.button("Reconectar"):
+            monitor_en_vivo.clear()
+            st.rerun()
+        return
+    
+    # Solo este bloque se vuelve a ejecutar a la frecuencia de refresco
+    @st.fragment(run_every=refresco)
+    def panel():
+        instantanea = monitor.instantanea(int(segundos * FRECUENCIA_MUESTREO))
+        if instantanea is None:
+            st.info("⏳ Esperando muestras...")
+            return
+        marcas, crudo, filtrado = instantanea
+        
+        sensores_vivo = [f"Sensor_{i+1}" for i in range(crudo.shape[1])]
+        sensor = st.selectbox("Selecciona un sensor:", sensores_vivo, key="sensor_vivo")
+        j = sensores_vivo.index(sensor)
+        
+        fig = go.Figure()
+        x_crudo, y_crudo = reducir(marcas - marcas[-1], crudo[:, j], PUNTOS_GRAFICO)
+        x_filtrado, y_filtrado = reducir(marcas - marcas[-1], filtrado[:, j], PUNTOS_GRAFICO)
+        fig.add_trace(go.Scatter(x=x_crudo, y=y_crudo, name=f"{sensor} (Original)",
+                                 line=dict(color='blue', width=1), opacity=0.8))
+        fig.add_trace(go.Scatter(x=x_filtrado, y=y_filtrado, name=f"{sensor} (Filtrado causal)",
+                                 line=dict(color='red', width=1.5)))
+        fig.update_layout(title=f"Señal en vivo: {sensor}", xaxis_title="Segundos (0 = última muestra)",
+                          yaxis_title="Voltaje (V)", height=450)
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Latencia: de la marca de la muestra al buffer, y de la última muestra a este dibujo
+        latencia = monitor.latencia()
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Muestras recibidas", monitor.crudo.total)
+        with col2:
+            st.metric("Latencia ingesta p50 / p95", f"{latencia['p50_ms']:.1f} / {latencia['p95_ms']:.1f} ms")
+        with col3:
+            st.metric("Latencia al dibujar", f"{1000 * (time.time() - marcas[-1]):.0f} ms")
+        with col4:
+            st.metric("Proceso por bloque", f"{latencia['proceso_ms']:.2f} ms")
+    
+    panel()
+
+# Fuente de datos: el Excel de Descargas o sensores en vivo
+modo = st.sidebar.radio("Fuente de datos:", ["Archivo Excel", "En vivo (socket)", "En vivo (archivo)"])
+if modo != "Archivo Excel":
+    mostrar_en_vivo(modo)
+    st.stop()
+
 # Cargar datos
-df = cargar_y_procesar_datos()
+marca_excel = RUTA_EXCEL.stat().st_mtime_ns if RUTA_EXCEL.exists() else None
+ruta_datos = cargar_y_procesar_datos(marca_excel)
 
-if df is not None:
+if ruta_datos is not None:
+    # La grabación completa solo se recorre en streaming; a memoria se trae la ventana visible
+    lf = pl.scan_parquet(ruta_datos)
+    total_muestras = contar_filas(lf)
+    
     # Mostrar información básica sobre los datos
     st.sidebar.header("Información del Dataset")
-    st.sidebar.metric("Muestras", df.shape[0])
-    st.sidebar.metric("Sensores", df.shape[1])
+    st.sidebar.metric("Muestras", total_muestras)
+    st.sidebar.metric("Sensores", len(lf.collect_schema()))
+    
+    # Frecuencia de muestreo de la grabación: la usan el filtro y el análisis de frecuencia
+    fs = st.sidebar.number_input(
+        "Frecuencia de muestreo (Hz):", min_value=2 * CORTE + 1, value=FRECUENCIA_MUESTREO, step=10.0
+    )
+    
+    # Ventana de muestras para graficar y filtrar
+    largo_ventana = min(total_muestras, VENTANA_MAXIMA)
+    inicio_ventana = 0
+    if total_muestras > largo_ventana:
+        inicio_ventana = st.sidebar.slider(
+            "Inicio de la ventana (muestra):", 0, total_muestras - largo_ventana, 0,
+            step=max(1, largo_ventana // 10)
+        )
+        st.sidebar.caption(f"Se grafican las muestras {inicio_ventana} a {inicio_ventana + largo_ventana - 1}")
+    df = ventana(lf, inicio_ventana, largo_ventana)
+    eje_muestras = np.arange(inicio_ventana, inicio_ventana + len(df))
     
     # Mostrar primeras filas
     st.subheader("Vista Previa de los Datos (Valores en Voltios)")
-    st.dataframe(df.head(10), use_container_width=True)
+    st.dataframe(lf.head(10).collect(), use_container_width=True)
     
-    # Mostrar estadísticas básicas
+    # Mostrar estadísticas básicas (de toda la grabación; cuartiles aproximados)
     st.subheader("Estadísticas Descriptivas")
-    st.dataframe(df.describe().to_pandas(), use_container_width=True)
+    st.dataframe(estadisticas_descriptivas(ruta_datos, marca_excel), use_container_width=True)
     
     # Procesar datos
-    df_filtrado = aplicar_filtros(df)
+    df_filtrado = aplicar_filtros(df, fs=fs)
     
     # Sidebar para navegación
     st.sidebar.title("Opciones de Navegación")
@@ -163,26 +283,43 @@ if df is not None:
         # Crear gráfico de la señal
         st.subheader(f"Señal del {sensor_seleccionado}")
         
+        # Rango visible: al acercarlo se vuelve a leer ese tramo con más resolución
+        if (st.button("Ver toda la grabación") or "rango_visible" not in st.session_state
+                or st.session_state["rango_visible"][1] > total_muestras):
+            st.session_state["rango_visible"] = (0, total_muestras)
+        inicio_visible, fin_visible = st.slider("Rango visible (muestras):", 0, total_muestras, key="rango_visible")
+        fin_visible = max(fin_visible, inicio_visible + 2)
+        
         fig = go.Figure()
         
-        # Señal original
+        # Señal original, reducida a PUNTOS_GRAFICO sin perder los picos
+        x_original, y_original = serie_sensor(
+            ruta_datos, sensor_seleccionado, inicio_visible, fin_visible, PUNTOS_GRAFICO, marca_excel
+        )
         fig.add_trace(go.Scatter(
-            x=np.arange(len(df)),
-            y=df[sensor_seleccionado].to_numpy(),
+            x=x_original,
+            y=y_original,
             name=f"{sensor_seleccionado} (Original)",
             line=dict(color='blue', width=1),
             opacity=0.8
         ))
         
-        # Señal filtrada si existe
+        # Señal filtrada si existe (solo está calculada en la ventana de análisis)
         columna_filtrada = f"{sensor_seleccionado}_filtrado"
-        if columna_filtrada in df_filtrado.columns:
+        en_ventana = (eje_muestras >= inicio_visible) & (eje_muestras < fin_visible)
+        if columna_filtrada in df_filtrado.columns and en_ventana.any():
+            x_filtrado, y_filtrado = reducir(
+                eje_muestras[en_ventana], df_filtrado[columna_filtrada].to_numpy()[en_ventana], PUNTOS_GRAFICO
+            )
             fig.add_trace(go.Scatter(
-                x=np.arange(len(df)),
-                y=df_filtrado[columna_filtrada].to_numpy(),
+                x=x_filtrado,
+                y=y_filtrado,
                 name=f"{sensor_seleccionado} (Filtrado)",
                 line=dict(color='red', width=1.5)
             ))
+            if en_ventana.sum() < fin_visible - inicio_visible:
+                st.caption(f"La señal filtrada se muestra en la ventana de análisis "
+                           f"({eje_muestras[0]} a {eje_muestras[-1]})")
         
         fig.update_layout(
             title=f"Señal: {sensor_seleccionado}",
@@ -193,25 +330,40 @@ if df is not None:
         )
         
         st.plotly_chart(fig, use_container_width=True)
+        st.caption(f"{fin_visible - inicio_visible} muestras en el rango; se dibujan {len(x_original)} puntos")
+        
+        # Histograma y caja de toda la grabación, desde un histograma fino contado en streaming
+        bordes_finos, conteos_finos = histograma_sensor(ruta_datos, sensor_seleccionado, BINS_CUANTILES, marca_excel)
         
-        # Histograma
         st.subheader("📊 Distribución de Valores")
-        fig_hist = px.histogram(
-            x=df[sensor_seleccionado].to_numpy(),
+        bordes, conteos = reagrupar(bordes_finos, conteos_finos, BINS_CUANTILES // 64)
+        fig_hist = px.bar(
+            x=(bordes[:-1] + bordes[1:]) / 2,
+            y=conteos,
             title=f"Distribución de {sensor_seleccionado}",
-            nbins=50,
             labels={'x': 'Voltaje (V)', 'y': 'Frecuencia'}
         )
+        fig_hist.update_traces(width=bordes[1] - bordes[0])
         st.plotly_chart(fig_hist, use_container_width=True)
         
-        # Box plot
+        # Box plot (cuartiles y bigotes precalculados: no se mandan las muestras al gráfico)
         st.subheader("📦 Diagrama de Caja")
-        fig_box = px.box(
-            x=df[sensor_seleccionado].to_numpy(),
-            title=f"Distribución de {sensor_seleccionado}",
-            labels={'x': 'Voltaje (V)'}
-        )
-        st.plotly_chart(fig_box, use_container_width=True)
+        caja = resumen_caja(bordes_finos, conteos_finos)
+        if caja is not None:
+            fig_box = go.Figure(go.Box(
+                y=[sensor_seleccionado],
+                q1=[caja["q1"]],
+                median=[caja["mediana"]],
+                q3=[caja["q3"]],
+                lowerfence=[caja["bigote_inferior"]],
+                upperfence=[caja["bigote_superior"]],
+                orientation='h',
+                name=sensor_seleccionado
+            ))
+            fig_box.update_layout(title=f"Distribución de {sensor_seleccionado}", xaxis_title="Voltaje (V)")
+            st.plotly_chart(fig_box, use_container_width=True)
+            st.caption(f"Atípicos (fuera de 1.5 IQR): {caja['atipicos']} · "
+                       f"rango {caja['minimo']:.3f} a {caja['maximo']:.3f} V")
     
     elif pagina == "Análisis Estadístico":
         st.header("📊 Análisis Estadístico")
@@ -220,7 +372,7 @@ if df is not None:
         st.subheader("🔗 Matriz de Correlación")
         
         try:
-            correlacion = df.to_pandas().corr()
+            correlacion = matriz_correlacion(ruta_datos, marca_excel)
             
             fig_corr = px.imshow(
                 correlacion,
@@ -254,12 +406,36 @@ if df is not None:
                 )
                 st.plotly_chart(fig_scatter, use_container_width=True)
                 
-                # Calcular correlación
-                correlacion = np.corrcoef(df[sensor_x].to_numpy(), df[sensor_y].to_numpy())[0, 1]
-                st.metric("Coeficiente de Correlación", f"{correlacion:.3f}")
+                # Coeficiente de toda la grabación, leído de la matriz cacheada (no se recalcula)
+                correlacion = matriz_correlacion(ruta_datos, marca_excel).loc[sensor_x, sensor_y]
+                st.metric("Coeficiente de Correlación", f"{correlacion:.3f}", help="De toda la grabación")
                 
             except Exception as e:
                 st.error(f"Error al crear scatter plot: {str(e)}")
+            
+            # Correlación móvil del par: cómo cambia la relación a lo largo de la ventana de análisis
+            st.subheader("⏱️ Correlación Móvil")
+            segundos_ventana = st.slider("Ventana (s):", 1, 30, 5)
+            largo = int(segundos_ventana * fs)
+            paso = max(1, largo // 4)
+            largo = paso * 4  # Múltiplo del paso
+            inicios, coeficientes = correlacion_movil_par(df, huella_datos(df), sensor_x, sensor_y, largo, paso)
+            if len(inicios):
+                fig_movil = go.Figure(go.Scatter(
+                    x=(inicio_ventana + inicios + largo / 2) / fs,
+                    y=coeficientes,
+                    line=dict(color='purple', width=1.5)
+                ))
+                fig_movil.update_layout(
+                    title=f"Correlación {sensor_x} - {sensor_y} en ventanas de {segundos_ventana} s",
+                    xaxis_title="Tiempo (s)",
+                    yaxis_title="Correlación",
+                    yaxis_range=[-1, 1],
+                    height=400
+                )
+                st.plotly_chart(fig_movil, use_container_width=True)
+            else:
+                st.warning(f"La ventana de análisis tiene menos de {largo} muestras")
     
     elif pagina == "Datos Filtrados":
         st.header("🔧 Datos Filtrados")
@@ -334,46 +510,120 @@ if df is not None:
             df.columns
         )
         
-        señal = df[sensor_analizar].to_numpy()
-        señal = np.nan_to_num(señal, nan=0.0)
-        
-        # Calcular FFT
-        fft_señal = np.fft.fft(señal)
-        frecuencias = np.fft.fftfreq(len(señal), d=0.01)  # Asumiendo 100Hz de muestreo
-        
-        # Tomar solo la mitad positiva del espectro
-        n = len(señal)
-        magnitudes = np.abs(fft_señal[:n//2])
-        frecuencias_positivas = frecuencias[:n//2]
-        
-        # Gráfico de frecuencia
-        fig_freq = go.Figure()
-        fig_freq.add_trace(go.Scatter(
-            x=frecuencias_positivas,
-            y=magnitudes,
-            name="Espectro de Frecuencia",
-            line=dict(color='green', width=1)
-        ))
-        
-        fig_freq.update_layout(
-            title=f"Espectro de Frecuencia - {sensor_analizar}",
-            xaxis_title="Frecuencia (Hz)",
-            yaxis_title="Magnitud",
-            height=500
+        modo_espectral = st.radio(
+            "Tipo de análisis:",
+            ["Espectro (FFT)", "Densidad espectral (Welch)", "Espectrograma (STFT)"],
+            horizontal=True
         )
+        j = df.columns.index(sensor_analizar)
+        
+        # Ventanas para Welch y el espectrograma
+        if modo_espectral != "Espectro (FFT)":
+            col1, col2 = st.columns(2)
+            with col1:
+                muestras_ventana = st.select_slider(
+                    "Muestras por ventana:", [64, 128, 256, 512, 1024, 2048], MUESTRAS_VENTANA
+                )
+            with col2:
+                solapamiento = st.slider("Solapamiento (%):", 0, 90, int(100 * SOLAPAMIENTO), step=5) / 100
+            st.caption(f"Ventanas de {muestras_ventana / fs:.2f} s: resolución de {fs / muestras_ventana:.2f} Hz")
+        
+        if modo_espectral == "Espectro (FFT)":
+            # |rfft| de todos los sensores de la ventana de análisis en una llamada (cacheado)
+            frecuencias, magnitudes = espectro_ventana(df, huella_datos(df), fs)
+            magnitudes = magnitudes[:, j]
+            x_espectro, y_espectro = reducir(frecuencias, magnitudes, PUNTOS_GRAFICO)
+            
+            fig_freq = go.Figure()
+            fig_freq.add_trace(go.Scatter(
+                x=x_espectro,
+                y=y_espectro,
+                name="Espectro de Frecuencia",
+                line=dict(color='green', width=1)
+            ))
+            fig_freq.update_layout(
+                title=f"Espectro de Frecuencia - {sensor_analizar}",
+                xaxis_title="Frecuencia (Hz)",
+                yaxis_title="Magnitud",
+                height=500
+            )
+            st.plotly_chart(fig_freq, use_container_width=True)
+        
+        elif modo_espectral == "Densidad espectral (Welch)":
+            # PSD de Welch de toda la grabación, todos los sensores, recorrida por bloques (cacheada)
+            densidad = densidad_grabacion(ruta_datos, fs, muestras_ventana, solapamiento, marca_excel)
+            if densidad is None:
+                st.warning(f"La grabación tiene menos de {muestras_ventana} muestras")
+                frecuencias, magnitudes = np.zeros(0), np.zeros(0)
+            else:
+                frecuencias, psd = densidad
+                magnitudes = psd[:, j]
+                
+                fig_freq = go.Figure()
+                fig_freq.add_trace(go.Scatter(
+                    x=frecuencias,
+                    y=magnitudes,
+                    name="Densidad espectral",
+                    line=dict(color='green', width=1)
+                ))
+                fig_freq.update_layout(
+                    title=f"Densidad Espectral de Potencia (Welch) - {sensor_analizar}",
+                    xaxis_title="Frecuencia (Hz)",
+                    yaxis_title="PSD (V²/Hz)",
+                    yaxis_type="log",
+                    height=500
+                )
+                st.plotly_chart(fig_freq, use_container_width=True)
+                
+                # Potencia por banda de todos los sensores
+                st.subheader("🎚️ Potencia por Banda (V²)")
+                st.dataframe(
+                    pd.DataFrame(potencia_bandas(frecuencias, psd), index=df.columns),
+                    use_container_width=True
+                )
         
-        st.plotly_chart(fig_freq, use_container_width=True)
+        else:
+            # STFT de todos los sensores de la ventana de análisis (cacheada)
+            frecuencias, tiempos, psd = espectrograma_ventana(df, huella_datos(df), fs, muestras_ventana, solapamiento)
+            tiempos = tiempos + inicio_ventana / fs
+            
+            fig_stft = go.Figure(go.Heatmap(
+                x=tiempos,
+                y=frecuencias,
+                z=10 * np.log10(psd[:, j, :] + 1e-20),
+                colorscale='Viridis',
+                colorbar=dict(title="dB (V²/Hz)")
+            ))
+            fig_stft.update_layout(
+                title=f"Espectrograma - {sensor_analizar}",
+                xaxis_title="Tiempo (s)",
+                yaxis_title="Frecuencia (Hz)",
+                height=500
+            )
+            st.plotly_chart(fig_stft, use_container_width=True)
+            
+            # Potencia por banda en cada ventana
+            st.subheader("🎚️ Potencia por Banda en cada Ventana")
+            bandas_sensor = {banda: potencia[j] for banda, potencia in potencia_bandas(frecuencias, psd).items()}
+            fig_bandas = go.Figure()
+            for banda, potencia in bandas_sensor.items():
+                fig_bandas.add_trace(go.Scatter(x=tiempos, y=potencia, name=banda))
+            fig_bandas.update_layout(xaxis_title="Tiempo (s)", yaxis_title="Potencia (V²)", height=400)
+            st.plotly_chart(fig_bandas, use_container_width=True)
+            
+            magnitudes = psd[:, j, :].mean(axis=1)  # Promedio de las ventanas (Welch de la ventana de análisis)
         
         # Encontrar frecuencia dominante
-        idx_dominante = np.argmax(magnitudes[1:]) + 1  # Ignorar DC (frecuencia 0)
-        freq_dominante = frecuencias_positivas[idx_dominante]
-        magnitud_dominante = magnitudes[idx_dominante]
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Frecuencia Dominante", f"{abs(freq_dominante):.2f} Hz")
-        with col2:
-            st.metric("Magnitud Dominante", f"{magnitud_dominante:.2f}")
+        if len(magnitudes) > 1:
+            idx_dominante = np.argmax(magnitudes[1:]) + 1  # Ignorar DC (frecuencia 0)
+            freq_dominante = frecuencias[idx_dominante]
+            magnitud_dominante = magnitudes[idx_dominante]
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Frecuencia Dominante", f"{abs(freq_dominante):.2f} Hz")
+            with col2:
+                st.metric("Magnitud Dominante", f"{magnitud_dominante:.2g}")
 
 # Información adicional
 st.sidebar.markdown("---")